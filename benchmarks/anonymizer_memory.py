@@ -0,0 +1,52 @@
+"""
+Benchmarks the per-object memory and the attribute access cost of the anonymizers
+and global sensitivities.
+
+Usage: python benchmarks/anonymizer_memory.py [count] [repeat]
+"""
+
+import sys
+import timeit
+import tracemalloc
+from diffpriv_laplace.anonymizer.count import DiffPrivCountAnonymizer
+from diffpriv_laplace.anonymizer.mean import DiffPrivMeanAnonymizer
+from diffpriv_laplace.global_sensitivity.mean import MeanGlobalSensitivity
+
+
+def measure_memory(name, create, count):
+    tracemalloc.start()
+    objects = [create(index) for index in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:>32}: {:.1f} bytes/object".format(name, size / len(objects)))
+
+
+def measure_access(name, statement, repeat, number=1000000):
+    timer = timeit.Timer(statement)
+    seconds = min(timer.repeat(repeat=repeat, number=number))
+    print("{:>32}: {:.1f} ns/access".format(name, seconds / number * 1e9))
+
+
+def main(count=100000, repeat=5):
+    measure_memory(
+        "MeanGlobalSensitivity",
+        lambda index: MeanGlobalSensitivity(0.0, float(index), 100.0),
+        count,
+    )
+    measure_memory(
+        "DiffPrivCountAnonymizer",
+        lambda index: DiffPrivCountAnonymizer(1.0 + index),
+        count,
+    )
+    measure_memory(
+        "DiffPrivMeanAnonymizer",
+        lambda index: DiffPrivMeanAnonymizer(1.0, 0.0, float(index), 100.0),
+        count,
+    )
+    anonymizer = DiffPrivMeanAnonymizer(1.0, 0.0, 1.0, 100.0)
+    measure_access("DiffPrivMeanAnonymizer.scale", lambda: anonymizer.scale, repeat)
+    measure_access("DiffPrivMeanAnonymizer.upper", lambda: anonymizer.upper, repeat)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,48 @@
+"""
+Benchmarks `DiffPrivStatistics.apply_kind_on_data_slice` against calculating the
+statistics of each data slice separately.
+
+Usage: python benchmarks/apply_kind.py [slices] [size] [repeat]
+"""
+
+import sys
+import timeit
+import numpy as np
+from diffpriv_laplace import DiffPrivStatistics, DiffPrivStatisticKind
+
+
+def calculate_each(data, kinds, epsilon):
+    results = [
+        DiffPrivStatistics.calculate_data_slice_statistics(
+            data[index : index + 1], kind, epsilon
+        )
+        for index, kind in enumerate(kinds)
+    ]
+    return results
+
+
+def main(slices=20000, size=32, repeat=3):
+    data = np.random.default_rng(31337).normal(0.0, 1.0, (slices, size))
+    choices = [
+        DiffPrivStatisticKind.count,
+        DiffPrivStatisticKind.sum | DiffPrivStatisticKind.mean,
+        DiffPrivStatisticKind.all,
+    ]
+    kinds = [choices[index % len(choices)] for index in range(slices)]
+    epsilon = 1.0
+    benchmarks = [
+        ("per data slice", lambda: calculate_each(data, kinds, epsilon)),
+        (
+            "apply_kind_on_data_slice",
+            lambda: DiffPrivStatistics.apply_kind_on_data_slice(
+                data, kinds, epsilon, axis=1
+            ),
+        ),
+    ]
+    for name, benchmark in benchmarks:
+        seconds = min(timeit.repeat(benchmark, repeat=repeat, number=1))
+        print("{:>26}: {:.2f} us/slice".format(name, seconds / slices * 1e6))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
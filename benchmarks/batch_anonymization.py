@@ -0,0 +1,65 @@
+"""
+Benchmarks anonymizing many heterogeneous values one `anonymize_*_with_budget`
+call at a time against a single `anonymize_batch_with_budget` call.
+
+Usage: python benchmarks/batch_anonymization.py [count] [repeat]
+"""
+
+import sys
+import timeit
+import numpy as np
+from diffpriv_laplace import DiffPrivLaplaceMechanism
+from diffpriv_laplace.laplace_mechanism import DiffPrivAnonymizerType
+
+
+def anonymize_each(values, kinds, epsilons, lower, upper, n):
+    anonymized = np.zeros(len(values))
+    for index, kind in enumerate(kinds):
+        if kind == DiffPrivAnonymizerType.count:
+            anonymized[index] = DiffPrivLaplaceMechanism.anonymize_count_with_budget(
+                values[index], epsilons[index]
+            )
+        elif kind == DiffPrivAnonymizerType.sum:
+            anonymized[index] = DiffPrivLaplaceMechanism.anonymize_sum_with_budget(
+                values[index], lower[index], upper[index], epsilons[index]
+            )
+        else:
+            anonymized[index] = DiffPrivLaplaceMechanism.anonymize_mean_with_budget(
+                values[index], lower[index], upper[index], n[index], epsilons[index]
+            )
+
+    return anonymized
+
+
+def main(count=10000, repeat=5):
+    rng = np.random.default_rng(31337)
+    choices = [
+        DiffPrivAnonymizerType.count,
+        DiffPrivAnonymizerType.sum,
+        DiffPrivAnonymizerType.mean,
+    ]
+    kinds = [choices[code] for code in rng.integers(0, len(choices), count)]
+    values = rng.uniform(0.0, 100.0, count)
+    epsilons = rng.uniform(0.1, 1.0, count)
+    lower = rng.uniform(-10.0, 0.0, count)
+    upper = rng.uniform(1.0, 10.0, count)
+    n = rng.integers(1, 1000, count).astype(float)
+    benchmarks = [
+        (
+            "anonymize_*_with_budget",
+            lambda: anonymize_each(values, kinds, epsilons, lower, upper, n),
+        ),
+        (
+            "anonymize_batch_with_budget",
+            lambda: DiffPrivLaplaceMechanism.anonymize_batch_with_budget(
+                values, kinds, epsilons, lower=lower, upper=upper, n=n
+            ),
+        ),
+    ]
+    for name, benchmark in benchmarks:
+        seconds = min(timeit.repeat(benchmark, repeat=repeat, number=1))
+        print("{:>28}: {:.3f} us/value".format(name, seconds / count * 1e6))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,91 @@
+"""
+Benchmarks a batch of sequential and parallel composition queries, each with
+its own kinds, axis, condition and privacy budget, performed one by one with
+`DiffPrivSequentialStatisticsQuery`, `DiffPrivParallelStatisticsQuery` and
+`DiffPrivStatistics.count` against `DiffPrivBatchStatisticsQuery`, which scans
+the data once per axis and draws all the noise at once.
+
+Usage: python benchmarks/batch_queries.py [rows] [columns] [queries] [repeat]
+"""
+
+import sys
+import timeit
+import numpy as np
+from diffpriv_laplace import (
+    DiffPrivParallelStatisticsQuery,
+    DiffPrivSequentialStatisticsQuery,
+    DiffPrivStatistics,
+    DiffPrivStatisticKind,
+)
+from diffpriv_laplace.query.batch_statistics import DiffPrivBatchStatisticsQuery
+
+
+def build_queries(columns, size):
+    kinds = [
+        DiffPrivStatisticKind.mean,
+        DiffPrivStatisticKind.mean | DiffPrivStatisticKind.variance,
+        DiffPrivStatisticKind.count | DiffPrivStatisticKind.sum,
+        DiffPrivStatisticKind.min | DiffPrivStatisticKind.max,
+    ]
+    queries = []
+    for index in range(size):
+        epsilon = 0.1 * (1 + index % 5)
+        if index % 3 == 0:
+            query = {
+                "kinds": [kinds[index % len(kinds)]] * columns,
+                "epsilon": epsilon,
+                "composition": "parallel",
+            }
+        elif index % 3 == 1:
+            query = {"kinds": [kinds[index % len(kinds)]] * columns, "epsilon": epsilon}
+        else:
+            query = {
+                "kinds": [DiffPrivStatisticKind.count] * columns,
+                "epsilon": epsilon,
+                "condition": "x > {}".format(0.1 * (index % 10)),
+            }
+
+        queries.append(query)
+
+    return queries
+
+
+def individual(data, queries):
+    results = []
+    for query in queries:
+        if "condition" in query:
+            result = DiffPrivStatistics.count(
+                data, query["epsilon"], condition=query["condition"], axis=0
+            )
+        elif query.get("composition") == "parallel":
+            result = DiffPrivParallelStatisticsQuery.query(
+                data, query["kinds"], query["epsilon"]
+            )
+        else:
+            result = DiffPrivSequentialStatisticsQuery.query(
+                data, query["kinds"], query["epsilon"]
+            )
+
+        results.append(result)
+
+    return results
+
+
+def main(rows=200000, columns=10, size=120, repeat=3):
+    data = np.random.default_rng(31337).normal(0.0, 1.0, (rows, columns))
+    queries = build_queries(columns, size)
+    benchmarks = [
+        ("individual", lambda: individual(data, queries)),
+        ("batch", lambda: DiffPrivBatchStatisticsQuery.query(data, queries)),
+    ]
+    for name, benchmark in benchmarks:
+        seconds = min(timeit.repeat(benchmark, repeat=repeat, number=1))
+        print(
+            "{:>10}: {:.1f} ms ({:.1f} queries/s)".format(
+                name, seconds * 1e3, size / seconds
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
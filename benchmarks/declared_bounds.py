@@ -0,0 +1,34 @@
+"""
+Benchmarks the sum, mean and variance with bounds derived from min and max scans
+of the data against caller declared bounds, to which the data is clipped in
+chunks.
+
+Usage: python benchmarks/declared_bounds.py [size] [repeat]
+"""
+
+import sys
+import timeit
+import numpy as np
+from diffpriv_laplace import DiffPrivStatistics
+
+
+def main(size=100000000, repeat=3):
+    epsilon = 1.0
+    data = np.random.default_rng(31337).uniform(0.0, 100.0, size)
+    statistics = [
+        ("sum", DiffPrivStatistics.sum),
+        ("mean", DiffPrivStatistics.mean),
+        ("variance", DiffPrivStatistics.variance),
+    ]
+    for name, statistic in statistics:
+        for label, bounds in [("scanned", {}), ("declared", dict(lower=0, upper=100))]:
+            seconds = min(
+                timeit.repeat(
+                    lambda: statistic(data, epsilon, **bounds), repeat=repeat, number=1
+                )
+            )
+            print("{:>8} {:>8}: {:.1f} ms".format(name, label, seconds * 1e3))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,48 @@
+"""
+Benchmarks the time and the peak traced memory of calculating the median of a
+memory-mapped `.npy` file with `np.median`, which copies the data in memory,
+against the exact out-of-core histogram refinement of `DiffPrivStatistics`.
+
+Usage: python benchmarks/exact_median.py [size] [repeat]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+import numpy as np
+from diffpriv_laplace import DiffPrivStatistics
+from diffpriv_laplace.storage import DiffPrivStorage
+
+
+def measure(name, benchmark, repeat):
+    tracemalloc.start()
+    benchmark()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    seconds = min(timeit.repeat(benchmark, repeat=repeat, number=1))
+    print(
+        "{:>10}: {:.1f} ms, {:.1f} MiB peak".format(
+            name, seconds * 1e3, peak / 1024 / 1024
+        )
+    )
+
+
+def main(size=20000000, repeat=3):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "data.npy")
+        np.save(path, np.random.default_rng(31337).normal(0.0, 1.0, size))
+        mapped = DiffPrivStorage.load(path)
+        report = {}
+        measure("np.median", lambda: np.median(mapped), repeat)
+        measure(
+            "exact",
+            lambda: DiffPrivStatistics.calculate_median(mapped, report=report),
+            repeat,
+        )
+        print("{:>10}: {passes} passes, {memory} bytes".format("report", **report))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
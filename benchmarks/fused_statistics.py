@@ -0,0 +1,47 @@
+"""
+Benchmarks calculating all the statistics of a data slice with one scan per
+statistic against the single pass `DiffPrivAggregate` used by
+`DiffPrivStatistics.calculate_data_slice_statistics`.
+
+Usage: python benchmarks/fused_statistics.py [size] [repeat]
+"""
+
+import sys
+import timeit
+import numpy as np
+from diffpriv_laplace import DiffPrivStatistics, DiffPrivStatisticKind
+
+
+def calculate_separately(data, epsilon):
+    stats = {
+        DiffPrivStatisticKind.count: DiffPrivStatistics.count(data, epsilon),
+        DiffPrivStatisticKind.min: DiffPrivStatistics.min(data, epsilon),
+        DiffPrivStatisticKind.max: DiffPrivStatistics.max(data, epsilon),
+        DiffPrivStatisticKind.proportion: DiffPrivStatistics.proportion(data, epsilon),
+        DiffPrivStatisticKind.sum: DiffPrivStatistics.sum(data, epsilon),
+        DiffPrivStatisticKind.mean: DiffPrivStatistics.mean(data, epsilon),
+        DiffPrivStatisticKind.variance: DiffPrivStatistics.variance(data, epsilon),
+    }
+    return stats
+
+
+def main(size=10000000, repeat=5):
+    data = np.random.default_rng(31337).normal(0.0, 1.0, size)
+    epsilon = 1.0
+    kind = DiffPrivStatisticKind.all & ~DiffPrivStatisticKind.median
+    benchmarks = [
+        ("separate scans", lambda: calculate_separately(data, epsilon)),
+        (
+            "single pass aggregate",
+            lambda: DiffPrivStatistics.calculate_data_slice_statistics(
+                data, kind, epsilon
+            ),
+        ),
+    ]
+    for name, benchmark in benchmarks:
+        seconds = min(timeit.repeat(benchmark, repeat=repeat, number=1))
+        print("{:>24}: {:.1f} ms".format(name, seconds * 1e3))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
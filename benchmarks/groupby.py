@@ -0,0 +1,47 @@
+"""
+Benchmarks the count, sum and mean of many groups of keys through
+`DiffPrivStatistics.apply_kind_on_data_slice`, which requires equally sized groups
+reshaped into two dimensional data, against `DiffPrivStatistics.groupby`, which
+factorizes the keys and draws the noise of all the groups at once.
+
+Usage: python benchmarks/groupby.py [groups] [size] [repeat]
+"""
+
+import sys
+import timeit
+import numpy as np
+from diffpriv_laplace import DiffPrivStatistics, DiffPrivStatisticKind
+
+
+def main(groups=200000, size=20, repeat=3):
+    kind = (
+        DiffPrivStatisticKind.count
+        | DiffPrivStatisticKind.sum
+        | DiffPrivStatisticKind.mean
+    )
+    epsilon = 1.0
+    rng = np.random.default_rng(31337)
+    keys = rng.permutation(np.repeat(np.arange(groups), size))
+    values = rng.normal(0.0, 1.0, keys.size)
+    benchmarks = [
+        (
+            "apply_kind",
+            lambda: DiffPrivStatistics.apply_kind_on_data_slice(
+                values[np.argsort(keys, kind="stable")].reshape(groups, size),
+                [kind] * groups,
+                epsilon,
+                axis=1,
+            ),
+        ),
+        (
+            "groupby",
+            lambda: DiffPrivStatistics.groupby(values, keys, kind, epsilon),
+        ),
+    ]
+    for name, benchmark in benchmarks:
+        seconds = min(timeit.repeat(benchmark, repeat=repeat, number=1))
+        print("{:>10}: {:.1f} ms".format(name, seconds * 1e3))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,56 @@
+"""
+Benchmarks a dashboard of 40 statistics over the same data computed eagerly with
+`DiffPrivStatistics`, which scans the data once per statistic, against a
+`DiffPrivLazyStatistics` graph, which computes them with a single fused scan and
+a single batched noise draw.
+
+Usage: python benchmarks/lazy_dashboard.py [rows] [columns] [repeat]
+"""
+
+import sys
+import timeit
+import numpy as np
+from diffpriv_laplace import DiffPrivStatistics
+from diffpriv_laplace.lazy import DiffPrivLazyStatistics
+
+
+def dashboard(statistics, data, epsilon):
+    results = [
+        statistics.count(data, epsilon, axis=0),
+        statistics.min(data, epsilon, axis=0),
+        statistics.max(data, epsilon, axis=0),
+        statistics.sum(data, epsilon, axis=0),
+        statistics.mean(data, epsilon, axis=0),
+        statistics.variance(data, epsilon, axis=0),
+    ]
+    for threshold in np.linspace(-2.0, 2.0, 17):
+        condition = "x > {}".format(threshold)
+        results.append(statistics.count(data, epsilon, condition=condition, axis=0))
+        results.append(
+            statistics.proportion(data, epsilon, condition=condition, axis=0)
+        )
+
+    return results
+
+
+def compute_lazy(data, epsilon):
+    graph = DiffPrivLazyStatistics()
+    dashboard(graph, data, epsilon)
+    results = graph.compute()
+    return results
+
+
+def main(rows=1000000, columns=10, repeat=3):
+    epsilon = 1.0
+    data = np.random.default_rng(31337).normal(0.0, 1.0, (rows, columns))
+    benchmarks = [
+        ("eager", lambda: dashboard(DiffPrivStatistics, data, epsilon)),
+        ("lazy", lambda: compute_lazy(data, epsilon)),
+    ]
+    for name, benchmark in benchmarks:
+        seconds = min(timeit.repeat(benchmark, repeat=repeat, number=1))
+        print("{:>6}: {:.1f} ms".format(name, seconds * 1e3))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,52 @@
+"""
+Benchmarks the time and the peak traced memory of calculating statistics over a
+`.npy` file which is loaded in memory against passing its path so that it is
+memory-mapped and aggregated in chunks.
+
+Usage: python benchmarks/mapped_statistics.py [size] [repeat]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+import numpy as np
+from diffpriv_laplace import DiffPrivStatistics, DiffPrivStatisticKind
+
+
+def measure(name, benchmark, repeat):
+    tracemalloc.start()
+    benchmark()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    seconds = min(timeit.repeat(benchmark, repeat=repeat, number=1))
+    print(
+        "{:>10}: {:.1f} ms, {:.1f} MiB peak".format(
+            name, seconds * 1e3, peak / 1024 / 1024
+        )
+    )
+
+
+def main(size=20000000, repeat=3):
+    kind = DiffPrivStatisticKind.all & ~DiffPrivStatisticKind.median
+    epsilon = 1.0
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "data.npy")
+        np.save(path, np.random.default_rng(31337).normal(0.0, 1.0, size))
+        measure(
+            "np.load",
+            lambda: DiffPrivStatistics.apply_kind_on_data_slice(
+                np.load(path), kind, epsilon
+            ),
+            repeat,
+        )
+        measure(
+            "path",
+            lambda: DiffPrivStatistics.apply_kind_on_data_slice(path, kind, epsilon),
+            repeat,
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,54 @@
+"""
+Benchmarks the time and the peak traced memory of
+`DiffPrivStatistics.apply_kind_on_data_slice` on a region x day x metric cube
+which is first transposed and reshaped into two dimensional data slices against
+passing the cube with the day `axis`, which reduces the strided data slices in
+place.
+
+Usage: python benchmarks/n_dimensional.py [regions] [days] [metrics] [repeat]
+"""
+
+import sys
+import timeit
+import tracemalloc
+import numpy as np
+from diffpriv_laplace import DiffPrivStatistics, DiffPrivStatisticKind
+
+
+def measure(name, benchmark, repeat):
+    tracemalloc.start()
+    benchmark()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    seconds = min(timeit.repeat(benchmark, repeat=repeat, number=1))
+    print(
+        "{:>8}: {:.1f} ms, {:.1f} MiB peak".format(
+            name, seconds * 1e3, peak / 1024 / 1024
+        )
+    )
+
+
+def main(regions=200, days=365, metrics=1000, repeat=3):
+    epsilon = 1.0
+    data = np.random.default_rng(31337).normal(0.0, 1.0, (regions, days, metrics))
+    kind = DiffPrivStatisticKind.sum | DiffPrivStatisticKind.mean
+    # The statistics of each (region, metric) pair over the days
+    kinds = [kind] * (regions * metrics)
+    measure(
+        "reshaped",
+        lambda: DiffPrivStatistics.apply_kind_on_data_slice(
+            np.transpose(data, (0, 2, 1)).reshape((-1, days)), kinds, epsilon, axis=1
+        ),
+        repeat,
+    )
+    measure(
+        "cube",
+        lambda: DiffPrivStatistics.apply_kind_on_data_slice(
+            data, kinds, epsilon, axis=1
+        ),
+        repeat,
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
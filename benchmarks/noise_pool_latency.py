@@ -0,0 +1,41 @@
+"""
+Benchmarks the p50/p99 latency of anonymizing a single count with noise served
+from the noise pool against noise drawn from the `PCG64` random generator and the
+legacy global random state.
+
+Usage: python benchmarks/noise_pool_latency.py [calls] [capacity]
+"""
+
+import sys
+import time
+import numpy as np
+from diffpriv_laplace import DiffPrivLaplaceMechanism
+from diffpriv_laplace.sampler.generator import DiffPrivGenerator
+from diffpriv_laplace.sampler.noise_pool import DiffPrivNoisePool
+
+
+def benchmark(name, rng, calls):
+    anonymizer = DiffPrivLaplaceMechanism(1.0, rng=rng)
+    latencies = np.empty(calls)
+    for index in range(calls):
+        start = time.perf_counter()
+        anonymizer.anonymize_count(87.0)
+        latencies[index] = time.perf_counter() - start
+
+    p50, p99 = np.percentile(latencies, [50.0, 99.0]) * 1e6
+    print("{:>8}: p50 {:.2f}us, p99 {:.2f}us".format(name, p50, p99))
+    return p50, p99
+
+
+def main(calls=100000, capacity=65536):
+    pcg64 = benchmark("PCG64", DiffPrivGenerator.create(), calls)
+    legacy = benchmark("legacy", None, calls)
+    with DiffPrivNoisePool(capacity=capacity) as pool:
+        pooled = benchmark("pool", pool, calls)
+
+    print("pool/PCG64 = p50 {:.2f}x, p99 {:.2f}x".format(*np.divide(pooled, pcg64)))
+    print("pool/legacy = p50 {:.2f}x, p99 {:.2f}x".format(*np.divide(pooled, legacy)))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,62 @@
+"""
+Benchmarks the time and the peak traced memory of counting the values within a
+range with a condition function, which builds boolean masks of the size of the
+data, against a compiled predicate expression, which is evaluated and counted in
+chunks of the in-memory data or of the memory-mapped `.npy` file.
+
+Usage: python benchmarks/predicate_count.py [size] [repeat]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+import numpy as np
+from diffpriv_laplace import DiffPrivStatistics
+
+
+def measure(name, benchmark, repeat):
+    tracemalloc.start()
+    benchmark()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    seconds = min(timeit.repeat(benchmark, repeat=repeat, number=1))
+    print(
+        "{:>10}: {:.1f} ms, {:.1f} MiB peak".format(
+            name, seconds * 1e3, peak / 1024 / 1024
+        )
+    )
+
+
+def main(size=100000000, repeat=3):
+    epsilon = 1.0
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "data.npy")
+        np.save(path, np.random.default_rng(31337).normal(0.0, 1.0, size))
+        data = np.load(path)
+        measure(
+            "function",
+            lambda: DiffPrivStatistics.count(
+                data, epsilon, condition=lambda x: (x >= -1.0) & (x <= 1.0)
+            ),
+            repeat,
+        )
+        measure(
+            "predicate",
+            lambda: DiffPrivStatistics.count(
+                data, epsilon, condition="x between -1 and 1"
+            ),
+            repeat,
+        )
+        measure(
+            "path",
+            lambda: DiffPrivStatistics.count(
+                path, epsilon, condition="x between -1 and 1"
+            ),
+            repeat,
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
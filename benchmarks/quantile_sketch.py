@@ -0,0 +1,41 @@
+"""
+Benchmarks the exact `DiffPrivStatistics.median` against the approximate
+`DiffPrivStatistics.quantile` sketch, reporting the sketch and noise timings and
+the rank error of the approximation.
+
+Usage: python benchmarks/quantile_sketch.py [size] [repeat]
+"""
+
+import sys
+import timeit
+import numpy as np
+from diffpriv_laplace import DiffPrivStatistics
+
+
+def main(size=10000000, repeat=3):
+    data = np.random.default_rng(31337).normal(0.0, 1.0, size)
+    epsilon = 1.0
+    seconds = min(
+        timeit.repeat(
+            lambda: DiffPrivStatistics.median(data, epsilon), repeat=repeat, number=1
+        )
+    )
+    print("{:>16}: {:.1f} ms".format("median", seconds * 1e3))
+    for error in [0.01, 0.001]:
+        timings = {}
+        value = DiffPrivStatistics.quantile(
+            data, 0.5, 1e9, error=error, timings=timings
+        )
+        rank = np.mean(data < value)
+        print(
+            "{:>16}: {:.1f} ms sketch, {:.3f} ms noise, rank {:.5f}".format(
+                "quantile {}".format(error),
+                timings["sketch"] * 1e3,
+                timings["noise"] * 1e3,
+                rank,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,55 @@
+"""
+Benchmarks a sequential composition query of the count, proportion, sum, mean
+and variance of every data slice computed kind by kind with
+`DiffPrivStatistics.apply_kind_on_data_slice` against the
+`DiffPrivQueryPlan` of `DiffPrivSequentialStatisticsQuery`, which computes the
+shared exact aggregates once.
+
+Usage: python benchmarks/query_plan.py [rows] [columns] [repeat]
+"""
+
+import sys
+import timeit
+import numpy as np
+from diffpriv_laplace import (
+    DiffPrivSequentialStatisticsQuery,
+    DiffPrivStatistics,
+    DiffPrivStatisticKind,
+)
+
+
+def main(rows=1000000, columns=20, repeat=3):
+    epsilon = 1.0
+    data = np.random.default_rng(31337).normal(0.0, 1.0, (rows, columns))
+    kind = (
+        DiffPrivStatisticKind.count
+        | DiffPrivStatisticKind.proportion
+        | DiffPrivStatisticKind.sum
+        | DiffPrivStatisticKind.mean
+        | DiffPrivStatisticKind.variance
+    )
+    kinds = [kind] * columns
+    query_epsilon = DiffPrivSequentialStatisticsQuery.calculate_query_epsilon(
+        kinds, epsilon
+    )
+    plan = DiffPrivSequentialStatisticsQuery.plan(data, kinds, epsilon)
+    print(plan)
+    benchmarks = [
+        (
+            "per kind",
+            lambda: DiffPrivStatistics.apply_kind_on_data_slice(
+                data, kinds, query_epsilon
+            ),
+        ),
+        (
+            "planned",
+            lambda: DiffPrivSequentialStatisticsQuery.query(data, kinds, epsilon),
+        ),
+    ]
+    for name, benchmark in benchmarks:
+        seconds = min(timeit.repeat(benchmark, repeat=repeat, number=1))
+        print("{:>8}: {:.1f} ms".format(name, seconds * 1e3))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,33 @@
+"""
+Benchmarks the throughput of the secure Laplace sampler against the `PCG64`
+random generator.
+
+Usage: python benchmarks/secure_sampler.py [size] [repeat]
+"""
+
+import sys
+import timeit
+import numpy as np
+from diffpriv_laplace.sampler.generator import DiffPrivGenerator
+from diffpriv_laplace.sampler.secure import DiffPrivSecureSampler
+
+
+def benchmark(name, rng, size, repeat):
+    timer = timeit.Timer(lambda: rng.laplace(scale=1.0, size=size))
+    seconds = min(timer.repeat(repeat=repeat, number=1))
+    print(
+        "{:>8}: {:.4f}s ({:.1f}M samples/s)".format(name, seconds, size / seconds / 1e6)
+    )
+    return seconds
+
+
+def main(size=10000000, repeat=5):
+    pcg64 = benchmark("PCG64", DiffPrivGenerator.create(), size, repeat)
+    secure = benchmark("secure", DiffPrivSecureSampler(), size, repeat)
+    legacy = benchmark("legacy", np.random, size, repeat)
+    print("secure/PCG64 = {:.2f}x".format(secure / pcg64))
+    print("legacy/PCG64 = {:.2f}x".format(legacy / pcg64))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,52 @@
+"""
+Benchmarks the time and the peak traced memory of the count and sum of
+pre-aggregated (value, weight) pairs expanded back into raw rows against the
+weighted statistics which work on the pairs directly.
+
+Usage: python benchmarks/weighted_statistics.py [size] [weight] [repeat]
+"""
+
+import sys
+import timeit
+import tracemalloc
+import numpy as np
+from diffpriv_laplace import DiffPrivStatistics
+
+
+def expanded(data, weights, epsilon):
+    rows = np.repeat(data, weights)
+    count = DiffPrivStatistics.count(rows, epsilon)
+    value = DiffPrivStatistics.sum(rows, epsilon)
+    return count, value
+
+
+def weighted(data, weights, epsilon):
+    count = DiffPrivStatistics.weighted_count(data, weights, epsilon)
+    value = DiffPrivStatistics.weighted_sum(data, weights, epsilon)
+    return count, value
+
+
+def measure(name, benchmark, repeat):
+    tracemalloc.start()
+    benchmark()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    seconds = min(timeit.repeat(benchmark, repeat=repeat, number=1))
+    print(
+        "{:>10}: {:.1f} ms, {:.1f} MiB peak".format(
+            name, seconds * 1e3, peak / 1024 / 1024
+        )
+    )
+
+
+def main(size=1000000, weight=64, repeat=3):
+    epsilon = 1.0
+    rng = np.random.default_rng(31337)
+    data = rng.uniform(0.0, 100.0, size)
+    weights = rng.integers(1, 2 * weight, size)
+    measure("expanded", lambda: expanded(data, weights, epsilon), repeat)
+    measure("weighted", lambda: weighted(data, weights, epsilon), repeat)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,364 @@
+import numpy as np
+
+
+class DiffPrivAggregate(object):
+    """
+    Mergeable aggregate of the count, min, max, sum, mean and variance of a data
+    slice which is computed in a single chunked pass. Each chunk is reduced while
+    it is cache resident and the partial results are combined using the parallel
+    variance algorithm of Chan et al., so that aggregates of different chunks or
+    data slices can be merged.
+    """
+
+    chunk_size = 65536
+
+    def __init__(self, dtype=None):
+        """
+        Initialize an empty aggregate.
+
+        Parameters
+        ----------
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the sum, mean
+            and variance. When `None`, double precision is used.
+
+        """
+        super().__init__()
+        self.__dtype = None if dtype is None else np.dtype(dtype)
+        self.__n = 0
+        self.__count = 0
+        self.__min = None
+        self.__max = None
+        self.__sum = self.__cast(0.0)
+        self.__mean = self.__cast(0.0)
+        self.__m2 = self.__cast(0.0)
+
+    def __cast(self, value):
+        dtype = np.float64 if self.__dtype is None else self.__dtype
+        value = np.asarray(value, dtype=dtype)
+        if value.ndim == 0:
+            value = value[()]
+
+        return value
+
+    @classmethod
+    def from_data(cls, data, chunk_size=None, dtype=None):
+        """
+        Aggregates the data in chunks.
+
+        Parameters
+        ----------
+        data : list|ndarray
+            The data to aggregate, which is flattened.
+        [chunk_size] : int
+            The amount of elements reduced at once. When `None`, the class level
+            `chunk_size` is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the sum, mean
+            and variance. When `None`, double precision is used.
+
+        Returns
+        -------
+        `DiffPrivAggregate`
+            The aggregate of the data.
+
+        """
+        aggregate = cls.from_chunks([data], chunk_size=chunk_size, dtype=dtype)
+        return aggregate
+
+    @classmethod
+    def from_chunks(cls, chunks, axis=None, chunk_size=None, dtype=None):
+        """
+        Aggregates an iterable of data chunks (e.g. a generator reading a file)
+        so that only one chunk needs to be held in memory at a time.
+
+        When `axis` is `None`, the chunks are flattened and the chunks larger than
+        `chunk_size` are further split while being reduced. Otherwise, the chunks
+        are consecutive blocks along the first axis of the same data and the
+        aggregate holds a value per element of the reduction along `axis`.
+
+        Parameters
+        ----------
+        chunks : iterable
+            The data chunks (lists or ndarrays) to aggregate.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to aggregate the data.
+        [chunk_size] : int
+            The amount of elements reduced at once when `axis` is `None`. When
+            `None`, the class level `chunk_size` is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the sum, mean
+            and variance. When `None`, double precision is used.
+
+        Returns
+        -------
+        `DiffPrivAggregate`
+            The aggregate of the data chunks.
+
+        """
+        chunk_size = cls.chunk_size if chunk_size is None else chunk_size
+        aggregate = cls(dtype=dtype)
+        aggregates = []
+        for chunk in chunks:
+            if axis is None:
+                values = np.ravel(chunk)
+                for start in range(0, values.size, chunk_size):
+                    aggregate.update(values[start : start + chunk_size])
+            else:
+                chunk = np.asarray(chunk)
+                axes = tuple(int(index) % chunk.ndim for index in np.atleast_1d(axis))
+                if 0 in axes:
+                    aggregate.update(chunk, axis=axes)
+                else:
+                    aggregates.append(cls(dtype=dtype).update(chunk, axis=axes))
+
+        if aggregates:
+            aggregate = cls.concatenate(aggregates)
+
+        return aggregate
+
+    @classmethod
+    def concatenate(cls, aggregates):
+        """
+        Concatenates the aggregates of consecutive blocks of data which were
+        reduced along axes other than the first one.
+
+        Parameters
+        ----------
+        aggregates : list
+            The non-empty aggregates of the blocks, which share the same `n` and
+            precision.
+
+        Returns
+        -------
+        `DiffPrivAggregate`
+            The concatenated aggregate.
+
+        """
+        aggregate = cls(dtype=aggregates[0].dtype)
+        aggregate.__n = aggregates[0].n
+        aggregate.__count = np.concatenate([other.count for other in aggregates])
+        aggregate.__min = np.concatenate([other.min for other in aggregates])
+        aggregate.__max = np.concatenate([other.max for other in aggregates])
+        aggregate.__sum = np.concatenate([other.sum for other in aggregates])
+        aggregate.__mean = np.concatenate([other.mean for other in aggregates])
+        aggregate.__m2 = np.concatenate([other.m2 for other in aggregates])
+        return aggregate
+
+    def update(self, chunk, axis=None):
+        """
+        Adds a chunk of values to the aggregate.
+
+        Parameters
+        ----------
+        chunk : list|ndarray
+            The values.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to aggregate the values. When `None`,
+            the values are flattened.
+
+        Returns
+        -------
+        `DiffPrivAggregate`
+            The updated aggregate.
+
+        """
+        if axis is None:
+            chunk = np.ravel(chunk)
+            n = chunk.size
+            if n == 0:
+                return self
+
+            chunk_sum = self.__cast(np.sum(chunk, dtype=self.__dtype))
+            chunk_mean = self.__cast(chunk_sum / n)
+            deviation = np.subtract(chunk, chunk_mean, dtype=self.__dtype)
+            chunk_m2 = self.__cast(np.dot(deviation, deviation))
+        else:
+            chunk = np.asarray(chunk)
+            n = int(np.prod(np.take(chunk.shape, axis)))
+            if n == 0:
+                return self
+
+            chunk_sum = self.__cast(np.sum(chunk, axis=axis, dtype=self.__dtype))
+            chunk_mean = self.__cast(chunk_sum / n)
+            deviation = np.subtract(
+                chunk, np.expand_dims(chunk_mean, axis), dtype=self.__dtype
+            )
+            chunk_m2 = self.__cast(
+                np.sum(np.square(deviation, out=deviation), axis=axis)
+            )
+
+        self.__combine(
+            n,
+            np.count_nonzero(chunk, axis=axis),
+            np.min(chunk, axis=axis),
+            np.max(chunk, axis=axis),
+            chunk_sum,
+            chunk_mean,
+            chunk_m2,
+        )
+        return self
+
+    def merge(self, other):
+        """
+        Merges another aggregate into this aggregate.
+
+        Parameters
+        ----------
+        other : `DiffPrivAggregate`
+            The aggregate to merge.
+
+        Returns
+        -------
+        `DiffPrivAggregate`
+            The merged aggregate.
+
+        """
+        if other.n > 0:
+            self.__combine(
+                other.n,
+                other.count,
+                other.min,
+                other.max,
+                self.__cast(other.sum),
+                self.__cast(other.mean),
+                self.__cast(other.m2),
+            )
+
+        return self
+
+    def __combine(self, n, count, lower, upper, total, mean, m2):
+        if self.__n == 0:
+            self.__min = lower
+            self.__max = upper
+        else:
+            self.__min = np.minimum(self.__min, lower)
+            self.__max = np.maximum(self.__max, upper)
+
+        combined_n = self.__n + n
+        delta = mean - self.__mean
+        self.__mean = self.__cast(self.__mean + delta * n / combined_n)
+        self.__m2 = self.__cast(
+            self.__m2 + m2 + delta * delta * self.__n * n / combined_n
+        )
+        self.__sum = self.__cast(self.__sum + total)
+        self.__count = self.__count + count
+        self.__n = combined_n
+
+    @property
+    def dtype(self):
+        """
+        The floating point precision of the sum, mean and variance.
+
+        Returns
+        -------
+        None|dtype
+            The precision or `None` for double precision.
+
+        """
+        return self.__dtype
+
+    @property
+    def n(self):
+        """
+        The total number of aggregated values.
+
+        Returns
+        -------
+        int
+            The number of values.
+
+        """
+        return self.__n
+
+    @property
+    def count(self):
+        """
+        The number of non-zero or non-False aggregated values.
+
+        Returns
+        -------
+        int|ndarray
+            The number(s) of non-zero values.
+
+        """
+        return self.__count
+
+    @property
+    def min(self):
+        """
+        The min aggregated value.
+
+        Returns
+        -------
+        None|float|ndarray
+            The min value(s) or `None` when empty.
+
+        """
+        return self.__min
+
+    @property
+    def max(self):
+        """
+        The max aggregated value.
+
+        Returns
+        -------
+        None|float|ndarray
+            The max value(s) or `None` when empty.
+
+        """
+        return self.__max
+
+    @property
+    def sum(self):
+        """
+        The sum of the aggregated values.
+
+        Returns
+        -------
+        float|ndarray
+            The sum value(s).
+
+        """
+        return self.__sum
+
+    @property
+    def mean(self):
+        """
+        The mean of the aggregated values.
+
+        Returns
+        -------
+        float|ndarray
+            The mean value(s).
+
+        """
+        return self.__mean
+
+    @property
+    def m2(self):
+        """
+        The sum of squared deviations from the mean of the aggregated values.
+
+        Returns
+        -------
+        float|ndarray
+            The sum(s) of squared deviations.
+
+        """
+        return self.__m2
+
+    @property
+    def variance(self):
+        """
+        The (population) variance of the aggregated values.
+
+        Returns
+        -------
+        float|ndarray
+            The variance value(s).
+
+        """
+        value = self.__cast(self.__m2 / self.__n) if self.__n else self.__cast(0.0)
+        return value
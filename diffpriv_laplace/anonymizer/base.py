@@ -1,22 +1,74 @@
 import numpy as np
+from diffpriv_laplace.sampler.generator import DiffPrivGenerator
+from diffpriv_laplace.exceptions import DiffPrivInvalidOutput
 
 
 class DiffPrivAnonymizer(object):
+    __slots__ = ("__gs", "__dtype", "__epsilon", "__scale", "__rng")
+
+    chunk_size = 1048576
+    out_kind = np.floating
+
     @classmethod
-    def calculate_scale(cls, gs, epsilon):
-        scale = gs.value / epsilon
+    def calculate_scale(cls, gs, epsilon, dtype=None):
+        if dtype is None:
+            scale = gs.value / epsilon
+        else:
+            scale = np.divide(gs.value, epsilon, dtype=dtype)
+
         return scale
 
-    def __init__(self, gs, epsilon):
+    def __init__(self, gs, epsilon, rng=None, dtype=None):
         super().__init__()
         self.__gs = gs
-        self.__epsilon = float(epsilon)
-        self.__scale = self.calculate_scale(self.__gs, self.__epsilon)
+        self.__dtype = None if dtype is None else np.dtype(dtype)
+        if np.ndim(epsilon) > 0:
+            self.__epsilon = np.asarray(epsilon, dtype=float)
+        else:
+            self.__epsilon = float(epsilon)
+
+        self.__scale = self.calculate_scale(self.__gs, self.__epsilon, self.__dtype)
+        self.__rng = np.random if rng is None else DiffPrivGenerator.create(rng)
 
-    def apply(self, values, size=None):
-        samples = np.random.laplace(loc=values, scale=self.__scale, size=size)
+    def sample(self, loc=0.0, scale=None, size=None):
+        scale = self.__scale if scale is None else scale
+        samples = DiffPrivGenerator.laplace(
+            self.__rng, loc=loc, scale=scale, size=size, dtype=self.__dtype
+        )
         return samples
 
+    def apply(self, values, size=None, out=None):
+        if out is None:
+            samples = self.sample(values, size=size)
+            return samples
+
+        if not np.issubdtype(out.dtype, self.out_kind):
+            raise DiffPrivInvalidOutput("Invalid output type! [{}]".format(out.dtype))
+
+        if values is not out:
+            np.copyto(out, values)
+
+        if np.ndim(out) == 0:
+            out += self.sample()
+            return out
+
+        scale = self.__scale
+        if np.ndim(scale) > 0:
+            scale = np.broadcast_to(scale, out.shape)
+
+        row_size = max(1, int(np.prod(out.shape[1:])))
+        rows = max(1, self.chunk_size // row_size)
+        for start in range(0, out.shape[0], rows):
+            chunk = out[start : start + rows]
+            if np.ndim(scale) > 0:
+                chunk_scale = scale[start : start + rows]
+            else:
+                chunk_scale = scale
+
+            chunk += self.sample(scale=chunk_scale, size=chunk.shape)
+
+        return out
+
     @property
     def scale(self):
         return self.__scale
@@ -28,3 +80,11 @@ class DiffPrivAnonymizer(object):
     @property
     def epsilon(self):
         return self.__epsilon
+
+    @property
+    def rng(self):
+        return self.__rng
+
+    @property
+    def dtype(self):
+        return self.__dtype
@@ -0,0 +1,28 @@
+from diffpriv_laplace.global_sensitivity.batch import BatchGlobalSensitivity
+from diffpriv_laplace.anonymizer.base import DiffPrivAnonymizer
+
+
+class DiffPrivBatchAnonymizer(DiffPrivAnonymizer):
+    __slots__ = ()
+
+    def __init__(
+        self, epsilon, kinds, lower=None, upper=None, n=None, rng=None, dtype=None
+    ):
+        gs = BatchGlobalSensitivity(kinds, lower=lower, upper=upper, n=n, dtype=dtype)
+        super().__init__(gs, epsilon, rng=rng, dtype=dtype)
+
+    @property
+    def codes(self):
+        return self.global_sensitivity.codes
+
+    @property
+    def lower(self):
+        return self.global_sensitivity.lower
+
+    @property
+    def upper(self):
+        return self.global_sensitivity.upper
+
+    @property
+    def n(self):
+        return self.global_sensitivity.n
@@ -0,0 +1,117 @@
+import threading
+from collections import OrderedDict
+
+
+class DiffPrivAnonymizerCache(object):
+    """
+    Bounded least recently used cache of anonymizers.
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        [maxsize] : int
+            The maximum amount of cached anonymizers. When zero, nothing is cached.
+
+        """
+        super().__init__()
+        self.__maxsize = int(maxsize)
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @property
+    def maxsize(self):
+        """
+        The maximum amount of cached anonymizers.
+
+        Returns
+        -------
+        int
+            The maximum amount of cached anonymizers.
+
+        """
+        return self.__maxsize
+
+    @property
+    def hits(self):
+        """
+        The amount of lookups which found a cached anonymizer.
+
+        Returns
+        -------
+        int
+            The amount of cache hits.
+
+        """
+        return self.__hits
+
+    @property
+    def misses(self):
+        """
+        The amount of lookups which created an anonymizer.
+
+        Returns
+        -------
+        int
+            The amount of cache misses.
+
+        """
+        return self.__misses
+
+    def get(self, key, create):
+        """
+        Retrieves the cached anonymizer for a key or creates and caches it.
+
+        Parameters
+        ----------
+        key : tuple
+            The key identifying the anonymizer. Anonymizers with unhashable keys
+            are created without being cached.
+        create : function
+            The function invoked without parameters to create the anonymizer.
+
+        Returns
+        -------
+        `DiffPrivAnonymizer`
+            The anonymizer.
+
+        """
+        try:
+            hash(key)
+        except TypeError:
+            key = None
+
+        with self.__lock:
+            if key is not None and key in self.__entries:
+                self.__hits = self.__hits + 1
+                self.__entries.move_to_end(key)
+                return self.__entries[key]
+
+            self.__misses = self.__misses + 1
+
+        anonymizer = create()
+        if key is not None and self.__maxsize > 0:
+            with self.__lock:
+                self.__entries[key] = anonymizer
+                self.__entries.move_to_end(key)
+                while len(self.__entries) > self.__maxsize:
+                    self.__entries.popitem(last=False)
+
+        return anonymizer
+
+    def clear(self):
+        """
+        Removes all the cached anonymizers and resets the hit and miss counters.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
@@ -2,5 +2,7 @@ from diffpriv_laplace.anonymizer.count import DiffPrivCountAnonymizer
 
 
 class DiffPrivCountingAnonymizer(DiffPrivCountAnonymizer):
-    def __init__(self, epsilon):
-        super().__init__(epsilon)
+    __slots__ = ()
+
+    def __init__(self, epsilon, rng=None, dtype=None):
+        super().__init__(epsilon, rng=rng, dtype=dtype)
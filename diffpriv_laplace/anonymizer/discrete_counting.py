@@ -0,0 +1,32 @@
+import numpy as np
+from diffpriv_laplace.anonymizer.counting import DiffPrivCountingAnonymizer
+from diffpriv_laplace.sampler.generator import DiffPrivGenerator
+from diffpriv_laplace.exceptions import DiffPrivUnsupportedSampler
+
+
+class DiffPrivDiscreteCountingAnonymizer(DiffPrivCountingAnonymizer):
+    __slots__ = ("__dtype",)
+
+    out_kind = np.number
+
+    def __init__(self, epsilon, rng=None, dtype=np.int64):
+        super().__init__(epsilon, rng=rng)
+        if not hasattr(self.rng, "geometric"):
+            raise DiffPrivUnsupportedSampler(
+                "The sampler does not draw geometric samples! [{}]".format(
+                    type(self.rng).__name__
+                )
+            )
+
+        self.__dtype = np.dtype(dtype)
+
+    def sample(self, loc=0, scale=None, size=None):
+        scale = self.scale if scale is None else scale
+        samples = DiffPrivGenerator.discrete_laplace(
+            self.rng, loc=loc, scale=scale, size=size, dtype=self.__dtype
+        )
+        return samples
+
+    @property
+    def dtype(self):
+        return self.__dtype
@@ -3,6 +3,8 @@ from diffpriv_laplace.anonymizer.base import DiffPrivAnonymizer
 
 
 class DiffPrivMaxAnonymizer(DiffPrivAnonymizer):
-    def __init__(self, epsilon):
+    __slots__ = ()
+
+    def __init__(self, epsilon, rng=None, dtype=None):
         gs = MaxGlobalSensitivity()
-        super().__init__(gs, epsilon)
+        super().__init__(gs, epsilon, rng=rng, dtype=dtype)
@@ -3,9 +3,11 @@ from diffpriv_laplace.anonymizer.base import DiffPrivAnonymizer
 
 
 class DiffPrivMeanAnonymizer(DiffPrivAnonymizer):
-    def __init__(self, epsilon, lower, upper, n):
-        gs = MeanGlobalSensitivity(lower, upper, n)
-        super().__init__(gs, epsilon)
+    __slots__ = ()
+
+    def __init__(self, epsilon, lower, upper, n, rng=None, dtype=None):
+        gs = MeanGlobalSensitivity(lower, upper, n, dtype=dtype)
+        super().__init__(gs, epsilon, rng=rng, dtype=dtype)
 
     @property
     def lower(self):
@@ -3,9 +3,11 @@ from diffpriv_laplace.anonymizer.base import DiffPrivAnonymizer
 
 
 class DiffPrivProportionAnonymizer(DiffPrivAnonymizer):
-    def __init__(self, epsilon, n):
-        gs = ProportionGlobalSensitivity(n)
-        super().__init__(gs, epsilon)
+    __slots__ = ()
+
+    def __init__(self, epsilon, n, rng=None, dtype=None):
+        gs = ProportionGlobalSensitivity(n, dtype=dtype)
+        super().__init__(gs, epsilon, rng=rng, dtype=dtype)
 
     @property
     def n(self):
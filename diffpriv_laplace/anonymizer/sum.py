@@ -3,9 +3,11 @@ from diffpriv_laplace.anonymizer.base import DiffPrivAnonymizer
 
 
 class DiffPrivSumAnonymizer(DiffPrivAnonymizer):
-    def __init__(self, epsilon, lower, upper):
-        gs = SumGlobalSensitivity(lower, upper)
-        super().__init__(gs, epsilon)
+    __slots__ = ()
+
+    def __init__(self, epsilon, lower, upper, rng=None, dtype=None):
+        gs = SumGlobalSensitivity(lower, upper, dtype=dtype)
+        super().__init__(gs, epsilon, rng=rng, dtype=dtype)
 
     @property
     def lower(self):
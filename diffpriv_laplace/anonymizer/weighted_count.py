@@ -0,0 +1,16 @@
+from diffpriv_laplace.global_sensitivity.weighted_count import (
+    WeightedCountGlobalSensitivity,
+)
+from diffpriv_laplace.anonymizer.base import DiffPrivAnonymizer
+
+
+class DiffPrivWeightedCountAnonymizer(DiffPrivAnonymizer):
+    __slots__ = ()
+
+    def __init__(self, epsilon, max_weight=1.0, rng=None, dtype=None):
+        gs = WeightedCountGlobalSensitivity(max_weight, dtype=dtype)
+        super().__init__(gs, epsilon, rng=rng, dtype=dtype)
+
+    @property
+    def max_weight(self):
+        return self.global_sensitivity.max_weight
@@ -0,0 +1,24 @@
+from diffpriv_laplace.global_sensitivity.weighted_sum import (
+    WeightedSumGlobalSensitivity,
+)
+from diffpriv_laplace.anonymizer.base import DiffPrivAnonymizer
+
+
+class DiffPrivWeightedSumAnonymizer(DiffPrivAnonymizer):
+    __slots__ = ()
+
+    def __init__(self, epsilon, lower, upper, max_weight=1.0, rng=None, dtype=None):
+        gs = WeightedSumGlobalSensitivity(lower, upper, max_weight, dtype=dtype)
+        super().__init__(gs, epsilon, rng=rng, dtype=dtype)
+
+    @property
+    def lower(self):
+        return self.global_sensitivity.lower
+
+    @property
+    def upper(self):
+        return self.global_sensitivity.upper
+
+    @property
+    def max_weight(self):
+        return self.global_sensitivity.max_weight
@@ -8,3 +8,27 @@ class DiffPrivSizeMismatch(Exception):
 
 class DiffPrivInvalidDecomposition(Exception):
     pass
+
+
+class DiffPrivMissingParameter(Exception):
+    pass
+
+
+class DiffPrivInvalidPredicate(Exception):
+    pass
+
+
+class DiffPrivInvalidQuery(Exception):
+    pass
+
+
+class DiffPrivUnsupportedSampler(Exception):
+    pass
+
+
+class DiffPrivInvalidKind(Exception):
+    pass
+
+
+class DiffPrivInvalidOutput(Exception):
+    pass
@@ -1,12 +1,23 @@
+import numpy as np
+
+
 class GlobalSensitivity(object):
+    __slots__ = ("__value",)
+
+    @classmethod
+    def cast(cls, value, dtype=None):
+        if np.ndim(value) > 0:
+            return np.asarray(value, dtype=float if dtype is None else dtype)
+
+        if dtype is None:
+            return float(value)
+
+        return np.dtype(dtype).type(value)
+
     def __init__(self, value):
         super().__init__()
-        self.value = value
+        self.__value = value
 
     @property
     def value(self):
         return self.__value
-
-    @value.setter
-    def value(self, value):
-        self.__value = value
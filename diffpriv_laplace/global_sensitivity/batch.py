@@ -0,0 +1,105 @@
+import numpy as np
+from diffpriv_laplace.exceptions import DiffPrivInvalidKind, DiffPrivMissingParameter
+from diffpriv_laplace.global_sensitivity.base import GlobalSensitivity
+from diffpriv_laplace.global_sensitivity.proportion import ProportionGlobalSensitivity
+from diffpriv_laplace.global_sensitivity.sum import SumGlobalSensitivity
+from diffpriv_laplace.global_sensitivity.mean import MeanGlobalSensitivity
+from diffpriv_laplace.global_sensitivity.variance import VarianceGlobalSensitivity
+
+
+class BatchGlobalSensitivity(GlobalSensitivity):
+    __slots__ = ("__codes", "__lower", "__upper", "__n")
+
+    kinds = (
+        "count",
+        "counting",
+        "min",
+        "max",
+        "median",
+        "proportion",
+        "sum",
+        "mean",
+        "variance",
+    )
+    parameters = {
+        "proportion": (ProportionGlobalSensitivity, ("n",)),
+        "sum": (SumGlobalSensitivity, ("lower", "upper")),
+        "mean": (MeanGlobalSensitivity, ("lower", "upper", "n")),
+        "variance": (VarianceGlobalSensitivity, ("lower", "upper", "n")),
+    }
+
+    @classmethod
+    def validate(cls, codes):
+        invalid = (codes < 0) | (codes >= len(cls.kinds))
+        if np.any(invalid):
+            raise DiffPrivInvalidKind(
+                "Invalid kind code(s)! {}".format(np.unique(codes[invalid]).tolist())
+            )
+
+    @classmethod
+    def encode(cls, kinds):
+        if isinstance(kinds, np.ndarray) and np.issubdtype(kinds.dtype, np.integer):
+            cls.validate(kinds)
+            return kinds
+
+        lookup = {kind: code for code, kind in enumerate(cls.kinds)}
+        names = [str(getattr(kind, "value", kind)) for kind in kinds]
+        unknown = sorted(set(names).difference(lookup))
+        if unknown:
+            raise DiffPrivInvalidKind("Invalid kind(s)! {}".format(unknown))
+
+        codes = np.array([lookup[name] for name in names], dtype=np.intp)
+        return codes
+
+    @classmethod
+    def calculate_value(cls, codes, lower=None, upper=None, n=None, dtype=None):
+        dtype = np.float64 if dtype is None else dtype
+        codes = np.asarray(codes)
+        cls.validate(codes)
+        params = {"lower": lower, "upper": upper, "n": n}
+        value = np.ones(np.shape(codes), dtype=dtype)
+        for kind, (sensitivity, names) in cls.parameters.items():
+            mask = codes == cls.kinds.index(kind)
+            if not np.any(mask):
+                continue
+
+            args = []
+            for name in names:
+                param = params[name]
+                if param is None:
+                    raise DiffPrivMissingParameter(
+                        "Missing `{}` parameter for the {} kind".format(name, kind)
+                    )
+
+                args.append(np.broadcast_to(param, value.shape)[mask])
+
+            value[mask] = sensitivity.calculate_value(*args)
+
+        return value
+
+    def __init__(self, kinds, lower=None, upper=None, n=None, dtype=None):
+        self.__codes = self.encode(kinds)
+        self.__lower = None if lower is None else self.cast(lower, dtype)
+        self.__upper = None if upper is None else self.cast(upper, dtype)
+        self.__n = None if n is None else self.cast(n, dtype)
+        super().__init__(
+            self.calculate_value(
+                self.__codes, self.__lower, self.__upper, self.__n, dtype=dtype
+            )
+        )
+
+    @property
+    def codes(self):
+        return self.__codes
+
+    @property
+    def lower(self):
+        return self.__lower
+
+    @property
+    def upper(self):
+        return self.__upper
+
+    @property
+    def n(self):
+        return self.__n
@@ -2,5 +2,7 @@ from diffpriv_laplace.global_sensitivity.base import GlobalSensitivity
 
 
 class CountGlobalSensitivity(GlobalSensitivity):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(1.0)
@@ -2,5 +2,7 @@ from diffpriv_laplace.global_sensitivity.count import CountGlobalSensitivity
 
 
 class CountingGlobalSensitivity(CountGlobalSensitivity):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
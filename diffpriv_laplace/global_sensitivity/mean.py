@@ -2,15 +2,17 @@ from diffpriv_laplace.global_sensitivity.base import GlobalSensitivity
 
 
 class MeanGlobalSensitivity(GlobalSensitivity):
+    __slots__ = ("__lower", "__upper", "__n")
+
     @classmethod
     def calculate_value(cls, lower, upper, n):
         value = (upper - lower) / n
         return value
 
-    def __init__(self, lower, upper, n):
-        self.__lower = float(lower)
-        self.__upper = float(upper)
-        self.__n = float(n)
+    def __init__(self, lower, upper, n, dtype=None):
+        self.__lower = self.cast(lower, dtype)
+        self.__upper = self.cast(upper, dtype)
+        self.__n = self.cast(n, dtype)
         super().__init__(self.calculate_value(self.__lower, self.__upper, self.__n))
 
     @property
@@ -2,13 +2,15 @@ from diffpriv_laplace.global_sensitivity.base import GlobalSensitivity
 
 
 class ProportionGlobalSensitivity(GlobalSensitivity):
+    __slots__ = ("__n",)
+
     @classmethod
     def calculate_value(cls, n):
         value = 1.0 / n
         return value
 
-    def __init__(self, n):
-        self.__n = float(n)
+    def __init__(self, n, dtype=None):
+        self.__n = self.cast(n, dtype)
         super().__init__(self.calculate_value(self.__n))
 
     @property
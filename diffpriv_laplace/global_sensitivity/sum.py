@@ -3,14 +3,16 @@ from diffpriv_laplace.global_sensitivity.base import GlobalSensitivity
 
 
 class SumGlobalSensitivity(GlobalSensitivity):
+    __slots__ = ("__lower", "__upper")
+
     @classmethod
     def calculate_value(cls, lower, upper):
-        value = np.max([np.abs(upper), np.abs(lower)])
+        value = np.maximum(np.abs(upper), np.abs(lower))
         return value
 
-    def __init__(self, lower, upper):
-        self.__lower = float(lower)
-        self.__upper = float(upper)
+    def __init__(self, lower, upper, dtype=None):
+        self.__lower = self.cast(lower, dtype)
+        self.__upper = self.cast(upper, dtype)
         super().__init__(self.calculate_value(self.__lower, self.__upper))
 
     @property
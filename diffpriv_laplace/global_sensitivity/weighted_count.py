@@ -0,0 +1,18 @@
+from diffpriv_laplace.global_sensitivity.base import GlobalSensitivity
+
+
+class WeightedCountGlobalSensitivity(GlobalSensitivity):
+    __slots__ = ("__max_weight",)
+
+    @classmethod
+    def calculate_value(cls, max_weight):
+        value = max_weight
+        return value
+
+    def __init__(self, max_weight=1.0, dtype=None):
+        self.__max_weight = self.cast(max_weight, dtype)
+        super().__init__(self.calculate_value(self.__max_weight))
+
+    @property
+    def max_weight(self):
+        return self.__max_weight
@@ -0,0 +1,31 @@
+import numpy as np
+from diffpriv_laplace.global_sensitivity.base import GlobalSensitivity
+
+
+class WeightedSumGlobalSensitivity(GlobalSensitivity):
+    __slots__ = ("__lower", "__upper", "__max_weight")
+
+    @classmethod
+    def calculate_value(cls, lower, upper, max_weight):
+        value = max_weight * np.maximum(np.abs(upper), np.abs(lower))
+        return value
+
+    def __init__(self, lower, upper, max_weight=1.0, dtype=None):
+        self.__lower = self.cast(lower, dtype)
+        self.__upper = self.cast(upper, dtype)
+        self.__max_weight = self.cast(max_weight, dtype)
+        super().__init__(
+            self.calculate_value(self.__lower, self.__upper, self.__max_weight)
+        )
+
+    @property
+    def lower(self):
+        return self.__lower
+
+    @property
+    def upper(self):
+        return self.__upper
+
+    @property
+    def max_weight(self):
+        return self.__max_weight
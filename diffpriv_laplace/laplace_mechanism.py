@@ -1,6 +1,12 @@
+import numpy as np
 from enum import Enum
+from diffpriv_laplace.anonymizer.batch import DiffPrivBatchAnonymizer
+from diffpriv_laplace.anonymizer.cache import DiffPrivAnonymizerCache
 from diffpriv_laplace.anonymizer.count import DiffPrivCountAnonymizer
 from diffpriv_laplace.anonymizer.counting import DiffPrivCountingAnonymizer
+from diffpriv_laplace.anonymizer.discrete_counting import (
+    DiffPrivDiscreteCountingAnonymizer,
+)
 from diffpriv_laplace.anonymizer.min import DiffPrivMinAnonymizer
 from diffpriv_laplace.anonymizer.max import DiffPrivMaxAnonymizer
 from diffpriv_laplace.anonymizer.median import DiffPrivMedianAnonymizer
@@ -8,11 +14,15 @@ from diffpriv_laplace.anonymizer.proportion import DiffPrivProportionAnonymizer
 from diffpriv_laplace.anonymizer.sum import DiffPrivSumAnonymizer
 from diffpriv_laplace.anonymizer.mean import DiffPrivMeanAnonymizer
 from diffpriv_laplace.anonymizer.variance import DiffPrivVarianceAnonymizer
+from diffpriv_laplace.anonymizer.weighted_count import DiffPrivWeightedCountAnonymizer
+from diffpriv_laplace.anonymizer.weighted_sum import DiffPrivWeightedSumAnonymizer
+from diffpriv_laplace.sampler.generator import DiffPrivGenerator
 
 
 class DiffPrivAnonymizerType(Enum):
     count = "count"
     counting = "counting"
+    discrete_counting = "discrete_counting"
     min = "min"
     max = "max"
     median = "median"
@@ -20,6 +30,8 @@ class DiffPrivAnonymizerType(Enum):
     sum = "sum"
     mean = "mean"
     variance = "variance"
+    weighted_count = "weighted_count"
+    weighted_sum = "weighted_sum"
 
 
 class DiffPrivLaplaceMechanism(object):
@@ -27,8 +39,54 @@ class DiffPrivLaplaceMechanism(object):
     Differential privacy Laplace mechanism.
     """
 
+    anonymizer_cache = DiffPrivAnonymizerCache()
+
     @classmethod
-    def create_count_anonymizer(cls, epsilon):
+    def get_anonymizer(cls, kind, epsilon, *params, rng=None, dtype=None, cache=True):
+        """
+        Retrieves an anonymizer from the anonymizer cache or creates it. Anonymizers
+        are only cached when `rng` is `None`, so that the cache does not hold
+        references to random generators, and when `cache` is set.
+
+        Parameters
+        ----------
+        kind : DiffPrivAnonymizerType
+            The kind of anonymizer.
+        epsilon : float
+            The privacy budget.
+        [params] : float
+            The remaining anonymizer creation parameters (e.g. `lower`, `upper`
+            and `n`).
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The precision used to compute the scale and draw the noise.
+        [cache] : bool
+            Indicates whether or not the anonymizer may be cached, which should not
+            be the case when its parameters are derived from the data (e.g. the min
+            and max values of the data).
+
+        Returns
+        -------
+        `DiffPrivAnonymizer`
+            The anonymizer.
+
+        """
+        create = getattr(cls, "create_{}_anonymizer".format(kind.value))
+        if rng is not None or not cache:
+            anonymizer = create(epsilon, *params, rng=rng, dtype=dtype)
+            return anonymizer
+
+        dtype = None if dtype is None else np.dtype(dtype)
+        key = (kind, epsilon, params, dtype)
+        anonymizer = cls.anonymizer_cache.get(
+            key, lambda: create(epsilon, *params, dtype=dtype)
+        )
+        return anonymizer
+
+    @classmethod
+    def create_count_anonymizer(cls, epsilon, rng=None, dtype=None):
         """
         Creates a count anonymizer instance.
 
@@ -36,6 +94,12 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         epsilon : float
             The privacy budget.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         Returns
         -------
@@ -43,11 +107,11 @@ class DiffPrivLaplaceMechanism(object):
             A count anonymizer with the provided privacy budget.
 
         """
-        anonymizer = DiffPrivCountAnonymizer(epsilon)
+        anonymizer = DiffPrivCountAnonymizer(epsilon, rng=rng, dtype=dtype)
         return anonymizer
 
     @classmethod
-    def create_counting_anonymizer(cls, epsilon):
+    def create_counting_anonymizer(cls, epsilon, rng=None, dtype=None):
         """
         Creates a counting anonymizer instance.
 
@@ -55,6 +119,12 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         epsilon : float
             The privacy budget.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         Returns
         -------
@@ -62,11 +132,42 @@ class DiffPrivLaplaceMechanism(object):
             A counting anonymizer with the provided privacy budget.
 
         """
-        anonymizer = DiffPrivCountingAnonymizer(epsilon)
+        anonymizer = DiffPrivCountingAnonymizer(epsilon, rng=rng, dtype=dtype)
         return anonymizer
 
     @classmethod
-    def create_min_anonymizer(cls, epsilon):
+    def create_discrete_counting_anonymizer(cls, epsilon, rng=None, dtype=np.int64):
+        """
+        Creates a discrete (two-sided geometric) counting anonymizer instance.
+
+        Parameters
+        ----------
+        epsilon : float
+            The privacy budget.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : dtype
+            The integer type (e.g. `int64` or `int32`) of the anonymized counts.
+
+        Returns
+        -------
+        `DiffPrivDiscreteCountingAnonymizer`
+            A discrete counting anonymizer with the provided privacy budget.
+
+        Raises
+        ------
+        DiffPrivUnsupportedSampler
+            The exception is raised when `rng` does not provide a `geometric`
+            method (e.g. `DiffPrivNoisePool`, `DiffPrivSecureSampler` or
+            `DiffPrivParallelSampler`).
+
+        """
+        anonymizer = DiffPrivDiscreteCountingAnonymizer(epsilon, rng=rng, dtype=dtype)
+        return anonymizer
+
+    @classmethod
+    def create_min_anonymizer(cls, epsilon, rng=None, dtype=None):
         """
         Creates a min anonymizer instance.
 
@@ -74,6 +175,12 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         epsilon : float
             The privacy budget.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         Returns
         -------
@@ -81,11 +188,11 @@ class DiffPrivLaplaceMechanism(object):
             A min anonymizer with the provided privacy budget.
 
         """
-        anonymizer = DiffPrivMinAnonymizer(epsilon)
+        anonymizer = DiffPrivMinAnonymizer(epsilon, rng=rng, dtype=dtype)
         return anonymizer
 
     @classmethod
-    def create_max_anonymizer(cls, epsilon):
+    def create_max_anonymizer(cls, epsilon, rng=None, dtype=None):
         """
         Creates a max anonymizer instance.
 
@@ -93,6 +200,12 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         epsilon : float
             The privacy budget.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         Returns
         -------
@@ -100,11 +213,11 @@ class DiffPrivLaplaceMechanism(object):
             A max anonymizer with the provided privacy budget.
 
         """
-        anonymizer = DiffPrivMaxAnonymizer(epsilon)
+        anonymizer = DiffPrivMaxAnonymizer(epsilon, rng=rng, dtype=dtype)
         return anonymizer
 
     @classmethod
-    def create_median_anonymizer(cls, epsilon):
+    def create_median_anonymizer(cls, epsilon, rng=None, dtype=None):
         """
         Creates a median anonymizer instance.
 
@@ -112,6 +225,12 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         epsilon : float
             The privacy budget.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         Returns
         -------
@@ -119,11 +238,11 @@ class DiffPrivLaplaceMechanism(object):
             A median anonymizer with the provided privacy budget.
 
         """
-        anonymizer = DiffPrivMedianAnonymizer(epsilon)
+        anonymizer = DiffPrivMedianAnonymizer(epsilon, rng=rng, dtype=dtype)
         return anonymizer
 
     @classmethod
-    def create_proportion_anonymizer(cls, epsilon, n):
+    def create_proportion_anonymizer(cls, epsilon, n, rng=None, dtype=None):
         """
         Creates a proportion anonymizer instance.
 
@@ -131,8 +250,14 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         epsilon : float
             The privacy budget.
-        n : float
-            The total number of observations.
+        n : float|ndarray
+            The total number(s) of observations.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         Returns
         -------
@@ -140,11 +265,11 @@ class DiffPrivLaplaceMechanism(object):
             A proportion anonymizer with the provided privacy budget.
 
         """
-        anonymizer = DiffPrivProportionAnonymizer(epsilon, n)
+        anonymizer = DiffPrivProportionAnonymizer(epsilon, n, rng=rng, dtype=dtype)
         return anonymizer
 
     @classmethod
-    def create_sum_anonymizer(cls, epsilon, lower, upper):
+    def create_sum_anonymizer(cls, epsilon, lower, upper, rng=None, dtype=None):
         """
         Creates a sum anonymizer instance.
 
@@ -152,10 +277,16 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         epsilon : float
             The privacy budget.
-        lower : float
-            The lower bound of the data.
-        upper : float
-            The upper bound of the data.
+        lower : float|ndarray
+            The lower bound(s) of the data.
+        upper : float|ndarray
+            The upper bound(s) of the data.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         Returns
         -------
@@ -163,11 +294,11 @@ class DiffPrivLaplaceMechanism(object):
             A sum anonymizer with the provided privacy budget.
 
         """
-        anonymizer = DiffPrivSumAnonymizer(epsilon, lower, upper)
+        anonymizer = DiffPrivSumAnonymizer(epsilon, lower, upper, rng=rng, dtype=dtype)
         return anonymizer
 
     @classmethod
-    def create_mean_anonymizer(cls, epsilon, lower, upper, n):
+    def create_mean_anonymizer(cls, epsilon, lower, upper, n, rng=None, dtype=None):
         """
         Creates a mean anonymizer instance.
 
@@ -175,12 +306,18 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         epsilon : float
             The privacy budget.
-        lower : float
-            The lower bound of the data.
-        upper : float
-            The upper bound of the data.
-        n : float
-            The total number of observations.
+        lower : float|ndarray
+            The lower bound(s) of the data.
+        upper : float|ndarray
+            The upper bound(s) of the data.
+        n : float|ndarray
+            The total number(s) of observations.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         Returns
         -------
@@ -188,11 +325,13 @@ class DiffPrivLaplaceMechanism(object):
             A mean anonymizer with the provided privacy budget.
 
         """
-        anonymizer = DiffPrivMeanAnonymizer(epsilon, lower, upper, n)
+        anonymizer = DiffPrivMeanAnonymizer(
+            epsilon, lower, upper, n, rng=rng, dtype=dtype
+        )
         return anonymizer
 
     @classmethod
-    def create_variance_anonymizer(cls, epsilon, lower, upper, n):
+    def create_variance_anonymizer(cls, epsilon, lower, upper, n, rng=None, dtype=None):
         """
         Creates a variance anonymizer instance.
 
@@ -200,12 +339,18 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         epsilon : float
             The privacy budget.
-        lower : float
-            The lower bound of the data.
-        upper : float
-            The upper bound of the data.
-        n : float
-            The total number of observations.
+        lower : float|ndarray
+            The lower bound(s) of the data.
+        upper : float|ndarray
+            The upper bound(s) of the data.
+        n : float|ndarray
+            The total number(s) of observations.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         Returns
         -------
@@ -213,11 +358,132 @@ class DiffPrivLaplaceMechanism(object):
             A variance anonymizer with the provided privacy budget.
 
         """
-        anonymizer = DiffPrivVarianceAnonymizer(epsilon, lower, upper, n)
+        anonymizer = DiffPrivVarianceAnonymizer(
+            epsilon, lower, upper, n, rng=rng, dtype=dtype
+        )
+        return anonymizer
+
+    @classmethod
+    def create_weighted_count_anonymizer(
+        cls, epsilon, max_weight=1.0, rng=None, dtype=None
+    ):
+        """
+        Creates a weighted count anonymizer instance.
+
+        Parameters
+        ----------
+        epsilon : float
+            The privacy budget.
+        [max_weight] : float
+            The max total weight (multiplicity) of the values of a single
+            individual.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
+
+        Returns
+        -------
+        `DiffPrivWeightedCountAnonymizer`
+            A weighted count anonymizer with the provided privacy budget.
+
+        """
+        anonymizer = DiffPrivWeightedCountAnonymizer(
+            epsilon, max_weight, rng=rng, dtype=dtype
+        )
         return anonymizer
 
     @classmethod
-    def anonymize_count_with_budget(cls, value, epsilon, size=None):
+    def create_weighted_sum_anonymizer(
+        cls, epsilon, lower, upper, max_weight=1.0, rng=None, dtype=None
+    ):
+        """
+        Creates a weighted sum anonymizer instance.
+
+        Parameters
+        ----------
+        epsilon : float
+            The privacy budget.
+        lower : float|ndarray
+            The lower bound(s) of the data.
+        upper : float|ndarray
+            The upper bound(s) of the data.
+        [max_weight] : float
+            The max total weight (multiplicity) of the values of a single
+            individual.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
+
+        Returns
+        -------
+        `DiffPrivWeightedSumAnonymizer`
+            A weighted sum anonymizer with the provided privacy budget.
+
+        """
+        anonymizer = DiffPrivWeightedSumAnonymizer(
+            epsilon, lower, upper, max_weight, rng=rng, dtype=dtype
+        )
+        return anonymizer
+
+    @classmethod
+    def create_batch_anonymizer(
+        cls, epsilon, kinds, lower=None, upper=None, n=None, rng=None, dtype=None
+    ):
+        """
+        Creates a batch anonymizer instance for heterogeneous values.
+
+        Parameters
+        ----------
+        epsilon : float|ndarray
+            The privacy budget(s).
+        kinds : list|ndarray
+            The anonymizer kind of each value (`DiffPrivAnonymizerType` members,
+            their names or integer codes from `BatchGlobalSensitivity.encode`).
+            The discrete counting kind is not supported.
+        [lower] : float|ndarray
+            The lower bound(s) of the data for the sum, mean and variance kinds.
+        [upper] : float|ndarray
+            The upper bound(s) of the data for the sum, mean and variance kinds.
+        [n] : float|ndarray
+            The total number(s) of observations for the proportion, mean and
+            variance kinds.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
+
+        Returns
+        -------
+        `DiffPrivBatchAnonymizer`
+            A batch anonymizer with a scale per value.
+
+        Raises
+        ------
+        DiffPrivMissingParameter
+            The exception is raised when a parameter required by one of the kinds
+            is not provided.
+        DiffPrivInvalidKind
+            The exception is raised when one of the kinds is neither a supported
+            kind name nor a valid integer code.
+
+        """
+        anonymizer = DiffPrivBatchAnonymizer(
+            epsilon, kinds, lower=lower, upper=upper, n=n, rng=rng, dtype=dtype
+        )
+        return anonymizer
+
+    @classmethod
+    def anonymize_count_with_budget(
+        cls, value, epsilon, size=None, rng=None, out=None, dtype=None
+    ):
         """
         Anonymizes one or many count value(s) for a given privacy budget.
 
@@ -229,19 +495,85 @@ class DiffPrivLaplaceMechanism(object):
             The privacy budget.
         [size] : int|tuple
             Output shape.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         Returns
         -------
         float|list|ndarray
             The anonymized count(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
-        anonymizer = cls.create_counting_anonymizer(epsilon)
-        anonymized = anonymizer.apply(value, size=size)
+        anonymizer = cls.get_anonymizer(
+            DiffPrivAnonymizerType.counting, epsilon, rng=rng, dtype=dtype
+        )
+        anonymized = anonymizer.apply(value, size=size, out=out)
         return anonymized
 
     @classmethod
-    def anonymize_min_with_budget(cls, value, epsilon, size=None):
+    def anonymize_discrete_count_with_budget(
+        cls, value, epsilon, size=None, rng=None, out=None, dtype=np.int64
+    ):
+        """
+        Anonymizes one or many integer count value(s) for a given privacy budget
+        using discrete Laplace (two-sided geometric) noise.
+
+        Parameters
+        ----------
+        value : int|list|ndarray
+            The count value(s).
+        epsilon : float
+            The privacy budget.
+        [size] : int|tuple
+            Output shape.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be an integer or floating point array. Passing the value(s) array
+            as `out` anonymizes it in place.
+        [dtype] : dtype
+            The integer type (e.g. `int64` or `int32`) of the anonymized counts.
+
+        Returns
+        -------
+        int|ndarray
+            The anonymized count(s).
+
+        Raises
+        ------
+        DiffPrivUnsupportedSampler
+            The exception is raised when `rng` does not provide a `geometric`
+            method.
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not an integer or floating point
+            array, or when an anonymized count is out of the range of `dtype`.
+
+        """
+        anonymizer = cls.get_anonymizer(
+            DiffPrivAnonymizerType.discrete_counting, epsilon, rng=rng, dtype=dtype
+        )
+        anonymized = anonymizer.apply(value, size=size, out=out)
+        return anonymized
+
+    @classmethod
+    def anonymize_min_with_budget(
+        cls, value, epsilon, size=None, rng=None, out=None, dtype=None
+    ):
         """
         Anonymizes one or many min value(s) for a given privacy budget.
 
@@ -253,19 +585,38 @@ class DiffPrivLaplaceMechanism(object):
             The privacy budget.
         [size] : int|tuple
             Output shape.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         Returns
         -------
         float|list|ndarray
             The anonymized min value(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
-        anonymizer = cls.create_min_anonymizer(epsilon)
-        anonymized = anonymizer.apply(value, size=size)
+        anonymizer = cls.get_anonymizer(
+            DiffPrivAnonymizerType.min, epsilon, rng=rng, dtype=dtype
+        )
+        anonymized = anonymizer.apply(value, size=size, out=out)
         return anonymized
 
     @classmethod
-    def anonymize_max_with_budget(cls, value, epsilon, size=None):
+    def anonymize_max_with_budget(
+        cls, value, epsilon, size=None, rng=None, out=None, dtype=None
+    ):
         """
         Anonymizes one or many max value(s) for a given privacy budget.
 
@@ -277,19 +628,38 @@ class DiffPrivLaplaceMechanism(object):
             The privacy budget.
         [size] : int|tuple
             Output shape.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         Returns
         -------
         float|list|ndarray
             The anonymized max value(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
-        anonymizer = cls.create_max_anonymizer(epsilon)
-        anonymized = anonymizer.apply(value, size=size)
+        anonymizer = cls.get_anonymizer(
+            DiffPrivAnonymizerType.max, epsilon, rng=rng, dtype=dtype
+        )
+        anonymized = anonymizer.apply(value, size=size, out=out)
         return anonymized
 
     @classmethod
-    def anonymize_median_with_budget(cls, value, epsilon, size=None):
+    def anonymize_median_with_budget(
+        cls, value, epsilon, size=None, rng=None, out=None, dtype=None
+    ):
         """
         Anonymizes one or many median value(s) for a given privacy budget.
 
@@ -301,19 +671,38 @@ class DiffPrivLaplaceMechanism(object):
             The privacy budget.
         [size] : int|tuple
             Output shape.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         Returns
         -------
         float|list|ndarray
             The anonymized median value(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
-        anonymizer = cls.create_median_anonymizer(epsilon)
-        anonymized = anonymizer.apply(value, size=size)
+        anonymizer = cls.get_anonymizer(
+            DiffPrivAnonymizerType.median, epsilon, rng=rng, dtype=dtype
+        )
+        anonymized = anonymizer.apply(value, size=size, out=out)
         return anonymized
 
     @classmethod
-    def anonymize_proportion_with_budget(cls, value, n, epsilon, size=None):
+    def anonymize_proportion_with_budget(
+        cls, value, n, epsilon, size=None, rng=None, out=None, dtype=None, cache=True
+    ):
         """
         Anonymizes one or many proportion value(s) for a given privacy budget.
 
@@ -321,25 +710,61 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         value : float|list|ndarray
             The proportion value(s).
-        n : float
-            The total number of observations.
+        n : float|ndarray
+            The total number(s) of observations.
         epsilon : float
             The privacy budget.
         [size] : int|tuple
             Output shape.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
+        [cache] : bool
+            Indicates whether or not the anonymizer may be cached, which should not
+            be the case when `n` is derived from the data.
 
         Returns
         -------
         float|list|ndarray
             The anonymized proportion(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
-        anonymizer = cls.create_proportion_anonymizer(epsilon, n)
-        anonymized = anonymizer.apply(value, size=size)
+        anonymizer = cls.get_anonymizer(
+            DiffPrivAnonymizerType.proportion,
+            epsilon,
+            n,
+            rng=rng,
+            dtype=dtype,
+            cache=cache,
+        )
+        anonymized = anonymizer.apply(value, size=size, out=out)
         return anonymized
 
     @classmethod
-    def anonymize_sum_with_budget(cls, value, lower, upper, epsilon, size=None):
+    def anonymize_sum_with_budget(
+        cls,
+        value,
+        lower,
+        upper,
+        epsilon,
+        size=None,
+        rng=None,
+        out=None,
+        dtype=None,
+        cache=True,
+    ):
         """
         Anonymizes one or many sum value(s) for a given privacy budget.
 
@@ -347,27 +772,66 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         value : float|list|ndarray
             The sum value(s).
-        lower : float
-            The lower bound of the data.
-        upper : float
-            The upper bound of the data.
+        lower : float|ndarray
+            The lower bound(s) of the data.
+        upper : float|ndarray
+            The upper bound(s) of the data.
         epsilon : float
             The privacy budget.
         [size] : int|tuple
             Output shape.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
+        [cache] : bool
+            Indicates whether or not the anonymizer may be cached, which should not
+            be the case when its parameters are derived from the data (e.g. the min
+            and max values of the data).
 
         Returns
         -------
         float|list|ndarray
             The anonymized sum value(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
-        anonymizer = cls.create_sum_anonymizer(epsilon, lower, upper)
-        anonymized = anonymizer.apply(value, size=size)
+        anonymizer = cls.get_anonymizer(
+            DiffPrivAnonymizerType.sum,
+            epsilon,
+            lower,
+            upper,
+            rng=rng,
+            dtype=dtype,
+            cache=cache,
+        )
+        anonymized = anonymizer.apply(value, size=size, out=out)
         return anonymized
 
     @classmethod
-    def anonymize_mean_with_budget(cls, value, lower, upper, n, epsilon, size=None):
+    def anonymize_mean_with_budget(
+        cls,
+        value,
+        lower,
+        upper,
+        n,
+        epsilon,
+        size=None,
+        rng=None,
+        out=None,
+        dtype=None,
+        cache=True,
+    ):
         """
         Anonymizes one or many mean value(s) for a given privacy budget.
 
@@ -375,29 +839,69 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         value : float|list|ndarray
             The mean value(s).
-        lower : float
-            The lower bound of the data.
-        upper : float
-            The upper bound of the data.
-        n : float
-            The total number of observations.
+        lower : float|ndarray
+            The lower bound(s) of the data.
+        upper : float|ndarray
+            The upper bound(s) of the data.
+        n : float|ndarray
+            The total number(s) of observations.
         epsilon : float
             The privacy budget.
         [size] : int|tuple
             Output shape.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
+        [cache] : bool
+            Indicates whether or not the anonymizer may be cached, which should not
+            be the case when its parameters are derived from the data (e.g. the min
+            and max values of the data).
 
         Returns
         -------
         float|list|ndarray
             The anonymized mean(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
-        anonymizer = cls.create_mean_anonymizer(epsilon, lower, upper, n)
-        anonymized = anonymizer.apply(value, size=size)
+        anonymizer = cls.get_anonymizer(
+            DiffPrivAnonymizerType.mean,
+            epsilon,
+            lower,
+            upper,
+            n,
+            rng=rng,
+            dtype=dtype,
+            cache=cache,
+        )
+        anonymized = anonymizer.apply(value, size=size, out=out)
         return anonymized
 
     @classmethod
-    def anonymize_variance_with_budget(cls, value, lower, upper, n, epsilon, size=None):
+    def anonymize_variance_with_budget(
+        cls,
+        value,
+        lower,
+        upper,
+        n,
+        epsilon,
+        size=None,
+        rng=None,
+        out=None,
+        dtype=None,
+        cache=True,
+    ):
         """
         Anonymizes one or many variance value(s) for a given privacy budget.
 
@@ -405,28 +909,245 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         value : float|list|ndarray
             The variance value(s).
-        lower : float
-            The lower bound of the data.
-        upper : float
-            The upper bound of the data.
-        n : float
-            The total number of observations.
+        lower : float|ndarray
+            The lower bound(s) of the data.
+        upper : float|ndarray
+            The upper bound(s) of the data.
+        n : float|ndarray
+            The total number(s) of observations.
         epsilon : float
             The privacy budget.
         [size] : int|tuple
             Output shape.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
+        [cache] : bool
+            Indicates whether or not the anonymizer may be cached, which should not
+            be the case when its parameters are derived from the data (e.g. the min
+            and max values of the data).
 
         Returns
         -------
         float|list|ndarray
             The anonymized variance(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
+        """
+        anonymizer = cls.get_anonymizer(
+            DiffPrivAnonymizerType.variance,
+            epsilon,
+            lower,
+            upper,
+            n,
+            rng=rng,
+            dtype=dtype,
+            cache=cache,
+        )
+        anonymized = anonymizer.apply(value, size=size, out=out)
+        return anonymized
+
+    @classmethod
+    def anonymize_weighted_count_with_budget(
+        cls, value, epsilon, max_weight=1.0, size=None, rng=None, out=None, dtype=None
+    ):
+        """
+        Anonymizes one or many weighted count value(s) for a given privacy budget.
+
+        Parameters
+        ----------
+        value : float|list|ndarray
+            The weighted count value(s).
+        epsilon : float
+            The privacy budget.
+        [max_weight] : float
+            The max total weight (multiplicity) of the values of a single
+            individual.
+        [size] : int|tuple
+            Output shape.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
+
+        Returns
+        -------
+        float|list|ndarray
+            The anonymized weighted count(s).
+
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
-        anonymizer = cls.create_variance_anonymizer(epsilon, lower, upper, n)
-        anonymized = anonymizer.apply(value, size=size)
+        anonymizer = cls.get_anonymizer(
+            DiffPrivAnonymizerType.weighted_count,
+            epsilon,
+            max_weight,
+            rng=rng,
+            dtype=dtype,
+        )
+        anonymized = anonymizer.apply(value, size=size, out=out)
+        return anonymized
+
+    @classmethod
+    def anonymize_weighted_sum_with_budget(
+        cls,
+        value,
+        lower,
+        upper,
+        epsilon,
+        max_weight=1.0,
+        size=None,
+        rng=None,
+        out=None,
+        dtype=None,
+        cache=True,
+    ):
+        """
+        Anonymizes one or many weighted sum value(s) for a given privacy budget.
+
+        Parameters
+        ----------
+        value : float|list|ndarray
+            The weighted sum value(s).
+        lower : float|ndarray
+            The lower bound(s) of the data.
+        upper : float|ndarray
+            The upper bound(s) of the data.
+        epsilon : float
+            The privacy budget.
+        [max_weight] : float
+            The max total weight (multiplicity) of the values of a single
+            individual.
+        [size] : int|tuple
+            Output shape.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
+        [cache] : bool
+            Indicates whether or not the anonymizer may be cached, which should not
+            be the case when its parameters are derived from the data (e.g. the min
+            and max values of the data).
+
+        Returns
+        -------
+        float|list|ndarray
+            The anonymized weighted sum value(s).
+
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
+        """
+        anonymizer = cls.get_anonymizer(
+            DiffPrivAnonymizerType.weighted_sum,
+            epsilon,
+            lower,
+            upper,
+            max_weight,
+            rng=rng,
+            dtype=dtype,
+            cache=cache,
+        )
+        anonymized = anonymizer.apply(value, size=size, out=out)
+        return anonymized
+
+    @classmethod
+    def anonymize_batch_with_budget(
+        cls,
+        value,
+        kinds,
+        epsilon,
+        lower=None,
+        upper=None,
+        n=None,
+        rng=None,
+        out=None,
+        dtype=None,
+    ):
+        """
+        Anonymizes many values of different kinds, privacy budgets and bounds
+        with a single vectorized scale computation and noise draw.
+
+        Parameters
+        ----------
+        value : list|ndarray
+            The values.
+        kinds : list|ndarray
+            The anonymizer kind of each value (`DiffPrivAnonymizerType` members,
+            their names or integer codes from `BatchGlobalSensitivity.encode`).
+            The discrete counting kind is not supported.
+        epsilon : float|ndarray
+            The privacy budget(s).
+        [lower] : float|ndarray
+            The lower bound(s) of the data for the sum, mean and variance kinds.
+        [upper] : float|ndarray
+            The upper bound(s) of the data for the sum, mean and variance kinds.
+        [n] : float|ndarray
+            The total number(s) of observations for the proportion, mean and
+            variance kinds.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [out] : ndarray
+            The buffer to write the anonymized values into, which is filled in chunks
+            and must be a floating point array. Passing the values array as `out`
+            anonymizes it in place.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
+
+        Returns
+        -------
+        ndarray
+            The anonymized values.
+
+        Raises
+        ------
+        DiffPrivMissingParameter
+            The exception is raised when a parameter required by one of the kinds
+            is not provided.
+        DiffPrivInvalidKind
+            The exception is raised when one of the kinds is neither a supported
+            kind name nor a valid integer code.
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
+        """
+        anonymizer = cls.create_batch_anonymizer(
+            epsilon, kinds, lower=lower, upper=upper, n=n, rng=rng, dtype=dtype
+        )
+        anonymized = anonymizer.apply(value, out=out)
         return anonymized
 
-    def __init__(self, epsilon):
+    def __init__(self, epsilon, rng=None, dtype=None):
         """
         Initialize the Laplace mechanism with a privacy budget.
 
@@ -434,9 +1155,17 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         epsilon : float
             The privacy budget value to use.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used to compute the scale
+            and draw the noise. When `None`, double precision is used.
 
         """
         self.__epsilon = float(epsilon)
+        self.__rng = None if rng is None else DiffPrivGenerator.create(rng)
+        self.__dtype = None if dtype is None else np.dtype(dtype)
         super().__init__()
 
     @property
@@ -452,7 +1181,58 @@ class DiffPrivLaplaceMechanism(object):
         """
         return self.__epsilon
 
-    def anonymize_count(self, value, size=None):
+    @property
+    def rng(self):
+        """
+        The random generator used to draw the noise.
+
+        Returns
+        -------
+        None|Generator
+            The random generator or `None` when the numpy legacy global random state
+            is used.
+
+        """
+        return self.__rng
+
+    @property
+    def dtype(self):
+        """
+        The floating point precision used to compute the scale and draw the noise.
+
+        Returns
+        -------
+        None|dtype
+            The floating point precision or `None` when double precision is used.
+
+        """
+        return self.__dtype
+
+    def spawn(self, n):
+        """
+        Spawns Laplace mechanisms with the same privacy budget and independent
+        random generators derived from this mechanism's generator.
+
+        Parameters
+        ----------
+        n : int
+            The amount of Laplace mechanisms to spawn.
+
+        Returns
+        -------
+        list
+            The list of `DiffPrivLaplaceMechanism` with independent random
+            generators.
+
+        """
+        generators = DiffPrivGenerator.spawn(self.__rng, n)
+        mechanisms = [
+            DiffPrivLaplaceMechanism(self.__epsilon, rng=generator, dtype=self.__dtype)
+            for generator in generators
+        ]
+        return mechanisms
+
+    def anonymize_count(self, value, size=None, out=None):
         """
         Anonymizes one or many count value(s).
 
@@ -462,19 +1242,68 @@ class DiffPrivLaplaceMechanism(object):
             The count value(s).
         [size] : int|tuple
             Output shape.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
 
         Returns
         -------
         float|list|ndarray
             The anonymized count(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
         anonymized = DiffPrivLaplaceMechanism.anonymize_count_with_budget(
-            value, self.__epsilon, size=size
+            value,
+            self.__epsilon,
+            size=size,
+            rng=self.__rng,
+            out=out,
+            dtype=self.__dtype,
         )
         return anonymized
 
-    def anonymize_min(self, value, size=None):
+    def anonymize_discrete_count(self, value, size=None, out=None, dtype=np.int64):
+        """
+        Anonymizes one or many integer count value(s) using discrete Laplace
+        (two-sided geometric) noise.
+
+        Parameters
+        ----------
+        value : int|list|ndarray
+            The count value(s).
+        [size] : int|tuple
+            Output shape.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be an integer or floating point array. Passing the value(s) array
+            as `out` anonymizes it in place.
+        [dtype] : dtype
+            The integer type (e.g. `int64` or `int32`) of the anonymized counts.
+
+        Returns
+        -------
+        int|ndarray
+            The anonymized count(s).
+
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not an integer or floating point
+            array, or when an anonymized count is out of the range of `dtype`.
+
+        """
+        anonymized = DiffPrivLaplaceMechanism.anonymize_discrete_count_with_budget(
+            value, self.__epsilon, size=size, rng=self.__rng, out=out, dtype=dtype
+        )
+        return anonymized
+
+    def anonymize_min(self, value, size=None, out=None):
         """
         Anonymizes one or many min value(s).
 
@@ -484,19 +1313,33 @@ class DiffPrivLaplaceMechanism(object):
             The min value(s).
         [size] : int|tuple
             Output shape.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
 
         Returns
         -------
         float|list|ndarray
             The anonymized min value(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
         anonymized = DiffPrivLaplaceMechanism.anonymize_min_with_budget(
-            value, self.__epsilon, size=size
+            value,
+            self.__epsilon,
+            size=size,
+            rng=self.__rng,
+            out=out,
+            dtype=self.__dtype,
         )
         return anonymized
 
-    def anonymize_max(self, value, size=None):
+    def anonymize_max(self, value, size=None, out=None):
         """
         Anonymizes one or many max value(s).
 
@@ -506,19 +1349,33 @@ class DiffPrivLaplaceMechanism(object):
             The max value(s).
         [size] : int|tuple
             Output shape.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
 
         Returns
         -------
         float|list|ndarray
             The anonymized max value(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
         anonymized = DiffPrivLaplaceMechanism.anonymize_max_with_budget(
-            value, self.__epsilon, size=size
+            value,
+            self.__epsilon,
+            size=size,
+            rng=self.__rng,
+            out=out,
+            dtype=self.__dtype,
         )
         return anonymized
 
-    def anonymize_median(self, value, size=None):
+    def anonymize_median(self, value, size=None, out=None):
         """
         Anonymizes one or many ,median value(s).
 
@@ -528,19 +1385,33 @@ class DiffPrivLaplaceMechanism(object):
             The median value(s).
         [size] : int|tuple
             Output shape.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
 
         Returns
         -------
         float|list|ndarray
             The anonymized median value(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
         anonymized = DiffPrivLaplaceMechanism.anonymize_median_with_budget(
-            value, self.__epsilon, size=size
+            value,
+            self.__epsilon,
+            size=size,
+            rng=self.__rng,
+            out=out,
+            dtype=self.__dtype,
         )
         return anonymized
 
-    def anonymize_proportion(self, value, n, size=None):
+    def anonymize_proportion(self, value, n, size=None, out=None):
         """
         Anonymizes one or many proportion value(s).
 
@@ -548,23 +1419,38 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         value : float|list|ndarray
             The proportion value(s).
-        n : float
-            The total number of observations.
+        n : float|ndarray
+            The total number(s) of observations.
         [size] : int|tuple
             Output shape.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
 
         Returns
         -------
         float|list|ndarray
             The anonymized proportion(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
         anonymized = DiffPrivLaplaceMechanism.anonymize_proportion_with_budget(
-            value, n, self.__epsilon, size=size
+            value,
+            n,
+            self.__epsilon,
+            size=size,
+            rng=self.__rng,
+            out=out,
+            dtype=self.__dtype,
         )
         return anonymized
 
-    def anonymize_sum(self, value, lower, upper, size=None):
+    def anonymize_sum(self, value, lower, upper, size=None, out=None):
         """
         Anonymizes one or many sum value(s).
 
@@ -572,25 +1458,41 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         value : float|list|ndarray
             The sum value(s).
-        lower : float
-            The lower bound of the data.
-        upper : float
-            The upper bound of the data.
+        lower : float|ndarray
+            The lower bound(s) of the data.
+        upper : float|ndarray
+            The upper bound(s) of the data.
         [size] : int|tuple
             Output shape.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
 
         Returns
         -------
         float|list|ndarray
             The anonymized sum value(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
         anonymized = DiffPrivLaplaceMechanism.anonymize_sum_with_budget(
-            value, lower, upper, self.__epsilon, size=size
+            value,
+            lower,
+            upper,
+            self.__epsilon,
+            size=size,
+            rng=self.__rng,
+            out=out,
+            dtype=self.__dtype,
         )
         return anonymized
 
-    def anonymize_mean(self, value, lower, upper, n, size=None):
+    def anonymize_mean(self, value, lower, upper, n, size=None, out=None):
         """
         Anonymizes one or many mean value(s).
 
@@ -598,27 +1500,44 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         value : float|list|ndarray
             The mean value(s).
-        lower : float
-            The lower bound of the data.
-        upper : float
-            The upper bound of the data.
-        n : float
-            The total number of observations.
+        lower : float|ndarray
+            The lower bound(s) of the data.
+        upper : float|ndarray
+            The upper bound(s) of the data.
+        n : float|ndarray
+            The total number(s) of observations.
         [size] : int|tuple
             Output shape.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
 
         Returns
         -------
         float|list|ndarray
             The anonymized mean(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
         anonymized = DiffPrivLaplaceMechanism.anonymize_mean_with_budget(
-            value, lower, upper, n, self.__epsilon, size=size
+            value,
+            lower,
+            upper,
+            n,
+            self.__epsilon,
+            size=size,
+            rng=self.__rng,
+            out=out,
+            dtype=self.__dtype,
         )
         return anonymized
 
-    def anonymize_variance(self, value, lower, upper, n, size=None):
+    def anonymize_variance(self, value, lower, upper, n, size=None, out=None):
         """
         Anonymizes one or many variance value(s).
 
@@ -626,22 +1545,175 @@ class DiffPrivLaplaceMechanism(object):
         ----------
         value : float|list|ndarray
             The variance value(s).
-        lower : float
-            The lower bound of the data.
-        upper : float
-            The upper bound of the data.
-        n : float
-            The total number of observations.
+        lower : float|ndarray
+            The lower bound(s) of the data.
+        upper : float|ndarray
+            The upper bound(s) of the data.
+        n : float|ndarray
+            The total number(s) of observations.
         [size] : int|tuple
             Output shape.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
 
         Returns
         -------
         float|list|ndarray
             The anonymized variance(s).
 
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
         """
         anonymized = DiffPrivLaplaceMechanism.anonymize_variance_with_budget(
-            value, lower, upper, n, self.__epsilon, size=size
+            value,
+            lower,
+            upper,
+            n,
+            self.__epsilon,
+            size=size,
+            rng=self.__rng,
+            out=out,
+            dtype=self.__dtype,
+        )
+        return anonymized
+
+    def anonymize_weighted_count(self, value, max_weight=1.0, size=None, out=None):
+        """
+        Anonymizes one or many weighted count value(s).
+
+        Parameters
+        ----------
+        value : float|list|ndarray
+            The weighted count value(s).
+        [max_weight] : float
+            The max total weight (multiplicity) of the values of a single
+            individual.
+        [size] : int|tuple
+            Output shape.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
+
+        Returns
+        -------
+        float|list|ndarray
+            The anonymized weighted count(s).
+
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
+        """
+        anonymized = DiffPrivLaplaceMechanism.anonymize_weighted_count_with_budget(
+            value,
+            self.__epsilon,
+            max_weight=max_weight,
+            size=size,
+            rng=self.__rng,
+            out=out,
+            dtype=self.__dtype,
+        )
+        return anonymized
+
+    def anonymize_weighted_sum(
+        self, value, lower, upper, max_weight=1.0, size=None, out=None
+    ):
+        """
+        Anonymizes one or many weighted sum value(s).
+
+        Parameters
+        ----------
+        value : float|list|ndarray
+            The weighted sum value(s).
+        lower : float|ndarray
+            The lower bound(s) of the data.
+        upper : float|ndarray
+            The upper bound(s) of the data.
+        [max_weight] : float
+            The max total weight (multiplicity) of the values of a single
+            individual.
+        [size] : int|tuple
+            Output shape.
+        [out] : ndarray
+            The buffer to write the anonymized value(s) into, which is filled in chunks
+            and must be a floating point array. Passing the value(s) array as `out`
+            anonymizes it in place.
+
+        Returns
+        -------
+        float|list|ndarray
+            The anonymized weighted sum value(s).
+
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
+        """
+        anonymized = DiffPrivLaplaceMechanism.anonymize_weighted_sum_with_budget(
+            value,
+            lower,
+            upper,
+            self.__epsilon,
+            max_weight=max_weight,
+            size=size,
+            rng=self.__rng,
+            out=out,
+            dtype=self.__dtype,
+        )
+        return anonymized
+
+    def anonymize_batch(self, value, kinds, lower=None, upper=None, n=None, out=None):
+        """
+        Anonymizes many values of different kinds and bounds with a single noise
+        draw.
+
+        Parameters
+        ----------
+        value : list|ndarray
+            The values.
+        kinds : list|ndarray
+            The anonymizer kind of each value (`DiffPrivAnonymizerType` members,
+            their names or integer codes from `BatchGlobalSensitivity.encode`).
+        [lower] : float|ndarray
+            The lower bound(s) of the data for the sum, mean and variance kinds.
+        [upper] : float|ndarray
+            The upper bound(s) of the data for the sum, mean and variance kinds.
+        [n] : float|ndarray
+            The total number(s) of observations for the proportion, mean and
+            variance kinds.
+        [out] : ndarray
+            The buffer to write the anonymized values into, which is filled in chunks
+            and must be a floating point array. Passing the values array as `out`
+            anonymizes it in place.
+
+        Returns
+        -------
+        ndarray
+            The anonymized values.
+
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when `out` is not a floating point array.
+
+        """
+        anonymized = DiffPrivLaplaceMechanism.anonymize_batch_with_budget(
+            value,
+            kinds,
+            self.__epsilon,
+            lower=lower,
+            upper=upper,
+            n=n,
+            rng=self.__rng,
+            out=out,
+            dtype=self.__dtype,
         )
         return anonymized
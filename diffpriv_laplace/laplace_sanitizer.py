@@ -1,8 +1,10 @@
 import numpy as np
+from diffpriv_laplace.laplace_mechanism import DiffPrivLaplaceMechanism
+from diffpriv_laplace.sampler.generator import DiffPrivGenerator
 from diffpriv_laplace.statistics import DiffPrivStatisticKind
+from diffpriv_laplace.storage import DiffPrivStorage
 from diffpriv_laplace.query.parallel_statistics import DiffPrivParallelStatisticsQuery
 from diffpriv_laplace.exceptions import (
-    DiffPrivInvalidDimensions,
     DiffPrivSizeMismatch,
     DiffPrivInvalidDecomposition,
 )
@@ -63,6 +65,42 @@ class DiffPrivLaplaceSanitizer(object):
 
         return decomposed
 
+    @classmethod
+    def count_decomposed_data_slice(cls, data, selectors):
+        """
+        Counts the elements of a data slice (or a chunk of it) which belong to each
+        independent/disjoint category subset derived from the provided `selectors`
+        without building the decomposed data slice.
+
+        Parameters
+        ----------
+        data : list|ndarray
+            The data slice to count.
+        selectors : list
+            The list of selector functions to apply to the data (see
+            `decompose_data_slice`).
+
+        Returns
+        -------
+        ndarray
+            The count of each category subset.
+
+        Raises
+        ------
+        DiffPrivInvalidDecomposition
+            The exception is raised when there are overlapping elements in the
+            decomposed data slice subsets.
+
+        """
+        masks = np.array([np.asarray(select(data), dtype=bool) for select in selectors])
+        if np.any(np.sum(masks, axis=0) != 1):
+            raise DiffPrivInvalidDecomposition(
+                "The constructed subsets are not independent!"
+            )
+
+        counts = np.count_nonzero(masks, axis=1)
+        return counts
+
     @classmethod
     def constrain_anonymized_counts(cls, counts, n):
         """
@@ -86,7 +124,7 @@ class DiffPrivLaplaceSanitizer(object):
         return constrained
 
     @classmethod
-    def count(cls, data, selectors, epsilon, axis=None, postprocess=True):
+    def count(cls, data, selectors, epsilon, axis=None, postprocess=True, rng=None):
         """
         Performs Laplace sanitizer counting by selecting the data into
         independent/disjoint data slice subsets and then applying parallel composition
@@ -97,8 +135,9 @@ class DiffPrivLaplaceSanitizer(object):
 
         Parameters
         ----------
-        data : list|ndarray
-            The data to retrieve the anonymized statistic value(s) from.
+        data : list|ndarray|str|memmap
+            The data to retrieve the anonymized statistic value(s) from. Memory-mapped
+            data (or a file path) is counted in chunks without being loaded in memory.
         selectors : list
             The list of lists of selector functions to apply to the data such that
             each collection of functions in index i is applied to its corresponding
@@ -107,9 +146,15 @@ class DiffPrivLaplaceSanitizer(object):
             The privacy budget.
         [axis] : int|tuple
             Axis or tuple of axes along which to obtain the anonymized statistic
-            value(s).
+            value(s). The data slices are indexed by the remaining axes of N
+            dimensional data (flattened in row-major order) and taken as views of
+            the data. When `None`, the data slices are reduced along the first axis.
         [postprocess] : bool
             Indicates whether or not to constrain the anonymized count values.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise, which is created
+            once for all the statistics. When `None`, the numpy legacy global random
+            state is used.
 
         Returns
         -------
@@ -120,7 +165,8 @@ class DiffPrivLaplaceSanitizer(object):
         Raises
         ------
         DiffPrivInvalidDimensions
-            The exception is raised when the data dimension is invalid.
+            The exception is raised when the data is a scalar or when `axis` is
+            empty or out of the data dimensions.
         DiffPrivSizeMismatch
             The exception is raised when the length of the `selectors` list is of
             different size than the amount of data slices in `data` defined
@@ -133,22 +179,20 @@ class DiffPrivLaplaceSanitizer(object):
             requirement for the Laplace sanitizer.
 
         """
-        if np.ndim(data) == 1:
-            data = np.array([data])
-            axis = 1
-
-        data_dim = np.ndim(data)
-        if data_dim != 2:
-            raise DiffPrivInvalidDimensions(
-                "Invalid data dimension: {}".format(data_dim)
-            )
+        rng = None if rng is None else DiffPrivGenerator.create(rng)
+        data = DiffPrivStorage.load(data)
+        if not DiffPrivStorage.is_mapped(data):
+            data = np.asarray(data)
 
+        if data.ndim == 1:
+            axis = 0
+
+        iter_axis, reduce_axis = DiffPrivStorage.data_slice_axes(data, axis)
         if np.ndim(selectors) == 1:
             selectors = [selectors]
 
-        shape = np.shape(data)
-        iter_axis = (axis if axis else 0) - 1
-        n = shape[iter_axis]
+        shape = tuple(data.shape[index] for index in iter_axis)
+        n = int(np.prod(shape))
         selectors_len = len(selectors)
         if n != selectors_len:
             raise DiffPrivSizeMismatch(
@@ -157,17 +201,44 @@ class DiffPrivLaplaceSanitizer(object):
                 )
             )
 
-        data_slice_len = np.size(data, axis=axis)
+        data_slice_len = int(np.prod([data.shape[index] for index in reduce_axis]))
         results = [None] * selectors_len
+        if DiffPrivStorage.is_mapped(data):
+            indices = [
+                index
+                for index in range(0, selectors_len)
+                if selectors[index] and isinstance(selectors[index], list)
+            ]
+            totals = {index: 0 for index in indices}
+            for index, chunk in DiffPrivStorage.data_slice_chunks(
+                data, indices, iter_axis
+            ):
+                totals[index] = totals[index] + cls.count_decomposed_data_slice(
+                    np.ravel(chunk), selectors[index]
+                )
+
+            for index in indices:
+                counts = DiffPrivLaplaceMechanism.anonymize_count_with_budget(
+                    totals[index], epsilon, rng=rng
+                )
+                counts = np.round(np.clip(counts, 0.0, data_slice_len))
+                if postprocess:
+                    counts = cls.constrain_anonymized_counts(counts, data_slice_len)
+
+                results[index] = counts
+
+            return results
+
+        data_slices = np.moveaxis(data, iter_axis, range(len(iter_axis)))
         for index in range(0, selectors_len):
             data_slice_selectors = selectors[index]
             if data_slice_selectors and isinstance(data_slice_selectors, list):
-                data_slice = np.take(data, [index], axis=iter_axis)
+                data_slice = data_slices[np.unravel_index(index, shape)]
                 data_slice = np.ravel(data_slice)
                 decomposed = cls.decompose_data_slice(data_slice, data_slice_selectors)
                 kind = [DiffPrivStatisticKind.count] * len(data_slice_selectors)
                 result = DiffPrivParallelStatisticsQuery.query(
-                    decomposed, kind, epsilon, axis=1
+                    decomposed, kind, epsilon, axis=1, rng=rng
                 )
                 counts = np.array(
                     [value[DiffPrivStatisticKind.count] for value in result]
@@ -0,0 +1,707 @@
+import os
+import numpy as np
+from diffpriv_laplace.aggregate import DiffPrivAggregate
+from diffpriv_laplace.global_sensitivity.batch import BatchGlobalSensitivity
+from diffpriv_laplace.laplace_mechanism import DiffPrivLaplaceMechanism
+from diffpriv_laplace.predicate import DiffPrivPredicate
+from diffpriv_laplace.sampler.generator import DiffPrivGenerator
+from diffpriv_laplace.statistics import DiffPrivStatistics, DiffPrivStatisticKind
+from diffpriv_laplace.storage import DiffPrivStorage
+
+
+class DiffPrivLazyStatistic(object):
+    """
+    Deferred anonymized statistic recorded by a `DiffPrivLazyStatistics` graph,
+    whose value is available once the graph is computed.
+    """
+
+    def __init__(self, graph, kind, epsilon, condition=None, postprocess=True):
+        """
+        Initialize a deferred statistic.
+
+        Parameters
+        ----------
+        graph : `DiffPrivLazyStatistics`
+            The graph which computes the statistic.
+        kind : DiffPrivStatisticKind
+            The kind of the statistic.
+        epsilon : float
+            The privacy budget.
+        [condition] : function|DiffPrivPredicate
+            The condition of a count or a proportion.
+        [postprocess] : bool
+            Indicates whether or not to post-process a count or a proportion.
+
+        """
+        super().__init__()
+        self.__graph = graph
+        self.__kind = kind
+        self.__epsilon = epsilon
+        self.__condition = condition
+        self.__postprocess = postprocess
+
+    def compute(self):
+        """
+        Computes the graph of the statistic (if not computed yet) and returns the
+        anonymized value of the statistic.
+
+        Returns
+        -------
+        float|ndarray
+            The anonymized value(s).
+
+        """
+        self.__graph.compute()
+        return self.value
+
+    @property
+    def kind(self):
+        """
+        The kind of the statistic.
+
+        Returns
+        -------
+        DiffPrivStatisticKind
+            The kind.
+
+        """
+        return self.__kind
+
+    @property
+    def epsilon(self):
+        """
+        The privacy budget of the statistic.
+
+        Returns
+        -------
+        float
+            The privacy budget.
+
+        """
+        return self.__epsilon
+
+    @property
+    def condition(self):
+        """
+        The condition of a count or a proportion.
+
+        Returns
+        -------
+        None|function|DiffPrivPredicate
+            The condition or `None` when the non-zero values are counted.
+
+        """
+        return self.__condition
+
+    @property
+    def postprocess(self):
+        """
+        Indicates whether or not a count or a proportion is post-processed.
+
+        Returns
+        -------
+        bool
+            `True` when post-processed.
+
+        """
+        return self.__postprocess
+
+    @property
+    def computed(self):
+        """
+        Indicates whether or not the statistic has been computed.
+
+        Returns
+        -------
+        bool
+            `True` when the value is available.
+
+        """
+        value = self.__graph.is_computed(self)
+        return value
+
+    @property
+    def value(self):
+        """
+        The anonymized value of the statistic.
+
+        Returns
+        -------
+        None|float|ndarray
+            The anonymized value(s) or `None` when not computed yet.
+
+        """
+        value = self.__graph.result(self)
+        return value
+
+    def __repr__(self):
+        name = self.__kind.name
+        if self.__condition is not None:
+            name = "{}[{}]".format(name, self.__condition)
+
+        return "DiffPrivLazyStatistic({}, epsilon={!r})".format(name, self.__epsilon)
+
+
+class DiffPrivLazyStatistics(object):
+    """
+    Lazy differential privacy statistics which records the requested statistics as
+    a graph instead of computing them eagerly. Statistics over the same data and
+    axis share a single fused chunked scan, which computes one `DiffPrivAggregate`
+    (count, min, max, sum, mean and variance) and evaluates every condition of
+    the counts and proportions on each chunk, and all the statistics are
+    anonymized with a single batched noise draw on `compute`. Identical statistics
+    are recorded once unless the graph is not `shared`. The median cannot be
+    derived from the scan and still reads its data separately.
+    """
+
+    def __init__(self, rng=None, dtype=None, shared=True):
+        """
+        Initialize an empty graph.
+
+        Parameters
+        ----------
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. A seed creates the
+            generator once, so that each `compute` draws fresh noise. When `None`,
+            the numpy legacy global random state is used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reductions,
+            the noise and the post-processing. When `None`, double precision is
+            used.
+        [shared] : bool
+            Indicates whether or not identical statistics are recorded once and
+            therefore share their anonymized value. When `False`, each recorded
+            statistic draws its own noise (e.g. for independent queries), while
+            still sharing the scans of the data.
+
+        """
+        super().__init__()
+        self.__rng = None if rng is None else DiffPrivGenerator.create(rng)
+        self.__dtype = None if dtype is None else np.dtype(dtype)
+        self.__shared = shared
+        self.__sources = {}
+        self.__statistics = {}
+        self.__results = {}
+
+    def __source(self, data, axis):
+        if isinstance(data, (str, os.PathLike)):
+            data_key = os.fspath(data)
+        else:
+            data_key = id(data)
+
+        axis_key = None if axis is None else tuple(np.atleast_1d(axis).tolist())
+        key = (data_key, axis_key)
+        if key not in self.__sources:
+            self.__sources[key] = {
+                "data": data,
+                "axis": axis,
+                "aggregate": False,
+                "median": False,
+                "conditions": {},
+                "statistics": [],
+            }
+
+        return self.__sources[key]
+
+    def __record(self, data, kind, epsilon, axis, condition=None, postprocess=True):
+        source = self.__source(data, axis)
+        condition_key = None
+        if isinstance(condition, (str, DiffPrivPredicate)):
+            condition = DiffPrivPredicate.compile(condition)
+            condition_key = str(condition)
+        elif condition:
+            condition_key = id(condition)
+        else:
+            condition = None
+
+        key = (id(source), kind, float(epsilon), condition_key, bool(postprocess))
+        if not self.__shared:
+            key = key + (len(self.__statistics),)
+
+        if key in self.__statistics:
+            return self.__statistics[key]
+
+        statistic = DiffPrivLazyStatistic(
+            self, kind, epsilon, condition=condition, postprocess=postprocess
+        )
+        if kind == DiffPrivStatisticKind.median:
+            source["median"] = True
+        elif condition is not None:
+            source["conditions"].setdefault(condition_key, condition)
+        else:
+            source["aggregate"] = True
+
+        source["statistics"].append((statistic, condition_key))
+        self.__statistics[key] = statistic
+        return statistic
+
+    def count(self, data, epsilon, condition=None, axis=None, postprocess=True):
+        """
+        Records an anonymized count (see `DiffPrivStatistics.count`).
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The data to retrieve the count(s) from.
+        epsilon : float
+            The privacy budget.
+        [condition] : function|str|DiffPrivPredicate
+            A condition function, which is applied to each chunk of the data, or a
+            predicate expression, which is evaluated on each chunk of the data.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to count non-zeros or non-False value(s).
+        [postprocess] : bool
+            Indicates whether or not to post-process the count values so that the
+            returned value is rounded and within the [0, n] range, where n is the total
+            number of observations.
+
+        Returns
+        -------
+        `DiffPrivLazyStatistic`
+            The deferred count(s).
+
+        """
+        statistic = self.__record(
+            data,
+            DiffPrivStatisticKind.count,
+            epsilon,
+            axis,
+            condition=condition,
+            postprocess=postprocess,
+        )
+        return statistic
+
+    def min(self, data, epsilon, axis=None):
+        """
+        Records an anonymized min (see `DiffPrivStatistics.min`).
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The data to retrieve the min value(s) from.
+        epsilon : float
+            The privacy budget.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to obtain the min value(s).
+
+        Returns
+        -------
+        `DiffPrivLazyStatistic`
+            The deferred min value(s).
+
+        """
+        statistic = self.__record(data, DiffPrivStatisticKind.min, epsilon, axis)
+        return statistic
+
+    def max(self, data, epsilon, axis=None):
+        """
+        Records an anonymized max (see `DiffPrivStatistics.max`).
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The data to retrieve the max value(s) from.
+        epsilon : float
+            The privacy budget.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to obtain the max value(s).
+
+        Returns
+        -------
+        `DiffPrivLazyStatistic`
+            The deferred max value(s).
+
+        """
+        statistic = self.__record(data, DiffPrivStatisticKind.max, epsilon, axis)
+        return statistic
+
+    def median(self, data, epsilon, axis=None):
+        """
+        Records an anonymized median (see `DiffPrivStatistics.median`), which is
+        not part of the fused scan.
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The data to retrieve the median value(s) from.
+        epsilon : float
+            The privacy budget.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to obtain the median value(s).
+
+        Returns
+        -------
+        `DiffPrivLazyStatistic`
+            The deferred median value(s).
+
+        """
+        statistic = self.__record(data, DiffPrivStatisticKind.median, epsilon, axis)
+        return statistic
+
+    def proportion(self, data, epsilon, condition=None, axis=None, postprocess=True):
+        """
+        Records an anonymized proportion (see `DiffPrivStatistics.proportion`).
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The data to retrieve the proportion(s) from.
+        epsilon : float
+            The privacy budget.
+        [condition] : function|str|DiffPrivPredicate
+            A condition function, which is applied to each chunk of the data, or a
+            predicate expression, which is evaluated on each chunk of the data.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to count non-zeros or non-False value(s).
+        [postprocess] : bool
+            Indicates whether or not to post-process the proportion values so that the
+            returned value is within the [0.0, 1.0] range.
+
+        Returns
+        -------
+        `DiffPrivLazyStatistic`
+            The deferred proportion(s).
+
+        """
+        statistic = self.__record(
+            data,
+            DiffPrivStatisticKind.proportion,
+            epsilon,
+            axis,
+            condition=condition,
+            postprocess=postprocess,
+        )
+        return statistic
+
+    def sum(self, data, epsilon, axis=None):
+        """
+        Records an anonymized sum (see `DiffPrivStatistics.sum`).
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The data to retrieve the sum value(s) from.
+        epsilon : float
+            The privacy budget.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to obtain the sum value(s).
+
+        Returns
+        -------
+        `DiffPrivLazyStatistic`
+            The deferred sum value(s).
+
+        """
+        statistic = self.__record(data, DiffPrivStatisticKind.sum, epsilon, axis)
+        return statistic
+
+    def mean(self, data, epsilon, axis=None):
+        """
+        Records an anonymized mean (see `DiffPrivStatistics.mean`).
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The data to retrieve the mean value(s) from.
+        epsilon : float
+            The privacy budget.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to obtain the mean value(s).
+
+        Returns
+        -------
+        `DiffPrivLazyStatistic`
+            The deferred mean value(s).
+
+        """
+        statistic = self.__record(data, DiffPrivStatisticKind.mean, epsilon, axis)
+        return statistic
+
+    def variance(self, data, epsilon, axis=None):
+        """
+        Records an anonymized variance (see `DiffPrivStatistics.variance`).
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The data to retrieve the variance value(s) from.
+        epsilon : float
+            The privacy budget.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to obtain the variance value(s).
+
+        Returns
+        -------
+        `DiffPrivLazyStatistic`
+            The deferred variance value(s).
+
+        """
+        statistic = self.__record(data, DiffPrivStatisticKind.variance, epsilon, axis)
+        return statistic
+
+    @classmethod
+    def scan(cls, data, axis=None, conditions=None, aggregate=True, dtype=None):
+        """
+        Reads the data once in chunks of about `DiffPrivAggregate.chunk_size` values
+        (or a single row) along its first axis, aggregating each chunk and counting
+        the values matching each condition while the chunk is cache resident.
+
+        Parameters
+        ----------
+        data : list|ndarray|memmap
+            The data to scan.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to aggregate and count the data.
+        [conditions] : dict
+            The conditions (functions applied to each chunk or `DiffPrivPredicate`)
+            to count the matching values of, by key.
+        [aggregate] : bool
+            Indicates whether or not to aggregate the data.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the sum, mean
+            and variance. When `None`, double precision is used.
+
+        Returns
+        -------
+        tuple
+            The `DiffPrivAggregate` of the data (or `None`), the dictionary of the
+            count(s) of matching values by condition key and the total number of
+            values.
+
+        """
+        conditions = {} if conditions is None else conditions
+        data = data if DiffPrivStorage.is_mapped(data) else np.asarray(data)
+        data = np.reshape(data, 1) if data.ndim == 0 else data
+        if axis is None:
+            data = np.reshape(data, -1)
+            axes = None
+            n = data.size
+        else:
+            axes = tuple(int(index) % data.ndim for index in np.atleast_1d(axis))
+            n = int(np.prod([data.shape[index] for index in axes]))
+
+        chunk_size = DiffPrivAggregate.chunk_size
+        row_size = int(np.prod(data.shape[1:]))
+        chunk_bytes = max(1, chunk_size // max(1, row_size)) * row_size * data.itemsize
+        depth = max(
+            [
+                condition.depth
+                for condition in conditions.values()
+                if isinstance(condition, DiffPrivPredicate)
+            ],
+            default=-1,
+        )
+        buffers = [
+            np.empty(max(chunk_size, row_size), dtype=bool) for _ in range(depth + 1)
+        ]
+        counts = {key: [] for key in conditions}
+
+        def chunks():
+            for chunk in DiffPrivStorage.chunks(data, chunk_bytes):
+                views = [
+                    buffer[: chunk.size].reshape(chunk.shape) for buffer in buffers
+                ]
+                for key, condition in conditions.items():
+                    if isinstance(condition, DiffPrivPredicate):
+                        mask = condition.evaluate(chunk, views[0], buffers=views[1:])
+                    else:
+                        mask = condition(chunk)
+
+                    counts[key].append(np.count_nonzero(mask, axis=axes))
+
+                yield chunk
+
+        if aggregate:
+            aggregate = DiffPrivAggregate.from_chunks(chunks(), axis=axes, dtype=dtype)
+        else:
+            aggregate = None
+            for _ in chunks():
+                pass
+
+        for key, values in counts.items():
+            if axes is None or 0 in axes:
+                counts[key] = np.sum(values, axis=0)
+            else:
+                counts[key] = np.concatenate(values)
+
+        return aggregate, counts, n
+
+    def compute(self):
+        """
+        Computes all the recorded statistics which are not computed yet with a
+        single fused scan per data and axis and a single batched noise draw.
+
+        Returns
+        -------
+        list
+            The anonymized values of all the recorded statistics in the order they
+            were recorded.
+
+        """
+        dtype = self.__dtype
+        pending = []
+        for source in self.__sources.values():
+            statistics = [
+                (statistic, condition_key)
+                for statistic, condition_key in source["statistics"]
+                if not self.is_computed(statistic)
+            ]
+            if not statistics:
+                continue
+
+            data = DiffPrivStorage.load(source["data"])
+            axis = source["axis"]
+            aggregate = None
+            counts = {}
+            n = 1
+            if source["aggregate"] or source["conditions"]:
+                aggregate, counts, n = self.scan(
+                    data,
+                    axis=axis,
+                    conditions=source["conditions"],
+                    aggregate=source["aggregate"],
+                    dtype=dtype,
+                )
+
+            median = None
+            if source["median"]:
+                if DiffPrivStorage.is_mapped(data):
+                    median = DiffPrivStatistics.calculate_median(data, axis=axis)
+                else:
+                    median = np.median(data, axis=axis)
+
+            for statistic, condition_key in statistics:
+                kind = statistic.kind
+                lower = 0.0
+                upper = 0.0
+                if kind == DiffPrivStatisticKind.median:
+                    value = median
+                elif condition_key is not None:
+                    value = counts[condition_key]
+                elif kind in (
+                    DiffPrivStatisticKind.count,
+                    DiffPrivStatisticKind.proportion,
+                ):
+                    value = aggregate.count
+                else:
+                    value = getattr(aggregate, kind.name)
+                    lower = aggregate.min
+                    upper = aggregate.max
+
+                if kind == DiffPrivStatisticKind.proportion:
+                    value = np.divide(value, n, dtype=dtype)
+
+                pending.append((statistic, value, lower, upper, n))
+
+        if pending:
+            shapes = [np.shape(value) for _, value, _, _, _ in pending]
+            sizes = [int(np.prod(shape)) for shape in shapes]
+            anonymized = DiffPrivLaplaceMechanism.anonymize_batch_with_budget(
+                np.concatenate([np.ravel(value) for _, value, _, _, _ in pending]),
+                np.repeat(
+                    BatchGlobalSensitivity.encode(
+                        [statistic.kind.name for statistic, _, _, _, _ in pending]
+                    ),
+                    sizes,
+                ),
+                np.repeat(
+                    [statistic.epsilon for statistic, _, _, _, _ in pending], sizes
+                ),
+                lower=np.concatenate(
+                    [
+                        np.ravel(np.broadcast_to(lower, shape))
+                        for (_, _, lower, _, _), shape in zip(pending, shapes)
+                    ]
+                ),
+                upper=np.concatenate(
+                    [
+                        np.ravel(np.broadcast_to(upper, shape))
+                        for (_, _, _, upper, _), shape in zip(pending, shapes)
+                    ]
+                ),
+                n=np.repeat([n for _, _, _, _, n in pending], sizes),
+                rng=self.__rng,
+                dtype=dtype,
+            )
+            values = np.split(anonymized, np.cumsum(sizes)[:-1])
+            for (statistic, _, _, _, n), shape, value in zip(pending, shapes, values):
+                value = np.reshape(value, shape)
+                value = value[()] if value.ndim == 0 else value
+                if statistic.postprocess:
+                    if statistic.kind == DiffPrivStatisticKind.count:
+                        value = np.round(np.clip(value, 0.0, n))
+                    elif statistic.kind == DiffPrivStatisticKind.proportion:
+                        value = np.clip(value, 0.0, 1.0)
+
+                self.__results[id(statistic)] = value
+
+        results = [self.result(statistic) for statistic in self.statistics]
+        return results
+
+    def is_computed(self, statistic):
+        """
+        Indicates whether or not a recorded statistic has been computed.
+
+        Parameters
+        ----------
+        statistic : `DiffPrivLazyStatistic`
+            The statistic.
+
+        Returns
+        -------
+        bool
+            `True` when the value of the statistic is available.
+
+        """
+        value = id(statistic) in self.__results
+        return value
+
+    def result(self, statistic):
+        """
+        The anonymized value of a recorded statistic.
+
+        Parameters
+        ----------
+        statistic : `DiffPrivLazyStatistic`
+            The statistic.
+
+        Returns
+        -------
+        None|float|ndarray
+            The anonymized value(s) or `None` when not computed yet.
+
+        """
+        value = self.__results.get(id(statistic))
+        return value
+
+    @property
+    def statistics(self):
+        """
+        The recorded statistics.
+
+        Returns
+        -------
+        list
+            The `DiffPrivLazyStatistic` in the order they were recorded.
+
+        """
+        value = list(self.__statistics.values())
+        return value
+
+    @property
+    def scans(self):
+        """
+        The amount of fused scans which computing the recorded statistics takes.
+
+        Returns
+        -------
+        int
+            The amount of scans of the data.
+
+        """
+        value = sum(
+            1
+            for source in self.__sources.values()
+            if source["aggregate"] or source["conditions"]
+        )
+        return value
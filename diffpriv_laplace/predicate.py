@@ -0,0 +1,450 @@
+import re
+import numpy as np
+from abc import ABC, abstractmethod
+from diffpriv_laplace.storage import DiffPrivStorage
+from diffpriv_laplace.exceptions import DiffPrivInvalidPredicate
+
+
+class DiffPrivPredicate(ABC):
+    """
+    Predicate expression over the values of a data slice (e.g. the condition of a
+    count or a proportion) which can be inspected and is evaluated in chunks into
+    reused boolean buffers, so that counting the matching values never allocates a
+    mask of the size of the data. Predicates are either compiled from an expression
+    such as `x between 1 and 5 and not x in (2, 3)` or combined with the `&`, `|`
+    and `~` operators. Subclasses implement `evaluate`.
+    """
+
+    chunk_size = 65536
+    operators = {
+        "<": np.less,
+        "<=": np.less_equal,
+        ">": np.greater,
+        ">=": np.greater_equal,
+        "==": np.equal,
+        "!=": np.not_equal,
+    }
+    tokens = re.compile(
+        r"\s*(?:(<=|>=|==|!=|<|>|\(|\)|,)"
+        r"|([-+]?(?:inf|(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)(?!\w))"
+        r"|([A-Za-z_]\w*))"
+    )
+
+    @classmethod
+    def compile(cls, expression):
+        """
+        Compiles a predicate expression made of comparisons (`x < 1`), ranges
+        (`x between 1 and 5`, bounds included), set membership (`x in (1, 2)` or
+        `x not in (1, 2)`), `and`, `or`, `not` and parentheses, where `x` stands
+        for the values (any name is accepted).
+
+        Parameters
+        ----------
+        expression : str|DiffPrivPredicate
+            The expression. A predicate is returned as is.
+
+        Returns
+        -------
+        `DiffPrivPredicate`
+            The compiled predicate.
+
+        Raises
+        ------
+        DiffPrivInvalidPredicate
+            The exception is raised when the expression is invalid.
+
+        """
+        if isinstance(expression, DiffPrivPredicate):
+            return expression
+
+        tokens = []
+        position = 0
+        expression = expression.rstrip()
+        while position < len(expression):
+            match = cls.tokens.match(expression, position)
+            if match is None or match.end() == position:
+                raise DiffPrivInvalidPredicate(
+                    "Invalid predicate expression at {}: {}".format(
+                        position, expression
+                    )
+                )
+
+            symbol, number, name = match.groups()
+            if number is not None:
+                tokens.append(("number", float(number)))
+            elif name is not None and name.lower() in ("and", "or", "not", "in"):
+                tokens.append((name.lower(), name))
+            elif name is not None and name.lower() == "between":
+                tokens.append(("between", name))
+            elif name is not None:
+                tokens.append(("name", name))
+            else:
+                tokens.append((symbol, symbol))
+
+            position = match.end()
+
+        tokens.append(("end", None))
+        state = [tokens, 0]
+        predicate = cls.__parse_or(state)
+        cls.__expect(state, "end")
+        return predicate
+
+    @classmethod
+    def __peek(cls, state):
+        tokens, position = state
+        return tokens[position][0]
+
+    @classmethod
+    def __expect(cls, state, kind):
+        tokens, position = state
+        token_kind, value = tokens[position]
+        if token_kind != kind:
+            raise DiffPrivInvalidPredicate(
+                "Expected {} but found {} in predicate expression".format(
+                    kind, value if value is not None else "the end"
+                )
+            )
+
+        state[1] = position + 1
+        return value
+
+    @classmethod
+    def __parse_or(cls, state):
+        predicates = [cls.__parse_and(state)]
+        while cls.__peek(state) == "or":
+            cls.__expect(state, "or")
+            predicates.append(cls.__parse_and(state))
+
+        predicate = (
+            predicates[0]
+            if len(predicates) == 1
+            else DiffPrivDisjunctionPredicate(predicates)
+        )
+        return predicate
+
+    @classmethod
+    def __parse_and(cls, state):
+        predicates = [cls.__parse_not(state)]
+        while cls.__peek(state) == "and":
+            cls.__expect(state, "and")
+            predicates.append(cls.__parse_not(state))
+
+        predicate = (
+            predicates[0]
+            if len(predicates) == 1
+            else DiffPrivConjunctionPredicate(predicates)
+        )
+        return predicate
+
+    @classmethod
+    def __parse_not(cls, state):
+        if cls.__peek(state) == "not":
+            cls.__expect(state, "not")
+            return DiffPrivNegationPredicate(cls.__parse_not(state))
+
+        if cls.__peek(state) == "(":
+            cls.__expect(state, "(")
+            predicate = cls.__parse_or(state)
+            cls.__expect(state, ")")
+            return predicate
+
+        cls.__expect(state, "name")
+        kind = cls.__peek(state)
+        if kind in cls.operators:
+            cls.__expect(state, kind)
+            predicate = DiffPrivComparisonPredicate(kind, cls.__expect(state, "number"))
+        elif kind == "between":
+            cls.__expect(state, "between")
+            lower = cls.__expect(state, "number")
+            cls.__expect(state, "and")
+            predicate = DiffPrivRangePredicate(lower, cls.__expect(state, "number"))
+        else:
+            negated = kind == "not"
+            if negated:
+                cls.__expect(state, "not")
+
+            cls.__expect(state, "in")
+            cls.__expect(state, "(")
+            members = [cls.__expect(state, "number")]
+            while cls.__peek(state) == ",":
+                cls.__expect(state, ",")
+                members.append(cls.__expect(state, "number"))
+
+            cls.__expect(state, ")")
+            predicate = DiffPrivMembershipPredicate(members)
+            predicate = DiffPrivNegationPredicate(predicate) if negated else predicate
+
+        return predicate
+
+    @property
+    def depth(self):
+        """
+        The amount of scratch buffers needed to evaluate the predicate.
+
+        Returns
+        -------
+        int
+            The amount of buffers.
+
+        """
+        return 0
+
+    @abstractmethod
+    def evaluate(self, values, out, buffers=()):
+        """
+        Evaluates the predicate in place.
+
+        Parameters
+        ----------
+        values : ndarray
+            The values.
+        out : ndarray
+            The boolean buffer, of the shape of `values`, to write the result into.
+        [buffers] : list|tuple
+            At least `depth` boolean scratch buffers of the shape of `values`.
+
+        Returns
+        -------
+        ndarray
+            The `out` buffer.
+
+        """
+        raise NotImplementedError()
+
+    def count(self, data, axis=None, weights=None, dtype=None):
+        """
+        Counts the values matching the predicate by evaluating it in chunks of
+        `chunk_size` values (or a single row) along the first axis of the data.
+
+        Parameters
+        ----------
+        data : list|ndarray|memmap
+            The data.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to count the matching values.
+        [weights] : list|ndarray|memmap
+            The weight of each value, of the shape of the data. When provided, the
+            weights of the matching values are summed instead of counting them.
+        [dtype] : None|dtype
+            The precision used to sum the weights.
+
+        Returns
+        -------
+        tuple
+            The count(s) (or summed weights) of matching values and the total number
+            of values.
+
+        """
+        data = data if DiffPrivStorage.is_mapped(data) else np.asarray(data)
+        data = np.reshape(data, 1) if data.ndim == 0 else data
+        if weights is not None:
+            weights = np.reshape(weights, data.shape)
+
+        if axis is None:
+            data = np.reshape(data, -1)
+            weights = None if weights is None else np.reshape(weights, -1)
+            axes = None
+            n = data.size
+        else:
+            axes = tuple(int(index) % data.ndim for index in np.atleast_1d(axis))
+            n = int(np.prod(np.take(data.shape, axes)))
+
+        row_size = int(np.prod(data.shape[1:]))
+        size = max(self.chunk_size, row_size)
+        buffers = [np.empty(size, dtype=bool) for _ in range(self.depth + 1)]
+        chunk_bytes = max(1, self.chunk_size // max(1, row_size)) * row_size
+        value = 0
+        counts = []
+        start = 0
+        for chunk in DiffPrivStorage.chunks(data, chunk_bytes * data.itemsize):
+            views = [buffer[: chunk.size].reshape(chunk.shape) for buffer in buffers]
+            mask = self.evaluate(chunk, views[0], buffers=views[1:])
+            if weights is None:
+                chunk_count = np.count_nonzero(mask, axis=axes)
+            else:
+                chunk_weights = np.asarray(weights[start : start + len(chunk)])
+                chunk_count = np.sum(chunk_weights, axis=axes, where=mask, dtype=dtype)
+
+            start = start + len(chunk)
+            if axes is None or 0 in axes:
+                value = value + chunk_count
+            else:
+                counts.append(chunk_count)
+
+        if counts:
+            value = np.concatenate(counts)
+
+        return value, n
+
+    def __call__(self, data):
+        values = np.asarray(data)
+        buffers = [np.empty(values.shape, dtype=bool) for _ in range(self.depth + 1)]
+        mask = self.evaluate(values, buffers[0], buffers=buffers[1:])
+        return mask
+
+    def __and__(self, other):
+        return DiffPrivConjunctionPredicate([self, DiffPrivPredicate.compile(other)])
+
+    def __or__(self, other):
+        return DiffPrivDisjunctionPredicate([self, DiffPrivPredicate.compile(other)])
+
+    def __invert__(self):
+        return DiffPrivNegationPredicate(self)
+
+    def __repr__(self):
+        return "DiffPrivPredicate({!r})".format(str(self))
+
+
+class DiffPrivComparisonPredicate(DiffPrivPredicate):
+    """
+    Compares the values to a number (e.g. `x >= 1`).
+    """
+
+    def __init__(self, operator, value):
+        super().__init__()
+        self.__operator = operator
+        self.__value = float(value)
+
+    def evaluate(self, values, out, buffers=()):
+        self.operators[self.__operator](values, self.__value, out=out)
+        return out
+
+    def __str__(self):
+        return "x {} {!r}".format(self.__operator, self.__value)
+
+
+class DiffPrivRangePredicate(DiffPrivPredicate):
+    """
+    Matches the values within inclusive bounds (e.g. `x between 1 and 5`).
+    """
+
+    def __init__(self, lower, upper):
+        super().__init__()
+        self.__lower = float(lower)
+        self.__upper = float(upper)
+
+    @property
+    def depth(self):
+        return 1
+
+    def evaluate(self, values, out, buffers=()):
+        np.greater_equal(values, self.__lower, out=out)
+        np.less_equal(values, self.__upper, out=buffers[0])
+        np.logical_and(out, buffers[0], out=out)
+        return out
+
+    def __str__(self):
+        return "x between {!r} and {!r}".format(self.__lower, self.__upper)
+
+
+class DiffPrivMembershipPredicate(DiffPrivPredicate):
+    """
+    Matches the values equal to any of a set of numbers (e.g. `x in (1, 2)`). Small
+    sets are compared in place member by member, larger ones use `np.isin`.
+    """
+
+    members_size = 16
+
+    def __init__(self, members):
+        super().__init__()
+        self.__members = np.unique(np.asarray(members, dtype=np.float64))
+
+    @property
+    def depth(self):
+        return 1
+
+    def evaluate(self, values, out, buffers=()):
+        if self.__members.size > self.members_size:
+            np.copyto(out, np.isin(values, self.__members))
+            return out
+
+        np.equal(values, self.__members[0], out=out)
+        for member in self.__members[1:]:
+            np.equal(values, member, out=buffers[0])
+            np.logical_or(out, buffers[0], out=out)
+
+        return out
+
+    def __str__(self):
+        members = ", ".join(repr(float(member)) for member in self.__members)
+        return "x in ({})".format(members)
+
+
+class DiffPrivNegationPredicate(DiffPrivPredicate):
+    """
+    Negates a predicate (e.g. `not x < 1`).
+    """
+
+    def __init__(self, predicate):
+        super().__init__()
+        self.__predicate = predicate
+
+    @property
+    def depth(self):
+        return self.__predicate.depth
+
+    def evaluate(self, values, out, buffers=()):
+        self.__predicate.evaluate(values, out, buffers=buffers)
+        np.logical_not(out, out=out)
+        return out
+
+    def __str__(self):
+        return "not ({})".format(self.__predicate)
+
+
+class DiffPrivConjunctionPredicate(DiffPrivPredicate):
+    """
+    Matches the values matching all of its predicates. The remaining predicates
+    are skipped as soon as no value of the chunk matches.
+    """
+
+    def __init__(self, predicates):
+        super().__init__()
+        self.__predicates = list(predicates)
+
+    @property
+    def depth(self):
+        return 1 + max(predicate.depth for predicate in self.__predicates)
+
+    def evaluate(self, values, out, buffers=()):
+        self.__predicates[0].evaluate(values, out, buffers=buffers[1:])
+        for predicate in self.__predicates[1:]:
+            if not out.any():
+                break
+
+            predicate.evaluate(values, buffers[0], buffers=buffers[1:])
+            np.logical_and(out, buffers[0], out=out)
+
+        return out
+
+    def __str__(self):
+        return " and ".join("({})".format(predicate) for predicate in self.__predicates)
+
+
+class DiffPrivDisjunctionPredicate(DiffPrivPredicate):
+    """
+    Matches the values matching any of its predicates. The remaining predicates
+    are skipped as soon as all the values of the chunk match.
+    """
+
+    def __init__(self, predicates):
+        super().__init__()
+        self.__predicates = list(predicates)
+
+    @property
+    def depth(self):
+        return 1 + max(predicate.depth for predicate in self.__predicates)
+
+    def evaluate(self, values, out, buffers=()):
+        self.__predicates[0].evaluate(values, out, buffers=buffers[1:])
+        for predicate in self.__predicates[1:]:
+            if out.all():
+                break
+
+            predicate.evaluate(values, buffers[0], buffers=buffers[1:])
+            np.logical_or(out, buffers[0], out=out)
+
+        return out
+
+    def __str__(self):
+        return " or ".join("({})".format(predicate) for predicate in self.__predicates)
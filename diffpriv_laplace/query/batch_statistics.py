@@ -0,0 +1,199 @@
+import numpy as np
+from diffpriv_laplace.lazy import DiffPrivLazyStatistics
+from diffpriv_laplace.statistics import DiffPrivStatisticKind
+from diffpriv_laplace.storage import DiffPrivStorage
+from diffpriv_laplace.query.sequential_statistics import (
+    DiffPrivSequentialStatisticsQuery,
+)
+from diffpriv_laplace.exceptions import (
+    DiffPrivInvalidQuery,
+    DiffPrivMissingParameter,
+    DiffPrivSizeMismatch,
+)
+
+
+class DiffPrivBatchStatisticsQuery(object):
+    """
+    The batch statistics query class, which executes many independent sequential
+    or parallel composition queries against the same data at once. The exact
+    aggregates of all the queries are computed in a single chunked scan of the
+    data per distinct axis and the anonymized statistics are drawn with a single
+    batched noise draw, while each query keeps its own privacy budget.
+    """
+
+    compositions = ("sequential", "parallel")
+    statistic_kinds = (
+        DiffPrivStatisticKind.count,
+        DiffPrivStatisticKind.min,
+        DiffPrivStatisticKind.max,
+        DiffPrivStatisticKind.median,
+        DiffPrivStatisticKind.proportion,
+        DiffPrivStatisticKind.sum,
+        DiffPrivStatisticKind.mean,
+        DiffPrivStatisticKind.variance,
+    )
+
+    @classmethod
+    def calculate_query_epsilon(cls, query):
+        """
+        Calculates the privacy budget to use for each statistic of a query.
+
+        Parameters
+        ----------
+        query : dict
+            The query holding the `"kinds"`, the `"epsilon"` and the optional
+            `"composition"` (see `query`).
+
+        Returns
+        -------
+        float
+            The calculated privacy budget to use for each statistic.
+
+        Raises
+        ------
+        DiffPrivMissingParameter
+            The exception is raised when the `"kinds"` or the `"epsilon"` of the
+            query is missing.
+        DiffPrivInvalidQuery
+            The exception is raised when the composition of the query is neither
+            `"sequential"` nor `"parallel"`.
+
+        """
+        for name in ("kinds", "epsilon"):
+            if name not in query:
+                raise DiffPrivMissingParameter(
+                    "The `{}` of the query is missing!".format(name)
+                )
+
+        composition = query.get("composition", "sequential")
+        if composition not in cls.compositions:
+            raise DiffPrivInvalidQuery(
+                "Invalid query composition! [{}]".format(composition)
+            )
+
+        kinds = query["kinds"]
+        epsilon = query["epsilon"]
+        if composition == "sequential" and isinstance(kinds, list):
+            epsilon = DiffPrivSequentialStatisticsQuery.calculate_query_epsilon(
+                kinds, epsilon
+            )
+
+        return epsilon
+
+    @classmethod
+    def query(cls, data, queries, dtype=None, rng=None):
+        """
+        Performs a batch of queries against the same data. Each query is a
+        dictionary holding:
+
+        - `"kinds"`: the `DiffPrivStatisticKind` (or list of them, one for each
+          data slice) to perform.
+        - `"epsilon"`: the privacy budget of the query.
+        - `"axis"` [optional]: the axis or tuple of axes along which to obtain the
+          anonymized statistic value(s).
+        - `"composition"` [optional]: either `"sequential"` (default), which
+          splits the budget amongst the statistics of the query, or `"parallel"`,
+          which uses the budget for each statistic.
+        - `"condition"` [optional]: a condition function or predicate (see
+          `DiffPrivLazyStatistics.count`) for the count and the proportion.
+
+        Every statistic draws its own noise, therefore the results are the same
+        (in distribution) as performing each query separately.
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The data to retrieve the anonymized statistic value(s) from.
+        queries : list
+            The queries to perform.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reductions,
+            the noise and the post-processing. When `None`, double precision is
+            used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. A seed creates a
+            new generator on each call, so that every call is reproducible: to
+            draw independent noise across batches, pass the same `Generator` (or
+            sampler object) to each call instead. When `None`, the numpy legacy
+            global random state is used.
+
+        Returns
+        -------
+        list
+            The results of each query, which are the list of anonymized statistics
+            requested for each data slice.
+
+        Raises
+        ------
+        DiffPrivInvalidDimensions
+            The exception is raised when the data dimension is invalid.
+        DiffPrivMissingParameter
+            The exception is raised when the `"kinds"` or the `"epsilon"` of a
+            query is missing.
+        DiffPrivInvalidQuery
+            The exception is raised when the composition of a query is invalid.
+        DiffPrivSizeMismatch
+            The exception is raised when the length of the `"kinds"` list of a
+            query is of different size than the amount of data slices in `data`
+            defined through its `"axis"`.
+
+        """
+        data = DiffPrivStorage.load(data)
+        if not DiffPrivStorage.is_mapped(data):
+            data = np.asarray(data)
+
+        graph = DiffPrivLazyStatistics(rng=rng, dtype=dtype, shared=False)
+        records = []
+        for query in queries:
+            epsilon = cls.calculate_query_epsilon(query)
+            kinds = query["kinds"]
+            kinds = kinds if isinstance(kinds, list) else [kinds]
+            axis = 0 if data.ndim == 1 else query.get("axis")
+            iter_axis, reduce_axis = DiffPrivStorage.data_slice_axes(data, axis)
+            n = int(np.prod([data.shape[index] for index in iter_axis]))
+            if n != len(kinds):
+                raise DiffPrivSizeMismatch(
+                    "Data slices and kind have different sizes! [{} != {}]".format(
+                        n, len(kinds)
+                    )
+                )
+
+            flags = np.array(
+                [kind.value if kind else 0 for kind in kinds], dtype=np.int64
+            )
+            statistics = []
+            for kind in cls.statistic_kinds:
+                indices = np.flatnonzero(flags & kind.value)
+                if indices.size == 0:
+                    continue
+
+                record = getattr(graph, kind.name)
+                if kind in (
+                    DiffPrivStatisticKind.count,
+                    DiffPrivStatisticKind.proportion,
+                ):
+                    statistic = record(
+                        data,
+                        epsilon,
+                        condition=query.get("condition"),
+                        axis=reduce_axis,
+                    )
+                else:
+                    statistic = record(data, epsilon, axis=reduce_axis)
+
+                statistics.append((kind, indices, statistic))
+
+            records.append((kinds, statistics))
+
+        graph.compute()
+        results = []
+        for kinds, statistics in records:
+            result = [{} if kind else None for kind in kinds]
+            for kind, indices, statistic in statistics:
+                value = np.ravel(statistic.value)
+                for index in indices:
+                    result[index][kind] = value[index]
+
+            results.append(result)
+
+        return results
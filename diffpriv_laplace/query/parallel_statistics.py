@@ -7,7 +7,7 @@ class DiffPrivParallelStatisticsQuery(object):
     """
 
     @classmethod
-    def query(cls, data, kinds, epsilon, axis=None):
+    def query(cls, data, kinds, epsilon, axis=None, dtype=None, rng=None):
         """
         Performs parallel composition by decomposing a multiple statistic queries
         into sub-queries (each subset assigned to each data slice) which use the
@@ -16,7 +16,7 @@ class DiffPrivParallelStatisticsQuery(object):
 
         Parameters
         ----------
-        data : list|ndarray
+        data : list|ndarray|str|memmap
             The data to retrieve the anonymized statistic value(s) from.
         kinds : DiffPrivStatisticKind|list
             The kind of statistics to perform on each data slice. If a `None` value
@@ -27,6 +27,12 @@ class DiffPrivParallelStatisticsQuery(object):
         [axis] : int|tuple
             Axis or tuple of axes along which to obtain the anonymized statistic
             value(s).
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
 
         Returns
         -------
@@ -44,6 +50,6 @@ class DiffPrivParallelStatisticsQuery(object):
 
         """
         results = DiffPrivStatistics.apply_kind_on_data_slice(
-            data, kinds, epsilon, axis=axis
+            data, kinds, epsilon, axis=axis, dtype=dtype, rng=rng
         )
         return results
@@ -0,0 +1,389 @@
+import numpy as np
+from diffpriv_laplace.aggregate import DiffPrivAggregate
+from diffpriv_laplace.global_sensitivity.batch import BatchGlobalSensitivity
+from diffpriv_laplace.laplace_mechanism import DiffPrivLaplaceMechanism
+from diffpriv_laplace.selection import DiffPrivSelection
+from diffpriv_laplace.statistics import DiffPrivStatistics, DiffPrivStatisticKind
+from diffpriv_laplace.storage import DiffPrivStorage
+from diffpriv_laplace.exceptions import DiffPrivSizeMismatch
+
+
+class DiffPrivQueryPlan(object):
+    """
+    Execution plan of a multi-kind, multi-slice statistics query. The plan works
+    out the minimal set of exact aggregates (e.g. the count, min, max, sum and sum
+    of squared deviations) that the requested kinds of all data slices derive
+    from, computes them once in a single chunked pass and anonymizes all the
+    statistics with a single batched noise draw. The steps of the plan, with
+    their estimated passes over the data and bytes scanned, can be inspected
+    before executing it.
+    """
+
+    requirements = {
+        DiffPrivStatisticKind.count: ("count",),
+        DiffPrivStatisticKind.min: ("min",),
+        DiffPrivStatisticKind.max: ("max",),
+        DiffPrivStatisticKind.median: ("median",),
+        DiffPrivStatisticKind.proportion: ("count",),
+        DiffPrivStatisticKind.sum: ("sum", "min", "max"),
+        DiffPrivStatisticKind.mean: ("sum", "min", "max"),
+        DiffPrivStatisticKind.variance: ("sum", "m2", "min", "max"),
+    }
+    reductions = {"count": np.count_nonzero, "min": np.min, "max": np.max}
+
+    def __init__(self, data, kinds, epsilon, axis=None, dtype=None):
+        """
+        Plans the statistics of each data slice.
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The data to retrieve the anonymized statistic value(s) from.
+        kinds : DiffPrivStatisticKind|list
+            The kind of statistics to perform on each data slice. If a `None` value
+            is provided the corresponding statistics calculation for the data slice
+            is skipped.
+        epsilon : float
+            The privacy budget of each statistic.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to obtain the anonymized statistic
+            value(s) (see `DiffPrivStatistics.apply_kind_on_data_slice`).
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+
+        Raises
+        ------
+        DiffPrivInvalidDimensions
+            The exception is raised when the data is a scalar or when `axis` is
+            empty or out of the data dimensions.
+        DiffPrivSizeMismatch
+            The exception is raised when the length of the `kinds` list is of
+            different size than the amount of data slices in `data` defined
+            through `axis`.
+
+        """
+        super().__init__()
+        kinds = kinds if isinstance(kinds, list) else [kinds]
+        data = DiffPrivStorage.load(data)
+        if not DiffPrivStorage.is_mapped(data):
+            data = np.asarray(data)
+
+        if data.ndim == 1:
+            axis = 0
+
+        iter_axis, reduce_axis = DiffPrivStorage.data_slice_axes(data, axis)
+        shape = tuple(data.shape[index] for index in iter_axis)
+        n = int(np.prod(shape))
+        if n != len(kinds):
+            raise DiffPrivSizeMismatch(
+                "Data slices and kind have different sizes! [{} != {}]".format(
+                    n, len(kinds)
+                )
+            )
+
+        self.__data = data
+        self.__kinds = kinds
+        self.__epsilon = epsilon
+        self.__dtype = dtype
+        self.__iter_axis = iter_axis
+        self.__reduce_axis = reduce_axis
+        self.__shape = shape
+        self.__n = int(np.prod([data.shape[index] for index in reduce_axis]))
+        self.__flags = np.array(
+            [kind.value if kind else 0 for kind in kinds], dtype=np.int64
+        )
+        self.__steps = self.__plan()
+
+    def __slices(self, indices):
+        if indices.size == len(self.__kinds) or DiffPrivStorage.is_mapped(self.__data):
+            return self.__data, self.__reduce_axis
+
+        data_slices = np.moveaxis(
+            self.__data, self.__iter_axis, range(len(self.__iter_axis))
+        )
+        data_slices = data_slices[np.unravel_index(indices, self.__shape)]
+        axis = tuple(range(1, data_slices.ndim))
+        return data_slices, axis
+
+    def __plan(self):
+        steps = []
+        slice_bytes = self.__n * self.__data.itemsize
+        aggregates = set()
+        for kind, names in self.requirements.items():
+            if kind != DiffPrivStatisticKind.median and np.any(
+                self.__flags & kind.value
+            ):
+                aggregates.update(names)
+
+        if aggregates:
+            indices = np.flatnonzero(self.__flags & ~DiffPrivStatisticKind.median.value)
+            if DiffPrivStorage.is_mapped(self.__data):
+                scanned = self.__data.nbytes
+            else:
+                scanned = indices.size * slice_bytes
+
+            names = ("count", "min", "max", "sum", "m2")
+            steps.append(
+                {
+                    "step": "aggregate",
+                    "aggregates": tuple(name for name in names if name in aggregates),
+                    "slices": indices,
+                    "passes": 1,
+                    "bytes": scanned,
+                }
+            )
+
+        indices = np.flatnonzero(self.__flags & DiffPrivStatisticKind.median.value)
+        if indices.size:
+            if DiffPrivStorage.is_mapped(self.__data):
+                buckets = DiffPrivSelection.buckets
+                refinements = np.log(max(1.0, self.__n / buckets)) / np.log(buckets)
+                passes = indices.size * (2 + int(np.ceil(refinements)))
+                if 0 in self.__iter_axis:
+                    scanned = passes * slice_bytes
+                else:
+                    scanned = passes * self.__data.nbytes
+            else:
+                passes = 1
+                scanned = indices.size * slice_bytes
+
+            steps.append(
+                {
+                    "step": "median",
+                    "aggregates": ("median",),
+                    "slices": indices,
+                    "passes": passes,
+                    "bytes": scanned,
+                }
+            )
+
+        return steps
+
+    def __aggregate(self, names, data_slices, axis):
+        chunks = DiffPrivStorage.chunks(data_slices)
+        if "sum" in names or "m2" in names:
+            aggregate = DiffPrivAggregate.from_chunks(
+                chunks, axis=axis, dtype=self.__dtype
+            )
+            values = {
+                "count": aggregate.count,
+                "min": aggregate.min,
+                "max": aggregate.max,
+                "sum": aggregate.sum,
+                "mean": aggregate.mean,
+                "variance": aggregate.variance,
+            }
+            return values
+
+        partials = {name: [] for name in names}
+        for chunk in chunks:
+            for name in names:
+                partials[name].append(self.reductions[name](chunk, axis=axis))
+
+        values = {}
+        for name, partial in partials.items():
+            if 0 in axis:
+                combine = np.sum if name == "count" else self.reductions[name]
+                values[name] = combine(partial, axis=0)
+            else:
+                values[name] = np.concatenate(partial)
+
+        return values
+
+    def execute(self, rng=None):
+        """
+        Executes the plan.
+
+        Parameters
+        ----------
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+
+        Returns
+        -------
+        list
+            The list of anonymized statistics requested and calculated for each data
+            slice.
+
+        """
+        dtype = self.__dtype
+        n = self.__n
+        results = [{} if kind else None for kind in self.__kinds]
+        columns = {}
+        for step in self.__steps:
+            indices = step["slices"]
+            data_slices, axis = self.__slices(indices)
+            if step["step"] == "aggregate":
+                values = self.__aggregate(step["aggregates"], data_slices, axis)
+            elif DiffPrivStorage.is_mapped(data_slices):
+                value = DiffPrivStatistics.calculate_median(
+                    data_slices, axis=axis, indices=indices
+                )
+                values = {"median": value}
+            else:
+                values = {"median": np.median(data_slices, axis=axis)}
+
+            for name, value in values.items():
+                value = np.ravel(value)
+                if value.size > indices.size:
+                    value = value[indices]
+
+                column = np.zeros(len(self.__kinds), dtype=value.dtype)
+                column[indices] = value
+                columns[name] = column
+
+        batch = []
+        for kind in self.requirements:
+            indices = np.flatnonzero(self.__flags & kind.value)
+            if indices.size == 0:
+                continue
+
+            if kind == DiffPrivStatisticKind.proportion:
+                value = np.divide(columns["count"][indices], n, dtype=dtype)
+            else:
+                value = columns[kind.name][indices]
+
+            if "sum" in self.requirements[kind]:
+                lower = np.asarray(columns["min"][indices], dtype=dtype)
+                upper = np.asarray(columns["max"][indices], dtype=dtype)
+            else:
+                lower = np.zeros(indices.size, dtype=dtype)
+                upper = np.zeros(indices.size, dtype=dtype)
+
+            batch.append((kind, indices, value, lower, upper))
+
+        if not batch:
+            return results
+
+        anonymized = DiffPrivLaplaceMechanism.anonymize_batch_with_budget(
+            np.concatenate([value for _, _, value, _, _ in batch]),
+            np.concatenate(
+                [
+                    np.full(indices.size, code)
+                    for (_, indices, _, _, _), code in zip(
+                        batch,
+                        BatchGlobalSensitivity.encode(
+                            [kind.name for kind, _, _, _, _ in batch]
+                        ),
+                    )
+                ]
+            ),
+            self.__epsilon,
+            lower=np.concatenate([lower for _, _, _, lower, _ in batch]),
+            upper=np.concatenate([upper for _, _, _, _, upper in batch]),
+            n=n,
+            dtype=dtype,
+            rng=rng,
+        )
+        values = np.split(
+            anonymized, np.cumsum([indices.size for _, indices, _, _, _ in batch])[:-1]
+        )
+        for (kind, indices, _, _, _), value in zip(batch, values):
+            if kind == DiffPrivStatisticKind.count:
+                value = np.round(np.clip(value, 0.0, n))
+            elif kind == DiffPrivStatisticKind.proportion:
+                value = np.clip(value, 0.0, 1.0)
+
+            for index, slice_value in zip(indices, value):
+                results[index][kind] = slice_value
+
+        return results
+
+    @property
+    def kinds(self):
+        """
+        The kind of statistics of each data slice.
+
+        Returns
+        -------
+        list
+            The `DiffPrivStatisticKind` (or `None`) of each data slice.
+
+        """
+        return self.__kinds
+
+    @property
+    def epsilon(self):
+        """
+        The privacy budget of each statistic.
+
+        Returns
+        -------
+        float
+            The privacy budget.
+
+        """
+        return self.__epsilon
+
+    @property
+    def steps(self):
+        """
+        The steps of the plan. Each step is a dictionary holding its name
+        (`"step"`), the exact aggregates it computes (`"aggregates"`), the indices
+        of the data slices it reads (`"slices"`), its estimated amount of passes
+        over the data (`"passes"`) and its estimated amount of bytes scanned
+        (`"bytes"`).
+
+        Returns
+        -------
+        list
+            The steps.
+
+        """
+        return self.__steps
+
+    @property
+    def aggregates(self):
+        """
+        The exact aggregates computed by the plan.
+
+        Returns
+        -------
+        tuple
+            The names of the aggregates.
+
+        """
+        value = tuple(name for step in self.__steps for name in step["aggregates"])
+        return value
+
+    @property
+    def passes(self):
+        """
+        The estimated amount of passes over the data.
+
+        Returns
+        -------
+        int
+            The amount of passes.
+
+        """
+        value = sum(step["passes"] for step in self.__steps)
+        return value
+
+    @property
+    def bytes(self):
+        """
+        The estimated amount of bytes scanned.
+
+        Returns
+        -------
+        int
+            The amount of bytes.
+
+        """
+        value = sum(step["bytes"] for step in self.__steps)
+        return value
+
+    def __repr__(self):
+        steps = ", ".join(
+            "{}({}: {} passes, {} bytes)".format(
+                step["step"],
+                "/".join(step["aggregates"]),
+                step["passes"],
+                step["bytes"],
+            )
+            for step in self.__steps
+        )
+        return "DiffPrivQueryPlan([{}])".format(steps)
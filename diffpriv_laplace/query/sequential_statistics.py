@@ -1,5 +1,5 @@
 import numpy as np
-from diffpriv_laplace.statistics import DiffPrivStatistics
+from diffpriv_laplace.query.plan import DiffPrivQueryPlan
 
 
 class DiffPrivSequentialStatisticsQuery(object):
@@ -49,15 +49,16 @@ class DiffPrivSequentialStatisticsQuery(object):
         return query_epsilon
 
     @classmethod
-    def query(cls, data, kinds, epsilon, axis=None):
+    def plan(cls, data, kinds, epsilon, axis=None, dtype=None):
         """
-        Performs sequential composition by decomposing a multiple statistic queries
-        into sub-queries (each subset assigned to each data slice) which use a
-        portion of the defined privacy budget.
+        Plans a sequential composition query without executing it. The plan holds
+        the minimal set of exact aggregates needed by the requested kinds of all
+        the data slices, which are computed once, and the estimated amount of
+        passes over the data and bytes scanned.
 
         Parameters
         ----------
-        data : list|ndarray
+        data : list|ndarray|str|memmap
             The data to retrieve the anonymized statistic value(s) from.
         kinds : DiffPrivStatisticKind|list
             The kind of statistics to perform on each data slice. If a `None` value
@@ -68,11 +69,14 @@ class DiffPrivSequentialStatisticsQuery(object):
         [axis] : int|tuple
             Axis or tuple of axes along which to obtain the anonymized statistic
             value(s).
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
 
         Returns
         -------
-        list
-            The list of anonymized statistics requested.
+        `DiffPrivQueryPlan`
+            The plan, which is executed through `DiffPrivQueryPlan.execute`.
 
         Raises
         ------
@@ -89,7 +93,52 @@ class DiffPrivSequentialStatisticsQuery(object):
             if isinstance(kinds, list)
             else epsilon
         )
-        results = DiffPrivStatistics.apply_kind_on_data_slice(
-            data, kinds, query_epsilon, axis=axis
-        )
+        plan = DiffPrivQueryPlan(data, kinds, query_epsilon, axis=axis, dtype=dtype)
+        return plan
+
+    @classmethod
+    def query(cls, data, kinds, epsilon, axis=None, dtype=None, rng=None):
+        """
+        Performs sequential composition by decomposing a multiple statistic queries
+        into sub-queries (each subset assigned to each data slice) which use a
+        portion of the defined privacy budget. The query is executed through the
+        `DiffPrivQueryPlan` returned by `plan`.
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The data to retrieve the anonymized statistic value(s) from.
+        kinds : DiffPrivStatisticKind|list
+            The kind of statistics to perform on each data slice. If a `None` value
+            is provided the corresponding statistics calculation for the data slice
+            is skipped.
+        epsilon : float
+            The privacy budget.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to obtain the anonymized statistic
+            value(s).
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+
+        Returns
+        -------
+        list
+            The list of anonymized statistics requested.
+
+        Raises
+        ------
+        DiffPrivInvalidDimensions
+            The exception is raised when the data dimension is invalid.
+        DiffPrivSizeMismatch
+            The exception is raised when the length of the `kinds` list is of
+            different size than the amount of data slices in `data` defined
+            through `axis`.
+
+        """
+        plan = cls.plan(data, kinds, epsilon, axis=axis, dtype=dtype)
+        results = plan.execute(rng=rng)
         return results
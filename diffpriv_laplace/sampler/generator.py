@@ -0,0 +1,203 @@
+import numpy as np
+from diffpriv_laplace.exceptions import DiffPrivInvalidOutput
+
+
+class DiffPrivGenerator(object):
+    """
+    Factory of numpy random generators used to draw the Laplace noise.
+    """
+
+    @classmethod
+    def create(cls, seed=None, bit_generator=np.random.PCG64):
+        """
+        Creates a random generator from a seed.
+
+        Parameters
+        ----------
+        [seed] : None|int|SeedSequence|BitGenerator|Generator
+            The seed to create the generator from. Any object which already provides
+            a `laplace` sampling method (e.g. a `Generator`) is returned as is.
+        [bit_generator] : type
+            The bit generator class to use (e.g. `PCG64` or `SFC64`).
+
+        Returns
+        -------
+        Generator
+            The random generator.
+
+        """
+        if hasattr(seed, "laplace"):
+            return seed
+
+        if isinstance(seed, np.random.BitGenerator):
+            return np.random.Generator(seed)
+
+        seed_seq = cls.seed_sequence(seed)
+        generator = np.random.Generator(bit_generator(seed_seq))
+        return generator
+
+    @classmethod
+    def seed_sequence(cls, seed=None):
+        """
+        Retrieves the seed sequence of a seed or a random generator.
+
+        Parameters
+        ----------
+        [seed] : None|int|SeedSequence|BitGenerator|Generator
+            The seed or random generator to retrieve the seed sequence from.
+
+        Returns
+        -------
+        SeedSequence
+            The seed sequence.
+
+        """
+        if isinstance(seed, np.random.SeedSequence):
+            return seed
+
+        if isinstance(seed, np.random.Generator):
+            seed = seed.bit_generator
+
+        if isinstance(seed, np.random.BitGenerator):
+            seed_seq = getattr(seed, "seed_seq", None)
+            if seed_seq is None:
+                seed_seq = seed._seed_seq
+
+            return seed_seq
+
+        seed_seq = np.random.SeedSequence(seed)
+        return seed_seq
+
+    @classmethod
+    def spawn(cls, seed, n, bit_generator=np.random.PCG64):
+        """
+        Spawns independent child random generators.
+
+        Parameters
+        ----------
+        seed : None|int|SeedSequence|BitGenerator|Generator
+            The seed or random generator to spawn the child generators from. When a
+            random generator is provided its bit generator type is preserved.
+        n : int
+            The amount of child generators to spawn.
+        [bit_generator] : type
+            The bit generator class to use when `seed` is not a random generator.
+
+        Returns
+        -------
+        list
+            The list of independent child random generators.
+
+        """
+        if isinstance(seed, np.random.Generator):
+            bit_generator = type(seed.bit_generator)
+        elif isinstance(seed, np.random.BitGenerator):
+            bit_generator = type(seed)
+
+        seed_seq = cls.seed_sequence(seed)
+        generators = [
+            np.random.Generator(bit_generator(child)) for child in seed_seq.spawn(n)
+        ]
+        return generators
+
+    @classmethod
+    def laplace(cls, rng, loc=0.0, scale=1.0, size=None, dtype=None):
+        """
+        Draws Laplace samples with a given floating point precision.
+
+        Single precision samples drawn from a `Generator` are computed as the
+        difference of two single precision standard exponential samples, which
+        avoids drawing and converting double precision samples.
+
+        Parameters
+        ----------
+        rng : Generator|RandomState|object
+            The random generator to draw from, which provides a `laplace` method.
+        [loc] : float|list|ndarray
+            The location(s) of the distribution.
+        [scale] : float|list|ndarray
+            The scale(s) of the distribution.
+        [size] : int|tuple
+            Output shape.
+        [dtype] : None|dtype
+            The floating point precision of the samples (e.g. `float32`). When
+            `None`, double precision samples are drawn.
+
+        Returns
+        -------
+        float|ndarray
+            The drawn sample(s).
+
+        """
+        if dtype is None or np.dtype(dtype) == np.float64:
+            samples = rng.laplace(loc=loc, scale=scale, size=size)
+            return samples
+
+        dtype = np.dtype(dtype)
+        shape = np.broadcast(loc, scale).shape if size is None else size
+        if isinstance(rng, np.random.Generator) and dtype == np.float32:
+            samples = rng.standard_exponential(size=shape, dtype=dtype)
+            samples -= rng.standard_exponential(size=shape, dtype=dtype)
+        else:
+            samples = np.asarray(rng.laplace(size=shape), dtype=dtype)
+
+        samples = np.add(np.multiply(samples, scale, dtype=dtype), loc, dtype=dtype)
+        if size is None and samples.ndim == 0:
+            samples = samples[()]
+
+        return samples
+
+    @classmethod
+    def discrete_laplace(cls, rng, loc=0, scale=1.0, size=None, dtype=np.int64):
+        """
+        Draws discrete Laplace (two-sided geometric) samples.
+
+        The samples are computed as the difference of two geometric samples with
+        success probability `1 - exp(-1 / scale)`.
+
+        Parameters
+        ----------
+        rng : Generator|RandomState|object
+            The random generator to draw from, which provides a `geometric` method.
+        [loc] : int|list|ndarray
+            The integer location(s) of the distribution.
+        [scale] : float|list|ndarray
+            The scale(s) of the distribution.
+        [size] : int|tuple
+            Output shape.
+        [dtype] : dtype
+            The integer type of the samples (e.g. `int64` or `int32`).
+
+        Returns
+        -------
+        int|ndarray
+            The drawn sample(s).
+
+        Raises
+        ------
+        DiffPrivInvalidOutput
+            The exception is raised when a sample is out of the range of `dtype`.
+
+        """
+        shape = np.broadcast(loc, scale).shape if size is None else size
+        p = -np.expm1(np.divide(-1.0, scale))
+        noise = rng.geometric(p, size=shape)
+        noise -= rng.geometric(p, size=shape)
+        loc = np.asarray(loc)
+        if not np.issubdtype(loc.dtype, np.integer):
+            loc = np.rint(loc)
+
+        samples = np.add(loc, noise)
+        info = np.iinfo(dtype)
+        if samples.size and (np.min(samples) < info.min or np.max(samples) > info.max):
+            raise DiffPrivInvalidOutput(
+                "Samples out of the {} range! [{}, {}]".format(
+                    info.dtype, np.min(samples), np.max(samples)
+                )
+            )
+
+        samples = samples.astype(dtype)
+        if size is None and samples.ndim == 0:
+            samples = samples[()]
+
+        return samples
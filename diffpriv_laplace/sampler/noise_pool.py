@@ -0,0 +1,233 @@
+import threading
+import weakref
+import numpy as np
+from diffpriv_laplace.sampler.generator import DiffPrivGenerator
+
+
+class DiffPrivNoisePool(object):
+    """
+    Ring buffer of pre-drawn unit scale Laplace samples which is refilled in bulk,
+    optionally from a background thread. Noise is served by scaling buffered samples
+    so that it can be used in place of a random generator (i.e. as `rng`) for low
+    latency anonymization of scalar values.
+
+    The background thread only holds a weak reference to the pool, so that an
+    unreferenced pool is garbage collected and its thread stops. Use `close` (or
+    the pool as a context manager) to stop the thread deterministically.
+    """
+
+    scalar_types = (float, int, np.number)
+
+    def __init__(self, rng=None, capacity=65536, threshold=0.5, background=True):
+        """
+        Initialize the noise pool and fill its buffer.
+
+        Parameters
+        ----------
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the buffered samples.
+        [capacity] : int
+            The amount of samples the buffer holds.
+        [threshold] : float
+            The fraction of the capacity under which a refill is triggered.
+        [background] : bool
+            Indicates whether or not to refill the buffer from a background thread.
+            Otherwise, the buffer is refilled when drawing from an empty buffer.
+
+        """
+        super().__init__()
+        self.__rng = DiffPrivGenerator.create(rng)
+        self.__capacity = int(capacity)
+        self.__threshold = int(self.__capacity * threshold)
+        self.__buffer = np.empty(self.__capacity)
+        self.__head = 0
+        self.__count = 0
+        self.__lock = threading.Lock()
+        self.__rng_lock = threading.Lock()
+        self.__refill_event = threading.Event()
+        self.__closed = False
+        self.__thread = None
+        self.refill()
+        if background:
+            self.__thread = threading.Thread(
+                target=self.__run,
+                args=(weakref.ref(self), self.__refill_event),
+                daemon=True,
+            )
+            self.__thread.start()
+            weakref.finalize(self, self.__refill_event.set)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def __run(reference, refill_event):
+        while True:
+            refill_event.wait()
+            refill_event.clear()
+            pool = reference()
+            if pool is None or pool.__closed:
+                break
+
+            pool.refill()
+            del pool
+
+    @property
+    def rng(self):
+        """
+        The random generator used to draw the buffered samples.
+
+        Returns
+        -------
+        Generator
+            The random generator.
+
+        """
+        return self.__rng
+
+    @property
+    def capacity(self):
+        """
+        The amount of samples the buffer holds.
+
+        Returns
+        -------
+        int
+            The buffer capacity.
+
+        """
+        return self.__capacity
+
+    @property
+    def available(self):
+        """
+        The amount of buffered samples available to be drawn.
+
+        Returns
+        -------
+        int
+            The amount of available samples.
+
+        """
+        return self.__count
+
+    def refill(self):
+        """
+        Refills the buffer up to its capacity in a single bulk draw.
+        """
+        with self.__rng_lock:
+            missing = self.__capacity - self.__count
+            if missing <= 0:
+                return
+
+            samples = self.__rng.laplace(size=missing)
+            with self.__lock:
+                tail = (self.__head + self.__count) % self.__capacity
+                first = min(missing, self.__capacity - tail)
+                self.__buffer[tail : tail + first] = samples[:first]
+                self.__buffer[: missing - first] = samples[first:]
+                self.__count = self.__count + missing
+
+    def draw(self, n):
+        """
+        Draws unit scale Laplace samples, each of which is served at most once.
+
+        When the buffer does not hold enough samples, they are either refilled
+        (without a background thread) or drawn directly from the random generator.
+
+        Parameters
+        ----------
+        n : int
+            The amount of samples to draw.
+
+        Returns
+        -------
+        ndarray
+            The unit scale Laplace samples.
+
+        """
+        samples = self.__take(n)
+        if samples is None and self.__thread is None and n <= self.__capacity:
+            self.refill()
+            samples = self.__take(n)
+
+        if samples is None:
+            with self.__rng_lock:
+                samples = self.__rng.laplace(size=n)
+
+        return samples
+
+    def __take(self, n):
+        with self.__lock:
+            if n > self.__count:
+                self.__refill_event.set()
+                return None
+
+            start = self.__head
+            end = start + n
+            if end <= self.__capacity:
+                samples = self.__buffer[start:end].copy()
+            else:
+                end = end - self.__capacity
+                samples = np.concatenate((self.__buffer[start:], self.__buffer[:end]))
+
+            self.__head = end % self.__capacity
+            self.__count = self.__count - n
+            if self.__count < self.__threshold:
+                self.__refill_event.set()
+
+        return samples
+
+    def laplace(self, loc=0.0, scale=1.0, size=None):
+        """
+        Draws Laplace samples by scaling buffered unit scale samples. A single
+        sample for a scalar location and scale is served straight from the buffer.
+
+        Parameters
+        ----------
+        [loc] : float|list|ndarray
+            The location(s) of the distribution.
+        [scale] : float|list|ndarray
+            The scale(s) of the distribution.
+        [size] : int|tuple
+            Output shape.
+
+        Returns
+        -------
+        float|ndarray
+            The drawn sample(s).
+
+        """
+        scalars = self.scalar_types
+        if size is None and isinstance(loc, scalars) and isinstance(scale, scalars):
+            with self.__lock:
+                if self.__count > 0:
+                    index = self.__head
+                    self.__head = (index + 1) % self.__capacity
+                    self.__count = self.__count - 1
+                    if self.__count < self.__threshold:
+                        self.__refill_event.set()
+
+                    sample = loc + scale * self.__buffer[index]
+                    return sample
+
+        shape = np.broadcast(loc, scale).shape if size is None else size
+        samples = self.draw(int(np.prod(shape)))
+        if size is None and shape == ():
+            return loc + scale * samples[0]
+
+        samples = np.add(loc, np.multiply(scale, np.reshape(samples, shape)))
+        return samples
+
+    def close(self):
+        """
+        Stops the background refill thread.
+        """
+        self.__closed = True
+        self.__refill_event.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
@@ -0,0 +1,147 @@
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from diffpriv_laplace.sampler.generator import DiffPrivGenerator
+
+
+class DiffPrivParallelSampler(object):
+    """
+    Multi-threaded Laplace sampler which splits the output into blocks and fills each
+    block from a thread pool using an independent random generator spawned from a
+    single seed sequence. Since the blocks only depend on the block size, the output
+    for a given seed is the same regardless of the amount of threads. It can be used
+    in place of a random generator (i.e. as `rng`).
+    """
+
+    def __init__(
+        self, seed=None, workers=None, block_size=131072, bit_generator=np.random.PCG64
+    ):
+        """
+        Initialize the parallel sampler.
+
+        Parameters
+        ----------
+        [seed] : None|int|SeedSequence
+            The seed to spawn the block random generators from.
+        [workers] : int
+            The amount of threads to use. When `None`, the amount of CPUs is used.
+        [block_size] : int
+            The amount of samples drawn by each block random generator.
+        [bit_generator] : type
+            The bit generator class to use (e.g. `PCG64` or `SFC64`).
+
+        """
+        super().__init__()
+        self.__seed_seq = DiffPrivGenerator.seed_sequence(seed)
+        self.__workers = int(workers) if workers else (os.cpu_count() or 1)
+        self.__block_size = int(block_size)
+        self.__bit_generator = bit_generator
+        self.__executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def workers(self):
+        """
+        The amount of threads used to draw the samples.
+
+        Returns
+        -------
+        int
+            The amount of threads.
+
+        """
+        return self.__workers
+
+    @property
+    def block_size(self):
+        """
+        The amount of samples drawn by each block random generator.
+
+        Returns
+        -------
+        int
+            The block size.
+
+        """
+        return self.__block_size
+
+    def __fill(self, samples, start, seed):
+        block = samples[start : start + self.__block_size]
+        generator = np.random.Generator(self.__bit_generator(seed))
+        block[...] = generator.laplace(size=block.size)
+
+    def standard_laplace(self, n):
+        """
+        Draws unit scale Laplace samples.
+
+        Parameters
+        ----------
+        n : int
+            The amount of samples to draw.
+
+        Returns
+        -------
+        ndarray
+            The unit scale Laplace samples.
+
+        """
+        samples = np.empty(n)
+        starts = list(range(0, n, self.__block_size))
+        seeds = self.__seed_seq.spawn(len(starts))
+        if self.__workers == 1 or len(starts) <= 1:
+            for start, seed in zip(starts, seeds):
+                self.__fill(samples, start, seed)
+        else:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=self.__workers)
+
+            futures = [
+                self.__executor.submit(self.__fill, samples, start, seed)
+                for start, seed in zip(starts, seeds)
+            ]
+            for future in futures:
+                future.result()
+
+        return samples
+
+    def laplace(self, loc=0.0, scale=1.0, size=None):
+        """
+        Draws Laplace samples.
+
+        Parameters
+        ----------
+        [loc] : float|list|ndarray
+            The location(s) of the distribution.
+        [scale] : float|list|ndarray
+            The scale(s) of the distribution.
+        [size] : int|tuple
+            Output shape.
+
+        Returns
+        -------
+        float|ndarray
+            The drawn sample(s).
+
+        """
+        shape = np.broadcast(loc, scale).shape if size is None else size
+        samples = self.standard_laplace(int(np.prod(shape)))
+        if size is None and shape == ():
+            return loc + scale * samples[0]
+
+        samples = np.reshape(samples, shape)
+        np.multiply(samples, scale, out=samples)
+        np.add(samples, loc, out=samples)
+        return samples
+
+    def close(self):
+        """
+        Shuts down the thread pool.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
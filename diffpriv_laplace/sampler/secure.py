@@ -0,0 +1,95 @@
+import os
+import numpy as np
+
+
+class DiffPrivSecureSampler(object):
+    """
+    Cryptographically secure Laplace sampler which draws blocks of random bytes
+    from the operating system (`os.urandom`) and converts them to Laplace samples in
+    bulk. It can be used in place of a random generator (i.e. as `rng`).
+
+    Each sample consumes 8 random bytes: the upper 53 bits define a uniform value
+    which is converted to a standard exponential sample and the lowest bit defines
+    its sign.
+    """
+
+    def __init__(self, block_size=1048576):
+        """
+        Initialize the secure sampler.
+
+        Parameters
+        ----------
+        [block_size] : int
+            The maximum amount of samples converted per block of random bytes.
+
+        """
+        super().__init__()
+        self.__block_size = int(block_size)
+
+    @property
+    def block_size(self):
+        """
+        The maximum amount of samples converted per block of random bytes.
+
+        Returns
+        -------
+        int
+            The block size.
+
+        """
+        return self.__block_size
+
+    def standard_laplace(self, n):
+        """
+        Draws unit scale Laplace samples.
+
+        Parameters
+        ----------
+        n : int
+            The amount of samples to draw.
+
+        Returns
+        -------
+        ndarray
+            The unit scale Laplace samples.
+
+        """
+        samples = np.empty(n)
+        for start in range(0, n, self.__block_size):
+            block = samples[start : start + self.__block_size]
+            size = len(block)
+            bits = np.frombuffer(os.urandom(8 * size), dtype=np.uint64)
+            np.right_shift(bits, 11, out=block, casting="unsafe")
+            block *= 2.0**-53
+            np.negative(block, out=block)
+            np.log1p(block, out=block)
+            np.negative(block, where=(bits & 1) == 0, out=block)
+
+        return samples
+
+    def laplace(self, loc=0.0, scale=1.0, size=None):
+        """
+        Draws Laplace samples.
+
+        Parameters
+        ----------
+        [loc] : float|list|ndarray
+            The location(s) of the distribution.
+        [scale] : float|list|ndarray
+            The scale(s) of the distribution.
+        [size] : int|tuple
+            Output shape.
+
+        Returns
+        -------
+        float|ndarray
+            The drawn sample(s).
+
+        """
+        shape = np.broadcast(loc, scale).shape if size is None else size
+        samples = self.standard_laplace(int(np.prod(shape)))
+        if size is None and shape == ():
+            return loc + scale * samples[0]
+
+        samples = np.add(loc, np.multiply(scale, np.reshape(samples, shape)))
+        return samples
@@ -0,0 +1,180 @@
+import numpy as np
+from diffpriv_laplace.exceptions import DiffPrivInvalidDimensions
+
+
+class DiffPrivSelection(object):
+    """
+    Exact out-of-core selection of the values at given ranks (e.g. the median) by
+    multi-pass histogram refinement. The values are mapped to order preserving
+    unsigned integer keys, and each pass over the data counts the keys of the
+    remaining range in a fixed amount of buckets and narrows the range to the
+    bucket(s) holding the requested ranks. Once the remaining range holds few
+    enough values to fit in the memory budget, a last pass collects and sorts them.
+    """
+
+    buckets = 4096
+    chunk_size = 65536
+
+    @classmethod
+    def keys(cls, values):
+        """
+        Maps values to unsigned integer keys with the same ordering.
+
+        Parameters
+        ----------
+        values : list|ndarray
+            The values, which are converted to double precision.
+
+        Returns
+        -------
+        ndarray
+            The `uint64` keys.
+
+        """
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        bits = values.view(np.uint64)
+        keys = np.bitwise_or(bits, np.uint64(1 << 63))
+        np.invert(bits, out=keys, where=np.signbit(values))
+        return keys
+
+    @classmethod
+    def values(cls, keys):
+        """
+        Maps unsigned integer keys back to their values.
+
+        Parameters
+        ----------
+        keys : ndarray
+            The `uint64` keys.
+
+        Returns
+        -------
+        ndarray
+            The double precision values.
+
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        bits = np.where(keys >> np.uint64(63), keys ^ np.uint64(1 << 63), ~keys)
+        values = bits.view(np.float64)
+        return values
+
+    @classmethod
+    def __keys(cls, chunks, lower, upper):
+        for chunk in chunks():
+            values = np.ravel(chunk)
+            for start in range(0, values.size, cls.chunk_size):
+                keys = cls.keys(values[start : start + cls.chunk_size])
+                yield keys[(keys >= lower) & (keys <= upper)]
+
+    @classmethod
+    def __bounds(cls, chunks, lower, upper):
+        bounds = None
+        for keys in cls.__keys(chunks, lower, upper):
+            if keys.size:
+                keys_min = int(np.min(keys))
+                keys_max = int(np.max(keys))
+                if bounds is not None:
+                    keys_min = min(bounds[0], keys_min)
+                    keys_max = max(bounds[1], keys_max)
+
+                bounds = (keys_min, keys_max)
+
+        return bounds
+
+    @classmethod
+    def select(cls, chunks, ranks, buckets=None, memory=None, report=None):
+        """
+        Selects the values at the given ranks of the data read by `chunks`.
+
+        Parameters
+        ----------
+        chunks : function
+            A function which returns a new iterable of the data chunks on each call
+            since the data is read once per pass. The chunks are further split in
+            blocks of the class level `chunk_size` values while being reduced.
+        ranks : list
+            The zero based ranks of the values to select, which must be within one
+            of each other (e.g. the two middle ranks of the median).
+        [buckets] : int
+            The amount of histogram buckets of each pass. The more buckets, the less
+            passes are needed at the cost of a larger histogram. When `None`, the
+            class level `buckets` is used.
+        [memory] : int
+            The amount of bytes the values of the last pass may use. When `None`,
+            a single pass worth of histogram buckets is used.
+        [report] : dict
+            A dictionary which, when provided, is filled with the amount of passes
+            over the data (`"passes"`) and the peak amount of bytes held by the
+            histogram and the collected values (`"memory"`).
+
+        Returns
+        -------
+        ndarray
+            The values at the given ranks.
+
+        Raises
+        ------
+        DiffPrivInvalidDimensions
+            The exception is raised when the data is empty.
+
+        """
+        buckets = cls.buckets if buckets is None else int(buckets)
+        memory = buckets * 8 if memory is None else int(memory)
+        report = {} if report is None else report
+        ranks = np.asarray(ranks)
+        bounds = cls.__bounds(chunks, 0, 2**64 - 1)
+        if bounds is None:
+            raise DiffPrivInvalidDimensions("Cannot select values of empty data!")
+
+        lower, upper = bounds
+        passes = 1
+        peak = 0
+        below = 0
+        while lower < upper:
+            width = (upper - lower) // buckets + 1
+            histogram = np.zeros(buckets, dtype=np.int64)
+            for keys in cls.__keys(chunks, lower, upper):
+                keys -= np.uint64(lower)
+                keys //= np.uint64(width)
+                histogram += np.bincount(keys.astype(np.intp), minlength=buckets)
+
+            passes = passes + 1
+            peak = max(peak, histogram.nbytes)
+            cumulative = np.cumsum(histogram)
+            first, last = np.searchsorted(
+                cumulative, [np.min(ranks) - below, np.max(ranks) - below], "right"
+            ).tolist()
+            below = below + int(cumulative[first - 1] if first else 0)
+            count = int(np.sum(histogram[first : last + 1]))
+            if first < last:
+                # The ranks are adjacent, so they are the max of the first bucket
+                # and the min of the last (next non-empty) bucket.
+                _, first_max = cls.__bounds(
+                    chunks, lower + first * width, lower + (first + 1) * width - 1
+                )
+                last_min, _ = cls.__bounds(
+                    chunks,
+                    lower + last * width,
+                    min(upper, lower + (last + 1) * width - 1),
+                )
+                passes = passes + 2
+                keys = np.where(ranks == np.min(ranks), first_max, last_min)
+                break
+
+            upper = min(upper, lower + (first + 1) * width - 1)
+            lower = lower + first * width
+            if count * 8 <= memory:
+                candidates = np.sort(
+                    np.concatenate(list(cls.__keys(chunks, lower, upper)))
+                )
+                passes = passes + 1
+                peak = max(peak, candidates.nbytes)
+                keys = candidates[ranks - below]
+                break
+        else:
+            keys = np.full(ranks.shape, lower, dtype=np.uint64)
+
+        values = cls.values(keys)
+        report["passes"] = passes
+        report["memory"] = peak
+        return values
@@ -0,0 +1,285 @@
+import numpy as np
+
+
+class DiffPrivQuantileSketch(object):
+    """
+    Mergeable KLL quantile sketch which approximates the quantiles of a stream of
+    values using memory that grows only logarithmically with the amount of values.
+    Values are retained in a hierarchy of compactors where each item of level h
+    stands for 2^h values; whenever the sketch exceeds its capacity, the lowest
+    full compactor is sorted and every other item (starting at a random offset) is
+    promoted to the next level.
+    """
+
+    def __init__(self, error=0.01, seed=None):
+        """
+        Initialize an empty quantile sketch.
+
+        Parameters
+        ----------
+        [error] : float
+            The normalized rank error bound (e.g. `0.01` for ranks within 1% of
+            the exact ones) that defines the size of the compactors.
+        [seed] : None|int|SeedSequence
+            The seed of the random generator used to pick the compaction offsets.
+
+        """
+        super().__init__()
+        self.__error = float(error)
+        self.__k = self.calculate_k(self.__error)
+        self.__rng = np.random.default_rng(seed)
+        self.__levels = [np.empty(0)]
+        self.__n = 0
+        self.__min = None
+        self.__max = None
+
+    @classmethod
+    def calculate_k(cls, error):
+        """
+        Calculates the compactor size which bounds the normalized rank error.
+
+        Parameters
+        ----------
+        error : float
+            The normalized rank error bound.
+
+        Returns
+        -------
+        int
+            The size of the largest compactor.
+
+        """
+        value = max(8, int(np.ceil((2.296 / error) ** (1.0 / 0.9723))))
+        return value
+
+    @classmethod
+    def from_chunks(cls, chunks, error=0.01, seed=None):
+        """
+        Sketches an iterable of data chunks.
+
+        Parameters
+        ----------
+        chunks : iterable
+            The data chunks (lists or ndarrays) to sketch, which are flattened.
+        [error] : float
+            The normalized rank error bound.
+        [seed] : None|int|SeedSequence
+            The seed of the random generator used to pick the compaction offsets.
+
+        Returns
+        -------
+        `DiffPrivQuantileSketch`
+            The sketch of the data chunks.
+
+        """
+        sketch = cls(error=error, seed=seed)
+        for chunk in chunks:
+            sketch.update(chunk)
+
+        return sketch
+
+    def __capacity(self, level):
+        depth = len(self.__levels) - level - 1
+        value = max(2, int(np.ceil(self.__k * (2.0 / 3.0) ** depth)))
+        return value
+
+    def __compress(self):
+        while sum(items.size for items in self.__levels) > sum(
+            self.__capacity(level) for level in range(len(self.__levels))
+        ):
+            level = 0
+            while self.__levels[level].size < self.__capacity(level):
+                level = level + 1
+
+            if level + 1 == len(self.__levels):
+                self.__levels.append(np.empty(0))
+
+            items = np.sort(self.__levels[level])
+            kept = items.size % 2
+            promoted = items[kept + self.__rng.integers(2) :: 2]
+            self.__levels[level] = items[:kept]
+            self.__levels[level + 1] = np.concatenate(
+                [self.__levels[level + 1], promoted]
+            )
+
+    def update(self, chunk):
+        """
+        Adds a chunk of values to the sketch.
+
+        Parameters
+        ----------
+        chunk : list|ndarray
+            The values, which are flattened.
+
+        Returns
+        -------
+        `DiffPrivQuantileSketch`
+            The updated sketch.
+
+        """
+        values = np.ravel(chunk).astype(np.float64)
+        if values.size == 0:
+            return self
+
+        lower = np.min(values)
+        upper = np.max(values)
+        self.__min = lower if self.__n == 0 else min(self.__min, lower)
+        self.__max = upper if self.__n == 0 else max(self.__max, upper)
+        self.__n = self.__n + values.size
+        self.__levels[0] = np.concatenate([self.__levels[0], values])
+        self.__compress()
+        return self
+
+    def merge(self, other):
+        """
+        Merges another sketch (e.g. from another worker) into this sketch.
+
+        Parameters
+        ----------
+        other : `DiffPrivQuantileSketch`
+            The sketch to merge.
+
+        Returns
+        -------
+        `DiffPrivQuantileSketch`
+            The merged sketch.
+
+        """
+        if other.n == 0:
+            return self
+
+        self.__min = other.min if self.__n == 0 else min(self.__min, other.min)
+        self.__max = other.max if self.__n == 0 else max(self.__max, other.max)
+        self.__n = self.__n + other.n
+        for level, items in enumerate(other.levels):
+            if level == len(self.__levels):
+                self.__levels.append(np.empty(0))
+
+            self.__levels[level] = np.concatenate([self.__levels[level], items])
+
+        self.__compress()
+        return self
+
+    def quantile(self, q):
+        """
+        Approximates one or many quantile(s) of the sketched values.
+
+        Parameters
+        ----------
+        q : float|list|ndarray
+            The quantile(s) to approximate, which must be between 0 and 1.
+
+        Returns
+        -------
+        float|ndarray
+            The approximated quantile value(s).
+
+        """
+        items = np.concatenate(self.__levels)
+        weights = np.concatenate(
+            [np.full(level.size, 2**index) for index, level in enumerate(self.__levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        ranks = np.cumsum(weights[order])
+        q = np.asarray(q, dtype=np.float64)
+        indices = np.searchsorted(ranks, q * ranks[-1], side="left")
+        value = items[np.minimum(indices, items.size - 1)]
+        value = np.where(q <= 0.0, self.__min, value)
+        value = np.where(q >= 1.0, self.__max, value)
+        if value.ndim == 0:
+            value = value[()]
+
+        return value
+
+    @property
+    def error(self):
+        """
+        The normalized rank error bound.
+
+        Returns
+        -------
+        float
+            The rank error bound.
+
+        """
+        return self.__error
+
+    @property
+    def k(self):
+        """
+        The size of the largest compactor.
+
+        Returns
+        -------
+        int
+            The compactor size.
+
+        """
+        return self.__k
+
+    @property
+    def levels(self):
+        """
+        The items retained in each compactor level.
+
+        Returns
+        -------
+        list
+            The `ndarray` of items of each level.
+
+        """
+        return self.__levels
+
+    @property
+    def size(self):
+        """
+        The amount of retained items.
+
+        Returns
+        -------
+        int
+            The amount of items.
+
+        """
+        value = sum(items.size for items in self.__levels)
+        return value
+
+    @property
+    def n(self):
+        """
+        The total number of sketched values.
+
+        Returns
+        -------
+        int
+            The number of values.
+
+        """
+        return self.__n
+
+    @property
+    def min(self):
+        """
+        The exact min sketched value.
+
+        Returns
+        -------
+        None|float
+            The min value or `None` when empty.
+
+        """
+        return self.__min
+
+    @property
+    def max(self):
+        """
+        The exact max sketched value.
+
+        Returns
+        -------
+        None|float
+            The max value or `None` when empty.
+
+        """
+        return self.__max
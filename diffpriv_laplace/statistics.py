@@ -1,7 +1,15 @@
+import time
 import numpy as np
 from enum import Flag, auto
 from diffpriv_laplace import DiffPrivLaplaceMechanism
-from diffpriv_laplace.exceptions import DiffPrivInvalidDimensions, DiffPrivSizeMismatch
+from diffpriv_laplace.aggregate import DiffPrivAggregate
+from diffpriv_laplace.global_sensitivity.batch import BatchGlobalSensitivity
+from diffpriv_laplace.predicate import DiffPrivPredicate
+from diffpriv_laplace.sampler.generator import DiffPrivGenerator
+from diffpriv_laplace.selection import DiffPrivSelection
+from diffpriv_laplace.sketch import DiffPrivQuantileSketch
+from diffpriv_laplace.storage import DiffPrivStorage
+from diffpriv_laplace.exceptions import DiffPrivSizeMismatch
 
 
 class DiffPrivStatisticKind(Flag):
@@ -30,14 +38,7 @@ class DiffPrivStatisticKind(Flag):
             The total amount of statistic kind in the flag.
 
         """
-        value = 0
-        if self == DiffPrivStatisticKind.all:
-            value = len(DiffPrivStatisticKind) - 1
-        else:
-            for kind in DiffPrivStatisticKind:
-                if kind != self.all and bool(self & kind):
-                    value = value + 1
-
+        value = bin(self.value).count("1")
         return value
 
 
@@ -47,7 +48,17 @@ class DiffPrivStatistics(object):
     """
 
     @classmethod
-    def count(cls, data, epsilon, condition=None, axis=None, postprocess=True):
+    def count(
+        cls,
+        data,
+        epsilon,
+        condition=None,
+        axis=None,
+        postprocess=True,
+        dtype=None,
+        discrete=False,
+        rng=None,
+    ):
         """
         Performs the count operation and anonymizes the value(s) using the provided
         privacy budget.
@@ -58,57 +69,92 @@ class DiffPrivStatistics(object):
 
         Parameters
         ----------
-        data : list|ndarray
+        data : list|ndarray|str|memmap
             The data to retrieve the count(s) from.
         epsilon : float
             The privacy budget.
-        [condition] : function
+        [condition] : function|str|DiffPrivPredicate
             A condition function that receives the data as a parameter and returns
             a list or ndarray of the same size in which for each element is either
             a zero or False when it should not be counted and non-zero or True when
-            it should.
+            it should. A predicate expression (e.g. `"x between 1 and 5"`) or a
+            `DiffPrivPredicate` is instead evaluated and counted in chunks.
         [axis] : int|tuple
             Axis or tuple of axes along which to count non-zeros or non-False value(s).
         [postprocess] : bool
             Indicates whether or not to post-process the count values so that the
             returned value is rounded and within the [0, n] range, where n is the total
             number of observations.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [discrete] : bool
+            Indicates whether or not to use discrete Laplace (two-sided geometric)
+            noise so that the anonymized count(s) are integers (`int64`).
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
 
         Returns
         -------
-        float|ndarray
+        float|int|ndarray
             The anonymized count(s).
 
         """
-        if condition:
-            data = condition(data)
+        data = DiffPrivStorage.load(data)
+        if isinstance(condition, (str, DiffPrivPredicate)):
+            value, n = DiffPrivPredicate.compile(condition).count(data, axis=axis)
+        elif DiffPrivStorage.is_mapped(data):
+            aggregate = cls.calculate_aggregate(
+                data, axis=axis, condition=condition, dtype=dtype
+            )
+            value = aggregate.count
+            n = aggregate.n
+        else:
+            if condition:
+                data = condition(data)
 
-        value = np.count_nonzero(data, axis=axis)
-        anonymized = DiffPrivLaplaceMechanism.anonymize_count_with_budget(
-            value, epsilon
-        )
+            value = np.count_nonzero(data, axis=axis)
+            n = cls.calculate_size(data, axis=axis)
+
+        if discrete:
+            anonymized = DiffPrivLaplaceMechanism.anonymize_discrete_count_with_budget(
+                value, epsilon, rng=rng
+            )
+        else:
+            anonymized = DiffPrivLaplaceMechanism.anonymize_count_with_budget(
+                value, epsilon, dtype=dtype, rng=rng
+            )
 
         if postprocess:
-            n = np.size(data, axis=axis)
-            anonymized = np.clip(anonymized, 0.0, n)
-            anonymized = np.round(anonymized)
+            if discrete:
+                anonymized = np.clip(anonymized, 0, n)
+            else:
+                anonymized = np.clip(anonymized, 0.0, n, dtype=dtype)
+                anonymized = np.round(anonymized)
 
         return anonymized
 
     @classmethod
-    def min(cls, data, epsilon, axis=None):
+    def min(cls, data, epsilon, axis=None, dtype=None, rng=None):
         """
         Performs the min operation and anonymizes the value(s) using the provided
         privacy budget.
 
         Parameters
         ----------
-        data : list|ndarray
+        data : list|ndarray|str|memmap
             The data to retrieve the min value(s) from.
         epsilon : float
             The privacy budget.
         [axis] : int|tuple
             Axis or tuple of axes along which to obtain the min value(s).
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
 
         Returns
         -------
@@ -116,24 +162,37 @@ class DiffPrivStatistics(object):
             The anonymized min value(s).
 
         """
-        value = np.min(data, axis=axis)
-        anonymized = DiffPrivLaplaceMechanism.anonymize_min_with_budget(value, epsilon)
+        data = DiffPrivStorage.load(data)
+        if DiffPrivStorage.is_mapped(data):
+            value = cls.calculate_aggregate(data, axis=axis, dtype=dtype).min
+        else:
+            value = np.min(data, axis=axis)
+
+        anonymized = DiffPrivLaplaceMechanism.anonymize_min_with_budget(
+            value, epsilon, dtype=dtype, rng=rng
+        )
         return anonymized
 
     @classmethod
-    def max(cls, data, epsilon, axis=None):
+    def max(cls, data, epsilon, axis=None, dtype=None, rng=None):
         """
         Performs the max operation and anonymizes the value(s) using the provided
         privacy budget.
 
         Parameters
         ----------
-        data : list|ndarray
+        data : list|ndarray|str|memmap
             The data to retrieve the max value(s) from.
         epsilon : float
             The privacy budget.
         [axis] : int|tuple
             Axis or tuple of axes along which to obtain the max value(s).
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
 
         Returns
         -------
@@ -141,24 +200,58 @@ class DiffPrivStatistics(object):
             The anonymized max value(s).
 
         """
-        value = np.max(data, axis=axis)
-        anonymized = DiffPrivLaplaceMechanism.anonymize_max_with_budget(value, epsilon)
+        data = DiffPrivStorage.load(data)
+        if DiffPrivStorage.is_mapped(data):
+            value = cls.calculate_aggregate(data, axis=axis, dtype=dtype).max
+        else:
+            value = np.max(data, axis=axis)
+
+        anonymized = DiffPrivLaplaceMechanism.anonymize_max_with_budget(
+            value, epsilon, dtype=dtype, rng=rng
+        )
         return anonymized
 
     @classmethod
-    def median(cls, data, epsilon, axis=None):
+    def median(
+        cls,
+        data,
+        epsilon,
+        axis=None,
+        buckets=None,
+        memory=None,
+        report=None,
+        dtype=None,
+        rng=None,
+    ):
         """
         Performs the median operation and anonymizes the value(s) using the provided
-        privacy budget.
+        privacy budget. The exact median of memory-mapped data is found out-of-core
+        by `calculate_median` instead of copying the data in memory.
 
         Parameters
         ----------
-        data : list|ndarray
+        data : list|ndarray|str|memmap
             The data to retrieve the median value(s) from.
         epsilon : float
             The privacy budget.
         [axis] : int|tuple
             Axis or tuple of axes along which to obtain the median value(s).
+        [buckets] : int
+            The amount of histogram buckets of each pass over memory-mapped data.
+            The more buckets, the less passes are needed.
+        [memory] : int
+            The amount of bytes the values of the last pass over memory-mapped data
+            may use.
+        [report] : dict
+            A dictionary which, when provided, is filled with the amount of passes
+            over memory-mapped data (`"passes"`) and their peak memory in bytes
+            (`"memory"`).
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
 
         Returns
         -------
@@ -166,14 +259,82 @@ class DiffPrivStatistics(object):
             The anonymized median value(s).
 
         """
-        value = np.median(data, axis=axis)
+        data = DiffPrivStorage.load(data)
+        if DiffPrivStorage.is_mapped(data):
+            value = cls.calculate_median(
+                data, axis=axis, buckets=buckets, memory=memory, report=report
+            )
+        else:
+            value = np.median(data, axis=axis)
+
         anonymized = DiffPrivLaplaceMechanism.anonymize_median_with_budget(
-            value, epsilon
+            value, epsilon, dtype=dtype, rng=rng
         )
         return anonymized
 
     @classmethod
-    def proportion(cls, data, epsilon, condition=None, axis=None, postprocess=True):
+    def quantile(cls, data, q, epsilon, error=0.01, timings=None, dtype=None, rng=None):
+        """
+        Approximates the quantile(s) of the data with a bounded memory
+        `DiffPrivQuantileSketch` which reads the data in chunks, and anonymizes the
+        value(s) using the provided privacy budget and the median sensitivity.
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The data to retrieve the quantile value(s) from, which is flattened.
+        q : float|list|ndarray
+            The quantile(s) to approximate (e.g. `0.5` for the median), which must
+            be between 0 and 1.
+        epsilon : float
+            The privacy budget.
+        [error] : float
+            The normalized rank error bound of the approximation.
+        [timings] : dict
+            A dictionary which, when provided, is filled with the seconds spent
+            sketching the data (`"sketch"`) and applying the noise (`"noise"`).
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the noise. When
+            `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+
+        Returns
+        -------
+        float|ndarray
+            The anonymized quantile value(s).
+
+        """
+        timings = {} if timings is None else timings
+        data = DiffPrivStorage.load(data)
+        if not DiffPrivStorage.is_mapped(data):
+            data = np.ravel(data)
+
+        start = time.perf_counter()
+        sketch = DiffPrivQuantileSketch.from_chunks(
+            DiffPrivStorage.chunks(data), error=error
+        )
+        value = sketch.quantile(q)
+        timings["sketch"] = time.perf_counter() - start
+        start = time.perf_counter()
+        anonymized = DiffPrivLaplaceMechanism.anonymize_median_with_budget(
+            value, epsilon, dtype=dtype, rng=rng
+        )
+        timings["noise"] = time.perf_counter() - start
+        return anonymized
+
+    @classmethod
+    def proportion(
+        cls,
+        data,
+        epsilon,
+        condition=None,
+        axis=None,
+        postprocess=True,
+        dtype=None,
+        rng=None,
+    ):
         """
         Performs the proportion operation and anonymizes the value(s) using the
         provided privacy budget.
@@ -185,20 +346,27 @@ class DiffPrivStatistics(object):
 
         Parameters
         ----------
-        data : list|ndarray
+        data : list|ndarray|str|memmap
             The data to retrieve the proportion(s) from.
         epsilon : float
             The privacy budget.
-        [condition] : function
+        [condition] : function|str|DiffPrivPredicate
             A condition function that receives the data as a parameter and returns
             a list or ndarray of the same size in which for each element is either
             a zero or False when it should not be counted and non-zero or True when
-            it should.
+            it should. A predicate expression (e.g. `"x between 1 and 5"`) or a
+            `DiffPrivPredicate` is instead evaluated and counted in chunks.
         [axis] : int|tuple
             Axis or tuple of axes along which to count non-zeros or non-False value(s).
         [postprocess] : bool
             Indicates whether or not to post-process the proportion values so that the
             returned value is within the [0.0, 1.0] range.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
 
         Returns
         -------
@@ -206,35 +374,62 @@ class DiffPrivStatistics(object):
             The anonymized count(s).
 
         """
-        n = np.size(data, axis=axis)
-        if condition:
-            data = condition(data)
+        data = DiffPrivStorage.load(data)
+        if isinstance(condition, (str, DiffPrivPredicate)):
+            value, n = DiffPrivPredicate.compile(condition).count(data, axis=axis)
+        elif DiffPrivStorage.is_mapped(data):
+            aggregate = cls.calculate_aggregate(
+                data, axis=axis, condition=condition, dtype=dtype
+            )
+            value = aggregate.count
+            n = aggregate.n
+        else:
+            n = cls.calculate_size(data, axis=axis)
+            if condition:
+                data = condition(data)
+
+            value = np.count_nonzero(data, axis=axis)
 
-        value = np.count_nonzero(data, axis=axis)
-        value = np.divide(value, n)
+        value = np.divide(value, n, dtype=dtype)
         anonymized = DiffPrivLaplaceMechanism.anonymize_proportion_with_budget(
-            value, n, epsilon
+            value, n, epsilon, dtype=dtype, rng=rng, cache=False
         )
 
         if postprocess:
-            anonymized = np.clip(anonymized, 0.0, 1.0)
+            anonymized = np.clip(anonymized, 0.0, 1.0, dtype=dtype)
 
         return anonymized
 
     @classmethod
-    def sum(cls, data, epsilon, axis=None):
+    def sum(
+        cls, data, epsilon, axis=None, lower=None, upper=None, dtype=None, rng=None
+    ):
         """
         Performs the sum operation and anonymizes the value(s) using the provided
         privacy budget.
 
         Parameters
         ----------
-        data : list|ndarray
+        data : list|ndarray|str|memmap
             The data to retrieve the sum value(s) from.
         epsilon : float
             The privacy budget.
         [axis] : int|tuple
             Axis or tuple of axes along which to obtain the sum value(s).
+        [lower] : float|ndarray
+            The declared lower bound(s) of the data (a value per data slice along
+            `axis`), which skips scanning the data for its min value(s). The data is
+            clipped to the declared bounds in chunks.
+        [upper] : float|ndarray
+            The declared upper bound(s) of the data (a value per data slice along
+            `axis`), which skips scanning the data for its max value(s). The data is
+            clipped to the declared bounds in chunks.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
 
         Returns
         -------
@@ -242,37 +437,58 @@ class DiffPrivStatistics(object):
             The anonymized sum value(s).
 
         """
-        lower = np.min(data, axis=axis)
-        upper = np.max(data, axis=axis)
-        value = np.sum(data, axis=axis)
-        if np.isscalar(lower):
-            anonymized = DiffPrivLaplaceMechanism.anonymize_sum_with_budget(
-                value, lower, upper, epsilon
-            )
+        declared = lower is not None and upper is not None
+        data = DiffPrivStorage.load(data)
+        if lower is not None or upper is not None:
+            lower = np.min(data, axis=axis) if lower is None else lower
+            upper = np.max(data, axis=axis) if upper is None else upper
+            value, _ = cls.calculate_clipped_sum(data, lower, upper, axis, dtype)
+        elif DiffPrivStorage.is_mapped(data):
+            aggregate = cls.calculate_aggregate(data, axis=axis, dtype=dtype)
+            lower = aggregate.min
+            upper = aggregate.max
+            value = aggregate.sum
         else:
-            size = lower.size
-            anonymized = np.zeros(size)
-            for index in range(0, size):
-                anonymized[index] = DiffPrivLaplaceMechanism.anonymize_sum_with_budget(
-                    value[index], lower[index], upper[index], epsilon
-                )
+            lower = np.min(data, axis=axis)
+            upper = np.max(data, axis=axis)
+            value = np.sum(data, axis=axis, dtype=dtype)
+
+        anonymized = DiffPrivLaplaceMechanism.anonymize_sum_with_budget(
+            value, lower, upper, epsilon, dtype=dtype, rng=rng, cache=declared
+        )
 
         return anonymized
 
     @classmethod
-    def mean(cls, data, epsilon, axis=None):
+    def mean(
+        cls, data, epsilon, axis=None, lower=None, upper=None, dtype=None, rng=None
+    ):
         """
         Performs the mean operation and anonymizes the value(s) using the provided
         privacy budget.
 
         Parameters
         ----------
-        data : list|ndarray
+        data : list|ndarray|str|memmap
             The data to retrieve the mean value(s) from.
         epsilon : float
             The privacy budget.
         [axis] : int|tuple
             Axis or tuple of axes along which to obtain the mean value(s).
+        [lower] : float|ndarray
+            The declared lower bound(s) of the data (a value per data slice along
+            `axis`), which skips scanning the data for its min value(s). The data is
+            clipped to the declared bounds in chunks.
+        [upper] : float|ndarray
+            The declared upper bound(s) of the data (a value per data slice along
+            `axis`), which skips scanning the data for its max value(s). The data is
+            clipped to the declared bounds in chunks.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
 
         Returns
         -------
@@ -280,39 +496,60 @@ class DiffPrivStatistics(object):
             The anonymized mean value(s).
 
         """
-        n = np.size(data, axis=axis)
-        lower = np.min(data, axis=axis)
-        upper = np.max(data, axis=axis)
-        value = np.mean(data, axis=axis)
-        if np.isscalar(lower):
-            anonymized = DiffPrivLaplaceMechanism.anonymize_mean_with_budget(
-                value, lower, upper, n, epsilon
-            )
+        data = DiffPrivStorage.load(data)
+        if lower is not None or upper is not None:
+            lower = np.min(data, axis=axis) if lower is None else lower
+            upper = np.max(data, axis=axis) if upper is None else upper
+            value, n = cls.calculate_clipped_sum(data, lower, upper, axis, dtype)
+            value = np.divide(value, n, dtype=dtype)
+        elif DiffPrivStorage.is_mapped(data):
+            aggregate = cls.calculate_aggregate(data, axis=axis, dtype=dtype)
+            n = aggregate.n
+            lower = aggregate.min
+            upper = aggregate.max
+            value = aggregate.mean
         else:
-            size = lower.size
-            anonymized = np.zeros(size)
-            for index in range(0, size):
-                mean_value = DiffPrivLaplaceMechanism.anonymize_mean_with_budget(
-                    value[index], lower[index], upper[index], n, epsilon
-                )
-                anonymized[index] = mean_value
+            n = cls.calculate_size(data, axis=axis)
+            lower = np.min(data, axis=axis)
+            upper = np.max(data, axis=axis)
+            value = np.mean(data, axis=axis, dtype=dtype)
+
+        anonymized = DiffPrivLaplaceMechanism.anonymize_mean_with_budget(
+            value, lower, upper, n, epsilon, dtype=dtype, rng=rng, cache=False
+        )
 
         return anonymized
 
     @classmethod
-    def variance(cls, data, epsilon, axis=None):
+    def variance(
+        cls, data, epsilon, axis=None, lower=None, upper=None, dtype=None, rng=None
+    ):
         """
         Performs the variance operation and anonymizes the value(s) using the provided
         privacy budget.
 
         Parameters
         ----------
-        data : list|ndarray
+        data : list|ndarray|str|memmap
             The data to retrieve the variance value(s) from.
         epsilon : float
             The privacy budget.
         [axis] : int|tuple
             Axis or tuple of axes along which to obtain the variance value(s).
+        [lower] : float|ndarray
+            The declared lower bound(s) of the data (a value per data slice along
+            `axis`), which skips scanning the data for its min value(s). The data is
+            clipped to the declared bounds in chunks.
+        [upper] : float|ndarray
+            The declared upper bound(s) of the data (a value per data slice along
+            `axis`), which skips scanning the data for its max value(s). The data is
+            clipped to the declared bounds in chunks.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
 
         Returns
         -------
@@ -320,39 +557,655 @@ class DiffPrivStatistics(object):
             The anonymized variance value(s).
 
         """
-        n = np.size(data, axis=axis)
+        data = DiffPrivStorage.load(data)
+        if lower is not None or upper is not None:
+            lower = np.min(data, axis=axis) if lower is None else lower
+            upper = np.max(data, axis=axis) if upper is None else upper
+            aggregate = DiffPrivAggregate.from_chunks(
+                cls.calculate_clipped_chunks(data, lower, upper, axis=axis),
+                axis=axis,
+                dtype=dtype,
+            )
+            n = aggregate.n
+            value = aggregate.variance
+        elif DiffPrivStorage.is_mapped(data):
+            aggregate = cls.calculate_aggregate(data, axis=axis, dtype=dtype)
+            n = aggregate.n
+            lower = aggregate.min
+            upper = aggregate.max
+            value = aggregate.variance
+        else:
+            n = cls.calculate_size(data, axis=axis)
+            lower = np.min(data, axis=axis)
+            upper = np.max(data, axis=axis)
+            value = np.var(data, axis=axis, dtype=dtype)
+
+        anonymized = DiffPrivLaplaceMechanism.anonymize_variance_with_budget(
+            value, lower, upper, n, epsilon, dtype=dtype, rng=rng, cache=False
+        )
+
+        return anonymized
+
+    @classmethod
+    def weighted_count(
+        cls,
+        data,
+        weights,
+        epsilon,
+        condition=None,
+        axis=None,
+        max_weight=1.0,
+        postprocess=True,
+        dtype=None,
+        rng=None,
+    ):
+        """
+        Performs the count operation over pre-aggregated data where each value
+        stands for `weight` observations, and anonymizes the value(s) using the
+        provided privacy budget.
+
+        The operation sums the weights of the non-zero or non-False values. When a
+        condition is provided, it is applied to the data beforehand as in `count`.
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The distinct values to retrieve the count(s) from.
+        weights : list|ndarray|str|memmap
+            The weight (multiplicity) of each value.
+        epsilon : float
+            The privacy budget.
+        [condition] : function|str|DiffPrivPredicate
+            A condition function that receives the data as a parameter and returns
+            a list or ndarray of the same size in which for each element is either
+            a zero or False when it should not be counted and non-zero or True when
+            it should. A predicate expression (e.g. `"x between 1 and 5"`) or a
+            `DiffPrivPredicate` is instead evaluated in chunks.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to count non-zeros or non-False value(s).
+        [max_weight] : float
+            The max total weight of the values of a single individual, which scales
+            the sensitivity. It is `1.0` when each observation is a different
+            individual.
+        [postprocess] : bool
+            Indicates whether or not to post-process the count values so that the
+            returned value is rounded and within the [0, n] range, where n is the total
+            weight of the observations.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+
+        Returns
+        -------
+        float|ndarray
+            The anonymized count(s).
+
+        Raises
+        ------
+        DiffPrivSizeMismatch
+            The exception is raised when the data and the weights have different
+            shapes.
+
+        """
+        data, weights = cls.load_weighted_data(data, weights)
+        if isinstance(condition, (str, DiffPrivPredicate)):
+            value, _ = DiffPrivPredicate.compile(condition).count(
+                data, axis=axis, weights=weights, dtype=dtype
+            )
+        else:
+            if condition:
+                data = condition(data)
+
+            mask = np.asarray(data, dtype=bool)
+            value = np.sum(weights, axis=axis, where=mask, dtype=dtype)
+        anonymized = DiffPrivLaplaceMechanism.anonymize_weighted_count_with_budget(
+            value, epsilon, max_weight=max_weight, dtype=dtype, rng=rng
+        )
+        if postprocess:
+            n = np.sum(weights, axis=axis, dtype=dtype)
+            anonymized = np.round(np.clip(anonymized, 0.0, n))
+
+        return anonymized
+
+    @classmethod
+    def weighted_sum(
+        cls, data, weights, epsilon, axis=None, max_weight=1.0, dtype=None, rng=None
+    ):
+        """
+        Performs the sum operation over pre-aggregated data where each value stands
+        for `weight` observations, and anonymizes the value(s) using the provided
+        privacy budget.
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The distinct values to retrieve the sum value(s) from.
+        weights : list|ndarray|str|memmap
+            The weight (multiplicity) of each value.
+        epsilon : float
+            The privacy budget.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to obtain the sum value(s).
+        [max_weight] : float
+            The max total weight of the values of a single individual, which scales
+            the sensitivity. It is `1.0` when each observation is a different
+            individual.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+
+        Returns
+        -------
+        float|ndarray
+            The anonymized sum value(s).
+
+        Raises
+        ------
+        DiffPrivSizeMismatch
+            The exception is raised when the data and the weights have different
+            shapes.
+
+        """
+        data, weights = cls.load_weighted_data(data, weights)
         lower = np.min(data, axis=axis)
         upper = np.max(data, axis=axis)
-        value = np.var(data, axis=axis)
-        if np.isscalar(lower):
-            anonymized = DiffPrivLaplaceMechanism.anonymize_variance_with_budget(
-                value, lower, upper, n, epsilon
+        value = np.sum(np.multiply(data, weights, dtype=dtype), axis=axis, dtype=dtype)
+        anonymized = DiffPrivLaplaceMechanism.anonymize_weighted_sum_with_budget(
+            value,
+            lower,
+            upper,
+            epsilon,
+            max_weight=max_weight,
+            dtype=dtype,
+            rng=rng,
+            cache=False,
+        )
+        return anonymized
+
+    @classmethod
+    def load_weighted_data(cls, data, weights):
+        """
+        Loads pre-aggregated data and its weights.
+
+        Parameters
+        ----------
+        data : list|ndarray|str|memmap
+            The distinct values.
+        weights : list|ndarray|str|memmap
+            The weight (multiplicity) of each value.
+
+        Returns
+        -------
+        tuple
+            The data and the weights as `ndarray` or `memmap`.
+
+        Raises
+        ------
+        DiffPrivSizeMismatch
+            The exception is raised when the data and the weights have different
+            shapes.
+
+        """
+        data = np.asanyarray(DiffPrivStorage.load(data))
+        weights = np.asanyarray(DiffPrivStorage.load(weights))
+        if data.shape != weights.shape:
+            raise DiffPrivSizeMismatch(
+                "Data and weights have different shapes! [{} != {}]".format(
+                    data.shape, weights.shape
+                )
             )
+
+        return data, weights
+
+    @classmethod
+    def calculate_size(cls, data, axis=None):
+        """
+        Calculates the total number of observations of each data slice.
+
+        Parameters
+        ----------
+        data : list|ndarray
+            The data to retrieve the number of observations from.
+        [axis] : int|tuple
+            Axis or tuple of axes along which the observations are reduced. When
+            `None`, the size of the flattened data is obtained.
+
+        Returns
+        -------
+        int
+            The total number of observations.
+
+        """
+        if axis is None:
+            size = int(np.size(data))
         else:
-            size = lower.size
-            anonymized = np.zeros(size)
-            for index in range(0, size):
-                var_value = DiffPrivLaplaceMechanism.anonymize_variance_with_budget(
-                    value[index], lower[index], upper[index], n, epsilon
+            size = int(np.prod(np.take(np.shape(data), axis)))
+
+        return size
+
+    @classmethod
+    def calculate_aggregate(cls, data, axis=None, condition=None, dtype=None):
+        """
+        Aggregates memory-mapped data in page aligned chunks along its first axis
+        so that the data is never loaded in memory at once.
+
+        Parameters
+        ----------
+        data : ndarray|memmap
+            The data to aggregate.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to aggregate the data.
+        [condition] : function
+            A condition function applied to each chunk before aggregating it.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s).
+            When `None`, double precision is used.
+
+        Returns
+        -------
+        `DiffPrivAggregate`
+            The aggregate of the data.
+
+        """
+        chunks = DiffPrivStorage.chunks(data)
+        if condition:
+            chunks = map(condition, chunks)
+
+        aggregate = DiffPrivAggregate.from_chunks(chunks, axis=axis, dtype=dtype)
+        return aggregate
+
+    @classmethod
+    def calculate_clipped_chunks(cls, data, lower, upper, axis=None, chunk_size=None):
+        """
+        Clips the data to declared bounds in blocks of rows holding about
+        `chunk_size` values, so that the data never has to be copied at once.
+
+        Parameters
+        ----------
+        data : list|ndarray|memmap
+            The data to clip.
+        lower : float|ndarray
+            The lower bound(s) of the data (a value per data slice along `axis`).
+        upper : float|ndarray
+            The upper bound(s) of the data (a value per data slice along `axis`).
+        [axis] : int|tuple
+            Axis or tuple of axes along which the data slices are reduced.
+        [chunk_size] : int
+            The approximate amount of values of a block. When `None`, the
+            `DiffPrivAggregate.chunk_size` is used.
+
+        Returns
+        -------
+        generator
+            The clipped blocks, which are written into a single reused buffer and
+            are therefore only valid until the next block is read.
+
+        """
+        chunk_size = DiffPrivAggregate.chunk_size if chunk_size is None else chunk_size
+        data = data if DiffPrivStorage.is_mapped(data) else np.asarray(data)
+        data = np.reshape(data, 1) if data.ndim == 0 else data
+        if axis is not None:
+            lower = np.expand_dims(lower, axis) if np.ndim(lower) else lower
+            upper = np.expand_dims(upper, axis) if np.ndim(upper) else upper
+
+        lower = np.broadcast_to(lower, data.shape)
+        upper = np.broadcast_to(upper, data.shape)
+        length = data.shape[0]
+        rows = max(1, chunk_size // max(1, int(np.prod(data.shape[1:]))))
+        buffer = np.empty(
+            (min(rows, length),) + data.shape[1:],
+            dtype=np.result_type(data.dtype, lower.dtype, upper.dtype),
+        )
+        for start in range(0, length, rows):
+            stop = min(start + rows, length)
+            chunk = buffer[: stop - start]
+            np.clip(data[start:stop], lower[start:stop], upper[start:stop], out=chunk)
+            yield chunk
+
+    @classmethod
+    def calculate_clipped_sum(cls, data, lower, upper, axis=None, dtype=None):
+        """
+        Sums the data clipped to declared bounds in chunks.
+
+        Parameters
+        ----------
+        data : list|ndarray|memmap
+            The data to sum.
+        lower : float|ndarray
+            The lower bound(s) of the data (a value per data slice along `axis`).
+        upper : float|ndarray
+            The upper bound(s) of the data (a value per data slice along `axis`).
+        [axis] : int|tuple
+            Axis or tuple of axes along which to sum the data.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s).
+            When `None`, double precision is used.
+
+        Returns
+        -------
+        tuple
+            The sum value(s) and the number of summed values.
+
+        """
+        ndim = max(1, np.ndim(data))
+        if axis is None:
+            axes = None
+            n = np.size(data)
+        else:
+            axes = tuple(int(index) % ndim for index in np.atleast_1d(axis))
+            n = int(np.prod(np.take(np.shape(data), axes)))
+
+        value = 0.0
+        sums = []
+        for chunk in cls.calculate_clipped_chunks(data, lower, upper, axis=axis):
+            chunk_sum = np.sum(chunk, axis=axes, dtype=dtype)
+            if axes is None or 0 in axes:
+                value = value + chunk_sum
+            else:
+                sums.append(chunk_sum)
+
+        if sums:
+            value = np.concatenate(sums)
+
+        return value, n
+
+    @classmethod
+    def calculate_median(
+        cls, data, axis=None, buckets=None, memory=None, report=None, indices=None
+    ):
+        """
+        Calculates the exact median of memory-mapped data with `DiffPrivSelection`,
+        which narrows a histogram over repeated chunked passes until the values
+        around the median fit in the provided amount of memory.
+
+        Parameters
+        ----------
+        data : ndarray|memmap
+            The data to retrieve the median value(s) from.
+        [axis] : int|tuple
+            Axis or tuple of axes along which to obtain the median values. When
+            `None`, the median of the flattened data is obtained.
+        [buckets] : int
+            The amount of histogram buckets of each pass.
+        [memory] : int
+            The amount of bytes the values of the last pass may use.
+        [report] : dict
+            A dictionary which, when provided, is filled with the total amount of
+            passes over the data (`"passes"`) and their peak memory in bytes
+            (`"memory"`).
+        [indices] : list|ndarray
+            The flat indices of the data slices along `axis` to obtain the median
+            values of. When `None`, the median values of all data slices are
+            obtained.
+
+        Returns
+        -------
+        float|ndarray
+            The median value(s).
+
+        """
+        report = {} if report is None else report
+        shape = ()
+        if axis is None:
+            chunk_functions = [lambda: DiffPrivStorage.chunks(data)]
+            n = np.size(data)
+        else:
+            iter_axis, reduce_axis = DiffPrivStorage.data_slice_axes(data, axis)
+            shape = tuple(np.shape(data)[index] for index in iter_axis)
+            chunk_functions = [
+                lambda index=index: (
+                    chunk
+                    for _, chunk in DiffPrivStorage.data_slice_chunks(
+                        data, [index], iter_axis
+                    )
+                )
+                for index in (
+                    range(int(np.prod(shape))) if indices is None else indices
                 )
-                anonymized[index] = var_value
+            ]
+            n = int(np.prod([np.shape(data)[index] for index in reduce_axis]))
+
+        ranks = sorted({(n - 1) // 2, n // 2})
+        values = []
+        report["passes"] = 0
+        report["memory"] = 0
+        for chunks in chunk_functions:
+            slice_report = {}
+            selected = DiffPrivSelection.select(
+                chunks, ranks, buckets=buckets, memory=memory, report=slice_report
+            )
+            values.append(np.mean(selected))
+            report["passes"] = report["passes"] + slice_report["passes"]
+            report["memory"] = max(report["memory"], slice_report["memory"])
 
-        return anonymized
+        if indices is not None:
+            value = np.array(values)
+        else:
+            value = np.reshape(values, shape) if shape else values[0]
+
+        return value
+
+    @classmethod
+    def calculate_aggregate_statistics(
+        cls, aggregate, kind, epsilon, dtype=None, rng=None
+    ):
+        """
+        Anonymizes the statistics of an aggregate using a provided privacy budget.
+        The median is not part of an aggregate and is therefore skipped.
+
+        Parameters
+        ----------
+        aggregate : `DiffPrivAggregate`
+            The aggregate of a data slice.
+        kind : DiffPrivStatisticKind
+            The kind of statistics to anonymize.
+        epsilon : float
+            The privacy budget.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the noise and
+            the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise, which is created
+            once for all the statistics. When `None`, the numpy legacy global random
+            state is used.
+
+        Returns
+        -------
+        dict
+            The dictionary of anonymized statistics where keys are of type
+            `DiffPrivStatisticKind` and values are of type `float`.
+
+        """
+        rng = None if rng is None else DiffPrivGenerator.create(rng)
+        stats = {}
+        n = aggregate.n
+        if bool(kind & DiffPrivStatisticKind.count):
+            value = DiffPrivLaplaceMechanism.anonymize_count_with_budget(
+                aggregate.count, epsilon, dtype=dtype, rng=rng
+            )
+            value = np.round(np.clip(value, 0.0, n, dtype=dtype))
+            stats[DiffPrivStatisticKind.count] = value
+
+        if bool(kind & DiffPrivStatisticKind.min):
+            value = DiffPrivLaplaceMechanism.anonymize_min_with_budget(
+                aggregate.min, epsilon, dtype=dtype, rng=rng
+            )
+            stats[DiffPrivStatisticKind.min] = value
+
+        if bool(kind & DiffPrivStatisticKind.max):
+            value = DiffPrivLaplaceMechanism.anonymize_max_with_budget(
+                aggregate.max, epsilon, dtype=dtype, rng=rng
+            )
+            stats[DiffPrivStatisticKind.max] = value
+
+        if bool(kind & DiffPrivStatisticKind.proportion):
+            value = np.divide(aggregate.count, n, dtype=dtype)
+            value = DiffPrivLaplaceMechanism.anonymize_proportion_with_budget(
+                value, n, epsilon, dtype=dtype, rng=rng, cache=False
+            )
+            value = np.clip(value, 0.0, 1.0, dtype=dtype)
+            stats[DiffPrivStatisticKind.proportion] = value
+
+        if bool(kind & DiffPrivStatisticKind.sum):
+            value = DiffPrivLaplaceMechanism.anonymize_sum_with_budget(
+                aggregate.sum,
+                aggregate.min,
+                aggregate.max,
+                epsilon,
+                dtype=dtype,
+                rng=rng,
+                cache=False,
+            )
+            stats[DiffPrivStatisticKind.sum] = value
+
+        if bool(kind & DiffPrivStatisticKind.mean):
+            value = DiffPrivLaplaceMechanism.anonymize_mean_with_budget(
+                aggregate.mean,
+                aggregate.min,
+                aggregate.max,
+                n,
+                epsilon,
+                dtype=dtype,
+                rng=rng,
+                cache=False,
+            )
+            stats[DiffPrivStatisticKind.mean] = value
+
+        if bool(kind & DiffPrivStatisticKind.variance):
+            value = DiffPrivLaplaceMechanism.anonymize_variance_with_budget(
+                aggregate.variance,
+                aggregate.min,
+                aggregate.max,
+                n,
+                epsilon,
+                dtype=dtype,
+                rng=rng,
+                cache=False,
+            )
+            stats[DiffPrivStatisticKind.variance] = value
+
+        return stats
 
     @classmethod
-    def calculate_data_slice_statistics(cls, data_slice, kind, epsilon):
+    def calculate_stream_statistics(
+        cls,
+        chunks,
+        kind,
+        epsilon,
+        chunk_size=None,
+        error=0.01,
+        timings=None,
+        dtype=None,
+        rng=None,
+    ):
+        """
+        Calculates the statistics of a stream of data chunks using a provided
+        privacy budget. The chunks are reduced one at a time into a mergeable
+        `DiffPrivAggregate` (and a `DiffPrivQuantileSketch` for the approximate
+        median), so that memory use does not depend on the length of the stream,
+        and the noise is applied once the stream is exhausted.
+
+        Parameters
+        ----------
+        chunks : iterable
+            The data chunks (lists or ndarrays) of a single data slice.
+        kind : DiffPrivStatisticKind
+            The kind of statistics to perform on the stream.
+        epsilon : float
+            The privacy budget.
+        [chunk_size] : int
+            The amount of elements reduced at once. When `None`, the
+            `DiffPrivAggregate` class level `chunk_size` is used.
+        [error] : float
+            The normalized rank error bound of the approximate median.
+        [timings] : dict
+            A dictionary which, when provided, is filled with the seconds spent
+            aggregating (`"aggregate"`), sketching (`"sketch"`) and applying the
+            noise (`"noise"`).
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise, which is created
+            once for all the statistics. When `None`, the numpy legacy global random
+            state is used.
+
+        Returns
+        -------
+        dict
+            The dictionary of calculated statistics where keys are of type
+            `DiffPrivStatisticKind` and values are of type `float`.
+
+        """
+        rng = None if rng is None else DiffPrivGenerator.create(rng)
+        timings = {} if timings is None else timings
+        timings["aggregate"] = 0.0
+        timings["sketch"] = 0.0
+        sketch = None
+        if bool(kind & DiffPrivStatisticKind.median):
+            sketch = DiffPrivQuantileSketch(error=error)
+
+        aggregate = DiffPrivAggregate(dtype=dtype)
+        for chunk in chunks:
+            start = time.perf_counter()
+            aggregate.merge(
+                DiffPrivAggregate.from_data(chunk, chunk_size=chunk_size, dtype=dtype)
+            )
+            timings["aggregate"] += time.perf_counter() - start
+            if sketch is not None:
+                start = time.perf_counter()
+                sketch.update(chunk)
+                timings["sketch"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        stats = cls.calculate_aggregate_statistics(
+            aggregate,
+            kind & ~DiffPrivStatisticKind.median,
+            epsilon,
+            dtype=dtype,
+            rng=rng,
+        )
+        if sketch is not None:
+            value = DiffPrivLaplaceMechanism.anonymize_median_with_budget(
+                sketch.quantile(0.5), epsilon, dtype=dtype, rng=rng
+            )
+            stats[DiffPrivStatisticKind.median] = value
+
+        timings["noise"] = time.perf_counter() - start
+        return stats
+
+    @classmethod
+    def calculate_data_slice_statistics(
+        cls, data_slice, kind, epsilon, dtype=None, rng=None
+    ):
         """
         Calculates the statistics for a given data slice using a provided
-        privacy budget.
+        privacy budget. When more than one statistic other than the median is
+        requested, they are computed from a single pass `DiffPrivAggregate` of the
+        data slice instead of scanning the data slice for each of them. Memory-mapped
+        data slices are always aggregated in chunks.
 
         Parameters
         ----------
-        data : ndarray
+        data : ndarray|str|memmap
             The data slice to calculate the anonymized statistic(s) for.
         kind : DiffPrivStatisticKind
             The kind of statistics to perform on the data slice.
         epsilon : float
             The privacy budget.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise, which is created
+            once for all the statistics. When `None`, the numpy legacy global random
+            state is used.
 
         Returns
         -------
@@ -361,53 +1214,87 @@ class DiffPrivStatistics(object):
             `DiffPrivStatisticKind` and values are of type `float`.
 
         """
+        rng = None if rng is None else DiffPrivGenerator.create(rng)
+        aggregate_kind = kind & ~DiffPrivStatisticKind.median
+        data_slice = DiffPrivStorage.load(data_slice)
+        if DiffPrivStorage.is_mapped(data_slice) and aggregate_kind:
+            aggregate = cls.calculate_aggregate(data_slice, dtype=dtype)
+        elif aggregate_kind.size > 1:
+            aggregate = DiffPrivAggregate.from_data(data_slice, dtype=dtype)
+        else:
+            aggregate = None
+
+        if aggregate is not None:
+            stats = cls.calculate_aggregate_statistics(
+                aggregate, aggregate_kind, epsilon, dtype=dtype, rng=rng
+            )
+            if bool(kind & DiffPrivStatisticKind.median):
+                value = cls.median(data_slice, epsilon, dtype=dtype, rng=rng)
+                stats[DiffPrivStatisticKind.median] = value
+
+            return stats
+
         stats = {}
         if bool(kind & DiffPrivStatisticKind.count):
-            value = cls.count(data_slice, epsilon)
+            value = cls.count(data_slice, epsilon, dtype=dtype, rng=rng)
             stats[DiffPrivStatisticKind.count] = value
 
         if bool(kind & DiffPrivStatisticKind.min):
-            value = cls.min(data_slice, epsilon)
+            value = cls.min(data_slice, epsilon, dtype=dtype, rng=rng)
             stats[DiffPrivStatisticKind.min] = value
 
         if bool(kind & DiffPrivStatisticKind.max):
-            value = cls.max(data_slice, epsilon)
+            value = cls.max(data_slice, epsilon, dtype=dtype, rng=rng)
             stats[DiffPrivStatisticKind.max] = value
 
         if bool(kind & DiffPrivStatisticKind.median):
-            value = cls.median(data_slice, epsilon)
+            value = cls.median(data_slice, epsilon, dtype=dtype, rng=rng)
             stats[DiffPrivStatisticKind.median] = value
 
         if bool(kind & DiffPrivStatisticKind.proportion):
-            value = cls.proportion(data_slice, epsilon)
+            value = cls.proportion(data_slice, epsilon, dtype=dtype, rng=rng)
             stats[DiffPrivStatisticKind.proportion] = value
 
         if bool(kind & DiffPrivStatisticKind.sum):
-            value = cls.sum(data_slice, epsilon)
+            value = cls.sum(data_slice, epsilon, dtype=dtype, rng=rng)
             stats[DiffPrivStatisticKind.sum] = value
 
         if bool(kind & DiffPrivStatisticKind.mean):
-            value = cls.mean(data_slice, epsilon)
+            value = cls.mean(data_slice, epsilon, dtype=dtype, rng=rng)
             stats[DiffPrivStatisticKind.mean] = value
 
         if bool(kind & DiffPrivStatisticKind.variance):
-            value = cls.variance(data_slice, epsilon)
+            value = cls.variance(data_slice, epsilon, dtype=dtype, rng=rng)
             stats[DiffPrivStatisticKind.variance] = value
 
         return stats
 
     @classmethod
-    def apply_kind_on_data_slice(cls, data, kind, epsilon, axis=None):
+    def apply_kind_on_data_slice(
+        cls, data, kind, epsilon, axis=None, dtype=None, rng=None
+    ):
         """
         Performs the statistic operations for its corresponding data slice using the
         provided privacy budget. The statistics defined in `kind` at index i is only
         applied to data slice i. Therefore, the length of the `kind` list should be
         the same as the amount of data slices that are derived from `axis`.
 
+        The data may have any number of dimensions: the data slices are indexed by
+        the axes which are not in `axis` (flattened in row-major order, e.g. the
+        region and day of a region x day x metric cube reduced along the metric
+        axis) and are reduced along the axes in `axis`. One dimensional data is a
+        single data slice.
+
+        Each statistic is computed for all the data slices which request it with a
+        single reduction along `axis` and a single noise draw, taking the requested
+        data slices as strided views of the data when all of them are requested.
+        Memory-mapped data (or a file path) is instead aggregated in a single chunked
+        pass for all the data slices, without copying the data slices.
+
         Parameters
         ----------
-        data : list|ndarray
-            The data to retrieve the anonymized statistic(s) from.
+        data : list|ndarray|str|memmap
+            The data to retrieve the anonymized statistic(s, rng=rng) from.
         kind : DiffPrivStatisticKind|list
             The kind of statistics to perform on each data slice. If a `None` value
             is provided the corresponding statistics calculation for the data slice
@@ -416,7 +1303,14 @@ class DiffPrivStatistics(object):
             The privacy budget.
         [axis] : int|tuple
             Axis or tuple of axes along which to obtain the anonymized statistic
-            value(s).
+            value(s). When `None`, the data slices are reduced along the first axis.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the reduction(s),
+            the noise and the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise, which is created
+            once for all the statistics. When `None`, the numpy legacy global random
+            state is used.
 
         Returns
         -------
@@ -427,29 +1321,28 @@ class DiffPrivStatistics(object):
         Raises
         ------
         DiffPrivInvalidDimensions
-            The exception is raised when the data dimension is invalid.
+            The exception is raised when the data is a scalar or when `axis` is
+            empty or out of the data dimensions.
         DiffPrivSizeMismatch
             The exception is raised when the length of the `kind` list is of different
             size than the amount of data slices in `data` defined through `axis`.
 
         """
+        rng = None if rng is None else DiffPrivGenerator.create(rng)
         kinds = kind
         if not isinstance(kind, list):
             kinds = [kind]
 
-        if np.ndim(data) == 1:
-            data = np.array([data])
-            axis = 1
+        data = DiffPrivStorage.load(data)
+        if not DiffPrivStorage.is_mapped(data):
+            data = np.asarray(data)
 
-        data_dim = np.ndim(data)
-        if data_dim != 2:
-            raise DiffPrivInvalidDimensions(
-                "Invalid data dimension: {}".format(data_dim)
-            )
+        if data.ndim == 1:
+            axis = 0
 
-        shape = np.shape(data)
-        iter_axis = (axis if axis else 0) - 1
-        n = shape[iter_axis]
+        iter_axis, reduce_axis = DiffPrivStorage.data_slice_axes(data, axis)
+        shape = tuple(data.shape[index] for index in iter_axis)
+        n = int(np.prod(shape))
         kind_len = len(kinds)
         if n != kind_len:
             raise DiffPrivSizeMismatch(
@@ -458,12 +1351,221 @@ class DiffPrivStatistics(object):
                 )
             )
 
-        results = [None] * kind_len
-        for index in range(0, kind_len):
-            kind = kinds[index]
-            if kind:
-                data_slice = np.take(data, [index], axis=iter_axis)
-                stats = cls.calculate_data_slice_statistics(data_slice, kind, epsilon)
-                results[index] = stats
+        statistics = [
+            (DiffPrivStatisticKind.count, cls.count),
+            (DiffPrivStatisticKind.min, cls.min),
+            (DiffPrivStatisticKind.max, cls.max),
+            (DiffPrivStatisticKind.median, cls.median),
+            (DiffPrivStatisticKind.proportion, cls.proportion),
+            (DiffPrivStatisticKind.sum, cls.sum),
+            (DiffPrivStatisticKind.mean, cls.mean),
+            (DiffPrivStatisticKind.variance, cls.variance),
+        ]
+        flags = np.array([kind.value if kind else 0 for kind in kinds], dtype=np.int64)
+        results = [{} if kind else None for kind in kinds]
+        if DiffPrivStorage.is_mapped(data):
+            kind = DiffPrivStatisticKind(int(np.bitwise_or.reduce(flags)))
+            aggregate_kind = kind & ~DiffPrivStatisticKind.median
+            stats = {}
+            if aggregate_kind:
+                aggregate = cls.calculate_aggregate(data, axis=reduce_axis, dtype=dtype)
+                stats = cls.calculate_aggregate_statistics(
+                    aggregate, aggregate_kind, epsilon, dtype=dtype, rng=rng
+                )
+
+            if bool(kind & DiffPrivStatisticKind.median):
+                stats[DiffPrivStatisticKind.median] = cls.median(
+                    data, epsilon, axis=reduce_axis, dtype=dtype, rng=rng
+                )
+
+            for statistic_kind, values in stats.items():
+                values = np.ravel(values)
+                for index in np.flatnonzero(flags & statistic_kind.value):
+                    results[index][statistic_kind] = values[index]
+
+            return results
+
+        for statistic_kind, statistic in statistics:
+            indices = np.flatnonzero(flags & statistic_kind.value)
+            if indices.size == 0:
+                continue
+
+            if indices.size == n:
+                data_slices = data
+                statistic_axis = reduce_axis
+            else:
+                data_slices = np.moveaxis(data, iter_axis, range(len(iter_axis)))
+                data_slices = data_slices[np.unravel_index(indices, shape)]
+                statistic_axis = tuple(range(1, data_slices.ndim))
+
+            values = statistic(
+                data_slices, epsilon, axis=statistic_axis, dtype=dtype, rng=rng
+            )
+            for index, value in zip(indices, np.ravel(values)):
+                results[index][statistic_kind] = value
 
         return results
+
+    @classmethod
+    def factorize_keys(cls, keys):
+        """
+        Factorizes group keys into the sorted unique keys and the group index of
+        each key. Integer keys spanning a range no larger than their amount are
+        counted in linear time, any other keys are sorted.
+
+        Parameters
+        ----------
+        keys : list|ndarray
+            The keys, which are flattened.
+
+        Returns
+        -------
+        tuple
+            The sorted unique keys (`ndarray`) and the group index of each key
+            (`ndarray`).
+
+        """
+        keys = np.ravel(keys)
+        if (
+            keys.size
+            and np.issubdtype(keys.dtype, np.integer)
+            and int(np.max(keys)) - int(np.min(keys)) < keys.size
+        ):
+            offsets = keys.astype(np.intp)
+            lower = np.min(offsets)
+            offsets -= lower
+            present = np.bincount(offsets) > 0
+            groups = (np.flatnonzero(present) + lower).astype(keys.dtype)
+            codes = (np.cumsum(present) - 1)[offsets]
+        else:
+            groups, codes = np.unique(keys, return_inverse=True)
+            codes = np.ravel(codes)
+
+        return groups, codes
+
+    @classmethod
+    def groupby(cls, values, keys, kind, epsilon, bounds=None, dtype=None, rng=None):
+        """
+        Performs the statistics of the values of each group of keys and anonymizes
+        them using the provided privacy budget. The keys are factorized and the
+        aggregates of all the groups are computed at once with `np.bincount` and
+        `ufunc.at` (only the median requires sorting the values), and since the
+        groups are disjoint (parallel composition) the noise of all the groups and
+        statistics is drawn at once.
+
+        Parameters
+        ----------
+        values : list|ndarray|str|memmap
+            The values, which are flattened.
+        keys : list|ndarray
+            The group key of each value, which is flattened.
+        kind : DiffPrivStatisticKind
+            The kind of statistics to perform on each group.
+        epsilon : float
+            The privacy budget of each statistic.
+        [bounds] : tuple
+            The `(lower, upper)` bounds of the values, which are clipped to them and
+            which define the sensitivity of the sum, mean and variance. When `None`,
+            the min and max values of each group are used.
+        [dtype] : None|dtype
+            The floating point precision (e.g. `float32`) used for the noise and
+            the post-processing. When `None`, double precision is used.
+        [rng] : None|int|SeedSequence|BitGenerator|Generator
+            The random generator or seed used to draw the noise. When `None`, the
+            numpy legacy global random state is used.
+
+        Returns
+        -------
+        tuple
+            The sorted unique keys (`ndarray`) and the dictionary of calculated
+            statistics where keys are of type `DiffPrivStatisticKind` and values are
+            of type `ndarray` holding a value per unique key.
+
+        Raises
+        ------
+        DiffPrivSizeMismatch
+            The exception is raised when the amount of values and keys differ.
+
+        """
+        values = np.ravel(DiffPrivStorage.load(values))
+        keys = np.ravel(keys)
+        if values.size != keys.size:
+            raise DiffPrivSizeMismatch(
+                "Values and keys have different sizes! [{} != {}]".format(
+                    values.size, keys.size
+                )
+            )
+
+        groups, codes = cls.factorize_keys(keys)
+        if bounds is not None:
+            values = np.clip(values, bounds[0], bounds[1])
+
+        n = np.bincount(codes, minlength=groups.size)
+        lower = np.full(groups.shape, np.inf)
+        upper = np.full(groups.shape, -np.inf)
+        np.minimum.at(lower, codes, values)
+        np.maximum.at(upper, codes, values)
+        count = np.bincount(codes, weights=values != 0, minlength=groups.size)
+        total = np.bincount(codes, weights=values, minlength=groups.size)
+        mean = total / n
+        aggregates = []
+        if bool(kind & DiffPrivStatisticKind.count):
+            aggregates.append((DiffPrivStatisticKind.count, count))
+
+        if bool(kind & DiffPrivStatisticKind.min):
+            aggregates.append((DiffPrivStatisticKind.min, lower))
+
+        if bool(kind & DiffPrivStatisticKind.max):
+            aggregates.append((DiffPrivStatisticKind.max, upper))
+
+        if bool(kind & DiffPrivStatisticKind.median):
+            ordered = values[np.lexsort((values, codes))]
+            starts = np.cumsum(n) - n
+            value = 0.5 * (ordered[starts + (n - 1) // 2] + ordered[starts + n // 2])
+            aggregates.append((DiffPrivStatisticKind.median, value))
+
+        if bool(kind & DiffPrivStatisticKind.proportion):
+            aggregates.append((DiffPrivStatisticKind.proportion, count / n))
+
+        if bool(kind & DiffPrivStatisticKind.sum):
+            aggregates.append((DiffPrivStatisticKind.sum, total))
+
+        if bool(kind & DiffPrivStatisticKind.mean):
+            aggregates.append((DiffPrivStatisticKind.mean, mean))
+
+        if bool(kind & DiffPrivStatisticKind.variance):
+            deviation = np.square(values - mean[codes])
+            value = np.bincount(codes, weights=deviation, minlength=groups.size) / n
+            aggregates.append((DiffPrivStatisticKind.variance, value))
+
+        kinds = [statistic_kind for statistic_kind, _ in aggregates]
+        sensitivity_lower, sensitivity_upper = (
+            (lower, upper) if bounds is None else bounds
+        )
+        anonymized = DiffPrivLaplaceMechanism.anonymize_batch_with_budget(
+            np.concatenate([value for _, value in aggregates]),
+            np.repeat(
+                BatchGlobalSensitivity.encode(
+                    [statistic_kind.name for statistic_kind in kinds]
+                ),
+                groups.size,
+            ),
+            epsilon,
+            lower=np.tile(np.broadcast_to(sensitivity_lower, groups.shape), len(kinds)),
+            upper=np.tile(np.broadcast_to(sensitivity_upper, groups.shape), len(kinds)),
+            n=np.tile(n, len(kinds)),
+            dtype=dtype,
+            rng=rng,
+        )
+        stats = dict(zip(kinds, np.split(anonymized, len(kinds))))
+        if DiffPrivStatisticKind.count in stats:
+            value = np.clip(stats[DiffPrivStatisticKind.count], 0.0, n, dtype=dtype)
+            value = np.round(value)
+            stats[DiffPrivStatisticKind.count] = value
+
+        if DiffPrivStatisticKind.proportion in stats:
+            value = stats[DiffPrivStatisticKind.proportion]
+            value = np.clip(value, 0.0, 1.0, dtype=dtype)
+            stats[DiffPrivStatisticKind.proportion] = value
+
+        return groups, stats
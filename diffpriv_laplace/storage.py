@@ -0,0 +1,190 @@
+import math
+import mmap
+import os
+import numpy as np
+from diffpriv_laplace.exceptions import DiffPrivInvalidDimensions
+
+
+class DiffPrivStorage(object):
+    """
+    Helpers to read data from memory-mapped files (`.npy` or raw binary) in page
+    aligned chunks so that the data never has to be loaded in memory at once.
+    """
+
+    chunk_bytes = 16 * 1024 * 1024
+
+    @classmethod
+    def load(cls, data, dtype=None, shape=None):
+        """
+        Memory-maps the data when it is a file path. Any other data is returned as
+        is.
+
+        Parameters
+        ----------
+        data : str|PathLike|list|ndarray|memmap
+            The data or the path of a `.npy` or raw binary file.
+        [dtype] : None|dtype
+            The type of the elements of a raw binary file. When `None`, double
+            precision is used. Ignored for `.npy` files.
+        [shape] : None|int|tuple
+            The shape of a raw binary file. When `None`, the file is mapped as a one
+            dimensional array. Ignored for `.npy` files.
+
+        Returns
+        -------
+        list|ndarray|memmap
+            The read-only memory-mapped data or the provided data.
+
+        """
+        if not isinstance(data, (str, os.PathLike)):
+            return data
+
+        if os.fspath(data).endswith(".npy"):
+            mapped = np.load(data, mmap_mode="r")
+        else:
+            dtype = np.float64 if dtype is None else dtype
+            mapped = np.memmap(data, dtype=dtype, mode="r", shape=shape)
+
+        return mapped
+
+    @classmethod
+    def is_mapped(cls, data):
+        """
+        Indicates whether or not the data is memory-mapped.
+
+        Parameters
+        ----------
+        data : list|ndarray|memmap
+            The data.
+
+        Returns
+        -------
+        bool
+            `True` when the data is a `memmap`.
+
+        """
+        value = isinstance(data, np.memmap)
+        return value
+
+    @classmethod
+    def chunks(cls, data, chunk_bytes=None):
+        """
+        Splits the data along its first axis into chunks of at most `chunk_bytes`
+        (or a single row). When the row size allows it, the chunks hold a multiple
+        of the page size and the first chunk is shortened so that the remaining
+        chunks start at a page boundary.
+
+        Parameters
+        ----------
+        data : ndarray|memmap
+            The data.
+        [chunk_bytes] : int
+            The approximate size of a chunk in bytes. When `None`, the class level
+            `chunk_bytes` is used.
+
+        Returns
+        -------
+        generator
+            The chunks as `ndarray` views of the data.
+
+        """
+        chunk_bytes = cls.chunk_bytes if chunk_bytes is None else chunk_bytes
+        length = np.shape(data)[0]
+        row_bytes = max(1, data.itemsize * int(np.prod(np.shape(data)[1:])))
+        rows = max(1, chunk_bytes // row_bytes)
+        start = 0
+        unit = mmap.PAGESIZE // math.gcd(mmap.PAGESIZE, row_bytes)
+        if rows >= unit:
+            rows = rows // unit * unit
+            address = data.__array_interface__["data"][0]
+            for head in range(0, min(unit, length)):
+                if (address + head * row_bytes) % mmap.PAGESIZE == 0:
+                    start = head
+                    break
+
+        if start:
+            yield np.asarray(data[:start])
+
+        for index in range(start, length, rows):
+            yield np.asarray(data[index : index + rows])
+
+    @classmethod
+    def data_slice_axes(cls, data, axis=None):
+        """
+        Splits the axes of N dimensional data into the axes which index the data
+        slices and the axes along which each data slice is reduced.
+
+        Parameters
+        ----------
+        data : list|ndarray|memmap
+            The data.
+        [axis] : int|tuple
+            Axis or tuple of axes along which the data slices are reduced. When
+            `None`, the data slices are reduced along the first axis.
+
+        Returns
+        -------
+        tuple
+            The sorted tuple of data slice axes and the sorted tuple of reduction
+            axes.
+
+        Raises
+        ------
+        DiffPrivInvalidDimensions
+            The exception is raised when the data is a scalar, when no axis is
+            provided or when an axis is out of the data dimensions.
+
+        """
+        ndim = np.ndim(data)
+        axes = np.atleast_1d(0 if axis is None else axis)
+        if ndim == 0 or axes.size == 0 or np.any((axes < -ndim) | (axes >= ndim)):
+            raise DiffPrivInvalidDimensions(
+                "Invalid axis {} for data dimension: {}".format(axis, ndim)
+            )
+
+        reduce_axes = tuple(sorted({int(index) % ndim for index in axes}))
+        slice_axes = tuple(index for index in range(ndim) if index not in reduce_axes)
+        return slice_axes, reduce_axes
+
+    @classmethod
+    def data_slice_chunks(cls, data, indices, iter_axis, chunk_bytes=None):
+        """
+        Splits N dimensional data slices into chunks while reading the data once.
+        When the first axis indexes the data slices, each data slice is split along
+        its length, whereas otherwise the data slices are split along blocks of rows
+        shared by all of them. The chunks are strided views of the data.
+
+        Parameters
+        ----------
+        data : ndarray|memmap
+            The data.
+        indices : list|ndarray
+            The flat indices of the data slices over the `iter_axis` axes.
+        iter_axis : int|tuple
+            Axis or tuple of axes along which the data slices are taken.
+        [chunk_bytes] : int
+            The approximate size of a chunk in bytes. When `None`, the class level
+            `chunk_bytes` is used.
+
+        Returns
+        -------
+        generator
+            The `(index, chunk)` tuples where the chunk is part of data slice
+            `index`.
+
+        """
+        ndim = np.ndim(data)
+        axes = tuple(int(index) % ndim for index in np.atleast_1d(iter_axis))
+        front = tuple(range(len(axes)))
+        shape = tuple(np.shape(data)[index] for index in axes)
+        if 0 in axes:
+            data_slices = np.moveaxis(data, axes, front)
+            for index in indices:
+                data_slice = data_slices[np.unravel_index(index, shape)]
+                for chunk in cls.chunks(data_slice, chunk_bytes=chunk_bytes):
+                    yield index, chunk
+        else:
+            for block in cls.chunks(data, chunk_bytes=chunk_bytes):
+                block_slices = np.moveaxis(block, axes, front)
+                for index in indices:
+                    yield index, block_slices[np.unravel_index(index, shape)]
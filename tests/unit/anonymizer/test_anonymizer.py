@@ -2,6 +2,7 @@ import unittest
 import mock
 import numpy as np
 from diffpriv_laplace.anonymizer.base import DiffPrivAnonymizer
+from diffpriv_laplace.exceptions import DiffPrivInvalidOutput
 
 
 class TestDiffPrivAnonymizer(unittest.TestCase):
@@ -65,3 +66,110 @@ class TestDiffPrivAnonymizer(unittest.TestCase):
         self.set_seed()
         values = anonymizer.apply([87.0, 435.0])
         np.testing.assert_almost_equal(values, expected_values)
+
+    def test_rng_getter_default(self):
+        gs = self.create_mock_gs()
+        epsilon = 1.0
+        anonymizer = DiffPrivAnonymizer(gs, epsilon)
+        self.assertIs(anonymizer.rng, np.random)
+
+    def test_rng_getter(self):
+        gs = self.create_mock_gs()
+        epsilon = 1.0
+        rng = np.random.default_rng(31337)
+        anonymizer = DiffPrivAnonymizer(gs, epsilon, rng=rng)
+        self.assertIs(anonymizer.rng, rng)
+
+    def test_apply_with_rng_seed(self):
+        expected_values = np.random.default_rng(31337).laplace(87.0, 1.0, size=3)
+        gs = self.create_mock_gs()
+        epsilon = 1.0
+        anonymizer = DiffPrivAnonymizer(gs, epsilon, rng=31337)
+        self.assertIsInstance(anonymizer.rng, np.random.Generator)
+        values = anonymizer.apply(87.0, size=3)
+        np.testing.assert_almost_equal(values, expected_values)
+
+    def test_apply_out(self):
+        expected_values = np.array([87.5864551, 89.701297, 86.4519884])
+        gs = self.create_mock_gs()
+        epsilon = 1.0
+        anonymizer = DiffPrivAnonymizer(gs, epsilon)
+        out = np.zeros(3)
+        self.set_seed()
+        values = anonymizer.apply(87.0, out=out)
+        self.assertIs(values, out)
+        np.testing.assert_almost_equal(values, expected_values)
+
+    def test_apply_out_inplace(self):
+        expected_values = np.array([87.5864551, 437.701297])
+        gs = self.create_mock_gs()
+        epsilon = 1.0
+        anonymizer = DiffPrivAnonymizer(gs, epsilon)
+        values = np.array([87.0, 435.0])
+        self.set_seed()
+        anonymized = anonymizer.apply(values, out=values)
+        self.assertIs(anonymized, values)
+        np.testing.assert_almost_equal(values, expected_values)
+
+    def test_apply_out_chunked(self):
+        gs = self.create_mock_gs()
+        epsilon = 1.0
+        anonymizer = DiffPrivAnonymizer(gs, epsilon)
+        values = np.full((2, 2), 87.0)
+        self.set_seed()
+        with mock.patch.object(DiffPrivAnonymizer, "chunk_size", 2):
+            anonymizer.apply(values, out=values)
+
+        self.set_seed()
+        expected_values = anonymizer.apply(87.0, size=(2, 2))
+        np.testing.assert_almost_equal(values, expected_values)
+
+    def test_apply_out_scalar(self):
+        expected_value = 87.58645513850368
+        gs = self.create_mock_gs()
+        epsilon = 1.0
+        anonymizer = DiffPrivAnonymizer(gs, epsilon)
+        out = np.array(87.0)
+        self.set_seed()
+        anonymizer.apply(out, out=out)
+        np.testing.assert_almost_equal(out, expected_value)
+
+    def test_apply_out_invalid_output_error(self):
+        gs = self.create_mock_gs()
+        epsilon = 1.0
+        anonymizer = DiffPrivAnonymizer(gs, epsilon)
+        for out in [np.full(3, 7, dtype=np.int64), np.ones(3, dtype=bool)]:
+            expected_values = out.copy()
+            with self.assertRaises(DiffPrivInvalidOutput):
+                anonymizer.apply([87.0, 435.0, 0.0], out=out)
+
+            np.testing.assert_equal(out, expected_values)
+
+    def test_dtype_getter_default(self):
+        gs = self.create_mock_gs()
+        epsilon = 1.0
+        anonymizer = DiffPrivAnonymizer(gs, epsilon)
+        self.assertIsNone(anonymizer.dtype)
+
+    def test_scale_float32(self):
+        gs = self.create_mock_gs()
+        epsilon = 0.1
+        anonymizer = DiffPrivAnonymizer(gs, epsilon, dtype=np.float32)
+        self.assertEqual(anonymizer.dtype, np.float32)
+        self.assertIsInstance(anonymizer.scale, np.float32)
+        np.testing.assert_almost_equal(anonymizer.scale, 10.0, decimal=5)
+
+    def test_apply_float32(self):
+        gs = self.create_mock_gs()
+        epsilon = 1.0
+        anonymizer = DiffPrivAnonymizer(gs, epsilon, rng=31337, dtype=np.float32)
+        values = anonymizer.apply([87.0, 435.0])
+        self.assertEqual(values.dtype, np.float32)
+
+    def test_slots(self):
+        gs = self.create_mock_gs()
+        epsilon = 1.0
+        anonymizer = DiffPrivAnonymizer(gs, epsilon)
+        self.assertFalse(hasattr(anonymizer, "__dict__"))
+        with self.assertRaises(AttributeError):
+            anonymizer.chunk_size = 2
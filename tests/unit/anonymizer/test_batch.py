@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+from diffpriv_laplace.anonymizer.batch import DiffPrivBatchAnonymizer
+
+
+class TestDiffPrivBatchAnonymizer(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def set_seed(self):
+        np.random.seed(31337)
+
+    def test_codes_getter(self):
+        anonymizer = DiffPrivBatchAnonymizer(1.0, ["count", "max"])
+        np.testing.assert_equal(anonymizer.codes, [0, 3])
+
+    def test_scale_getter(self):
+        epsilon = np.array([1.0, 2.0, 0.5])
+        kinds = ["count", "sum", "mean"]
+        anonymizer = DiffPrivBatchAnonymizer(
+            epsilon, kinds, lower=[0.0, -5.0, 0.0], upper=[0.0, 10.0, 4.0], n=2.0
+        )
+        np.testing.assert_almost_equal(anonymizer.scale, [1.0, 5.0, 4.0])
+
+    def test_apply(self):
+        epsilon = np.array([1.0, 2.0, 0.5])
+        kinds = ["count", "sum", "mean"]
+        values = np.array([87.0, 435.0, 2.0])
+        anonymizer = DiffPrivBatchAnonymizer(
+            epsilon, kinds, lower=[0.0, -5.0, 0.0], upper=[0.0, 10.0, 4.0], n=2.0
+        )
+        self.set_seed()
+        anonymized = anonymizer.apply(values)
+        self.set_seed()
+        expected_values = np.random.laplace(values, [1.0, 5.0, 4.0])
+        np.testing.assert_almost_equal(anonymized, expected_values)
+
+    def test_apply_rng(self):
+        kinds = ["count", "counting"]
+        values = np.array([87.0, 435.0])
+        anonymizer = DiffPrivBatchAnonymizer(1.0, kinds, rng=1)
+        anonymized = anonymizer.apply(values)
+        expected_values = np.random.default_rng(1).laplace(values, 1.0)
+        np.testing.assert_almost_equal(anonymized, expected_values)
@@ -0,0 +1,61 @@
+import unittest
+import numpy as np
+from diffpriv_laplace.anonymizer.cache import DiffPrivAnonymizerCache
+
+
+class TestDiffPrivAnonymizerCache(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_maxsize_getter(self):
+        cache = DiffPrivAnonymizerCache(maxsize=3)
+        self.assertEqual(cache.maxsize, 3)
+
+    def test_get_hit_and_miss(self):
+        cache = DiffPrivAnonymizerCache()
+        first = cache.get(("count", 1.0), object)
+        second = cache.get(("count", 1.0), object)
+        third = cache.get(("count", 2.0), object)
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(len(cache), 2)
+
+    def test_get_evicts_least_recently_used(self):
+        cache = DiffPrivAnonymizerCache(maxsize=2)
+        first = cache.get(1, object)
+        cache.get(2, object)
+        cache.get(1, object)
+        cache.get(3, object)
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get(1, object), first)
+        self.assertEqual(cache.misses, 3)
+        cache.get(2, object)
+        self.assertEqual(cache.misses, 4)
+
+    def test_get_unhashable(self):
+        cache = DiffPrivAnonymizerCache()
+        key = ("sum", np.array([1.0, 2.0]))
+        first = cache.get(key, object)
+        second = cache.get(key, object)
+        self.assertIsNot(first, second)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.misses, 2)
+
+    def test_get_disabled(self):
+        cache = DiffPrivAnonymizerCache(maxsize=0)
+        self.assertIsNot(cache.get(1, object), cache.get(1, object))
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = DiffPrivAnonymizerCache()
+        cache.get(1, object)
+        cache.get(1, object)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
@@ -0,0 +1,115 @@
+import unittest
+import mock
+import numpy as np
+from diffpriv_laplace.anonymizer.discrete_counting import (
+    DiffPrivDiscreteCountingAnonymizer,
+)
+from diffpriv_laplace.sampler.noise_pool import DiffPrivNoisePool
+from diffpriv_laplace.sampler.parallel import DiffPrivParallelSampler
+from diffpriv_laplace.sampler.secure import DiffPrivSecureSampler
+from diffpriv_laplace.exceptions import (
+    DiffPrivInvalidOutput,
+    DiffPrivUnsupportedSampler,
+)
+
+
+class TestDiffPrivDiscreteCountingAnonymizer(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_global_sensitivity_getter(self):
+        epsilon = 1.0
+        anonymizer = DiffPrivDiscreteCountingAnonymizer(epsilon)
+        self.assertEqual(anonymizer.global_sensitivity.value, 1.0)
+
+    def test_epsilon_getter(self):
+        epsilon = 1.0
+        anonymizer = DiffPrivDiscreteCountingAnonymizer(epsilon)
+        self.assertEqual(anonymizer.epsilon, epsilon)
+
+    def test_scale_getter(self):
+        epsilon = 1.0
+        scale = 1.0 / epsilon
+        anonymizer = DiffPrivDiscreteCountingAnonymizer(epsilon)
+        self.assertEqual(anonymizer.scale, scale)
+
+    def test_dtype_getter(self):
+        epsilon = 1.0
+        anonymizer = DiffPrivDiscreteCountingAnonymizer(epsilon, dtype=np.int32)
+        self.assertEqual(anonymizer.dtype, np.int32)
+
+    def test_apply_single(self):
+        epsilon = 1.0
+        anonymizer = DiffPrivDiscreteCountingAnonymizer(epsilon, rng=31337)
+        value = anonymizer.apply(87)
+        self.assertIsInstance(value, np.int64)
+
+    def test_apply_single_many(self):
+        epsilon = 1.0
+        anonymizer = DiffPrivDiscreteCountingAnonymizer(
+            epsilon, rng=31337, dtype=np.int32
+        )
+        values = anonymizer.apply(87, size=3)
+        self.assertEqual(values.dtype, np.int32)
+        self.assertEqual(values.shape, (3,))
+
+    def test_apply_multiple(self):
+        expected_values = np.array([87, 435])
+        epsilon = 1000000.0
+        anonymizer = DiffPrivDiscreteCountingAnonymizer(epsilon, rng=31337)
+        values = anonymizer.apply([87.0, 435.0])
+        np.testing.assert_equal(values, expected_values)
+
+    def test_apply_out_inplace(self):
+        epsilon = 1.0
+        anonymizer = DiffPrivDiscreteCountingAnonymizer(epsilon, rng=31337)
+        values = np.full(5, 87, dtype=np.int32)
+        with mock.patch.object(DiffPrivDiscreteCountingAnonymizer, "chunk_size", 2):
+            anonymized = anonymizer.apply(values, out=values)
+
+        self.assertIs(anonymized, values)
+        self.assertEqual(values.dtype, np.int32)
+
+    def test_apply_out_float(self):
+        epsilon = 1000000.0
+        anonymizer = DiffPrivDiscreteCountingAnonymizer(epsilon, rng=31337)
+        values = np.array([87.0, 435.0])
+        anonymizer.apply(values, out=values)
+        np.testing.assert_equal(values, [87.0, 435.0])
+
+    def test_apply_out_invalid_output_error(self):
+        epsilon = 1.0
+        anonymizer = DiffPrivDiscreteCountingAnonymizer(epsilon, rng=31337)
+        out = np.zeros(2, dtype=bool)
+        with self.assertRaises(DiffPrivInvalidOutput):
+            anonymizer.apply([87, 435], out=out)
+
+    def test_apply_distribution(self):
+        epsilon = 0.5
+        alpha = np.exp(-epsilon)
+        expected_variance = 2.0 * alpha / np.square(1.0 - alpha)
+        anonymizer = DiffPrivDiscreteCountingAnonymizer(epsilon, rng=31337)
+        values = anonymizer.apply(0, size=200000)
+        np.testing.assert_almost_equal(np.mean(values), 0.0, decimal=1)
+        np.testing.assert_almost_equal(
+            np.var(values) / expected_variance, 1.0, decimal=1
+        )
+
+    def test_slots(self):
+        epsilon = 1.0
+        anonymizer = DiffPrivDiscreteCountingAnonymizer(epsilon)
+        self.assertFalse(hasattr(anonymizer, "__dict__"))
+
+    def test_unsupported_sampler_error(self):
+        epsilon = 1.0
+        samplers = [
+            DiffPrivNoisePool(capacity=16, background=False),
+            DiffPrivSecureSampler(),
+            DiffPrivParallelSampler(workers=1),
+        ]
+        for sampler in samplers:
+            with self.assertRaises(DiffPrivUnsupportedSampler):
+                DiffPrivDiscreteCountingAnonymizer(epsilon, rng=sampler)
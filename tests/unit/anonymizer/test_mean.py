@@ -96,3 +96,12 @@ class TestDiffPrivMeanAnonymizer(unittest.TestCase):
         self.set_seed()
         values = anonymizer.apply([87.0, 435.0])
         np.testing.assert_almost_equal(values, expected_values)
+
+    def test_slots(self):
+        lower = 10.0
+        upper = 99.0
+        n = 100.0
+        epsilon = 1.0
+        anonymizer = DiffPrivMeanAnonymizer(epsilon, lower, upper, n)
+        self.assertFalse(hasattr(anonymizer, "__dict__"))
+        self.assertFalse(hasattr(anonymizer.global_sensitivity, "__dict__"))
@@ -1,4 +1,5 @@
 import unittest
+import mock
 import numpy as np
 from diffpriv_laplace.anonymizer.sum import DiffPrivSumAnonymizer
 
@@ -80,3 +81,32 @@ class TestDiffPrivSumAnonymizer(unittest.TestCase):
         self.set_seed()
         values = anonymizer.apply([87.0, 435.0])
         np.testing.assert_almost_equal(values, expected_values)
+
+    def test_apply_multiple_bounds(self):
+        lower = np.array([10.0, -20.0])
+        upper = np.array([99.0, 50.0])
+        epsilon = 1.0
+        anonymizer = DiffPrivSumAnonymizer(epsilon, lower, upper)
+        np.testing.assert_almost_equal(anonymizer.scale, [99.0, 50.0])
+        self.set_seed()
+        values = anonymizer.apply([87.0, 435.0])
+        self.set_seed()
+        expected_values = np.random.laplace([87.0, 435.0], [99.0, 50.0])
+        np.testing.assert_almost_equal(values, expected_values)
+
+    def test_apply_multiple_bounds_out(self):
+        lower = np.array([[10.0], [-20.0], [0.0]])
+        upper = np.array([[99.0], [50.0], [1.0]])
+        epsilon = 1.0
+        anonymizer = DiffPrivSumAnonymizer(epsilon, lower, upper)
+        values = np.full((3, 2), 10.0)
+        self.set_seed()
+        with mock.patch.object(DiffPrivSumAnonymizer, "chunk_size", 2):
+            out = anonymizer.apply(values, out=values)
+
+        self.set_seed()
+        expected_values = np.full((3, 2), 10.0) + np.random.laplace(
+            0.0, [[99.0, 99.0], [50.0, 50.0], [1.0, 1.0]]
+        )
+        self.assertIs(out, values)
+        np.testing.assert_almost_equal(out, expected_values)
@@ -0,0 +1,34 @@
+import unittest
+import numpy as np
+from diffpriv_laplace.anonymizer.weighted_count import DiffPrivWeightedCountAnonymizer
+
+
+class TestDiffPrivWeightedCountAnonymizer(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def set_seed(self):
+        np.random.seed(31337)
+
+    def test_max_weight_getter(self):
+        epsilon = 1.0
+        max_weight = 3.0
+        anonymizer = DiffPrivWeightedCountAnonymizer(epsilon, max_weight)
+        self.assertEqual(anonymizer.max_weight, max_weight)
+
+    def test_scale_getter(self):
+        epsilon = 0.5
+        max_weight = 3.0
+        anonymizer = DiffPrivWeightedCountAnonymizer(epsilon, max_weight)
+        self.assertEqual(anonymizer.scale, max_weight / epsilon)
+
+    def test_apply_multiple(self):
+        expected_values = np.array([88.7593654, 443.103891])
+        epsilon = 1.0
+        anonymizer = DiffPrivWeightedCountAnonymizer(epsilon, 3.0)
+        self.set_seed()
+        values = anonymizer.apply([87.0, 435.0])
+        np.testing.assert_almost_equal(values, expected_values)
@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+from diffpriv_laplace.anonymizer.weighted_sum import DiffPrivWeightedSumAnonymizer
+
+
+class TestDiffPrivWeightedSumAnonymizer(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def set_seed(self):
+        np.random.seed(31337)
+
+    def test_getters(self):
+        lower = 10.0
+        upper = 99.0
+        epsilon = 1.0
+        max_weight = 2.0
+        anonymizer = DiffPrivWeightedSumAnonymizer(epsilon, lower, upper, max_weight)
+        self.assertEqual(anonymizer.lower, lower)
+        self.assertEqual(anonymizer.upper, upper)
+        self.assertEqual(anonymizer.max_weight, max_weight)
+
+    def test_scale_getter(self):
+        lower = 10.0
+        upper = 99.0
+        epsilon = 0.5
+        anonymizer = DiffPrivWeightedSumAnonymizer(epsilon, lower, upper, 2.0)
+        self.assertEqual(anonymizer.scale, 396.0)
+
+    def test_apply_multiple(self):
+        expected_values = np.array([203.1181174, 969.8568126])
+        lower = 10.0
+        upper = 99.0
+        epsilon = 1.0
+        anonymizer = DiffPrivWeightedSumAnonymizer(epsilon, lower, upper, 2.0)
+        self.set_seed()
+        values = anonymizer.apply([87.0, 435.0])
+        np.testing.assert_almost_equal(values, expected_values)
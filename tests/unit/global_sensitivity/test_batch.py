@@ -0,0 +1,70 @@
+import unittest
+import numpy as np
+from diffpriv_laplace.exceptions import DiffPrivInvalidKind, DiffPrivMissingParameter
+from diffpriv_laplace.global_sensitivity.batch import BatchGlobalSensitivity
+
+
+class TestBatchGlobalSensitivity(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_encode(self):
+        kinds = ["count", "median", "proportion", "variance"]
+        codes = BatchGlobalSensitivity.encode(kinds)
+        np.testing.assert_equal(codes, [0, 4, 5, 8])
+
+    def test_encode_codes(self):
+        codes = np.array([1, 2, 3])
+        self.assertIs(BatchGlobalSensitivity.encode(codes), codes)
+
+    def test_encode_invalid_kind(self):
+        kinds = ["count", "discrete_counting"]
+        with self.assertRaises(DiffPrivInvalidKind):
+            BatchGlobalSensitivity.encode(kinds)
+
+    def test_encode_invalid_codes(self):
+        for codes in (np.array([0, 9]), np.array([-1, 2])):
+            with self.assertRaises(DiffPrivInvalidKind):
+                BatchGlobalSensitivity.encode(codes)
+
+    def test_invalid_codes(self):
+        codes = np.array([0, 42])
+        with self.assertRaises(DiffPrivInvalidKind):
+            BatchGlobalSensitivity.calculate_value(codes)
+
+        with self.assertRaises(DiffPrivInvalidKind):
+            BatchGlobalSensitivity(codes)
+
+    def test_value(self):
+        kinds = ["count", "min", "proportion", "sum", "mean", "variance"]
+        lower = np.array([0.0, 0.0, 0.0, -20.0, 10.0, 10.0])
+        upper = np.array([0.0, 0.0, 0.0, 10.0, 30.0, 30.0])
+        n = np.array([1.0, 1.0, 4.0, 1.0, 10.0, 10.0])
+        expected_value = [1.0, 1.0, 0.25, 20.0, 2.0, 40.0]
+        gs = BatchGlobalSensitivity(kinds, lower=lower, upper=upper, n=n)
+        np.testing.assert_almost_equal(gs.value, expected_value)
+
+    def test_value_broadcast(self):
+        kinds = ["sum", "sum", "counting"]
+        gs = BatchGlobalSensitivity(kinds, lower=-2.0, upper=[1.0, 5.0, 0.0])
+        np.testing.assert_almost_equal(gs.value, [2.0, 5.0, 1.0])
+
+    def test_value_float32(self):
+        kinds = ["mean", "count"]
+        gs = BatchGlobalSensitivity(kinds, lower=0.0, upper=1.0, n=3.0, dtype="float32")
+        self.assertEqual(gs.value.dtype, np.float32)
+
+    def test_missing_parameter(self):
+        kinds = ["count", "mean"]
+        with self.assertRaises(DiffPrivMissingParameter):
+            BatchGlobalSensitivity(kinds, lower=0.0, upper=1.0)
+
+    def test_missing_unused_parameter(self):
+        kinds = ["count", "proportion"]
+        gs = BatchGlobalSensitivity(kinds, n=2.0)
+        np.testing.assert_almost_equal(gs.value, [1.0, 0.5])
+        self.assertIsNone(gs.lower)
+        self.assertIsNone(gs.upper)
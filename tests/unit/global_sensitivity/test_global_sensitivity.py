@@ -14,9 +14,13 @@ class TestGlobalSensitivity(unittest.TestCase):
         gs = GlobalSensitivity(value)
         self.assertEqual(gs.value, value)
 
-    def test_setter(self):
+    def test_immutable(self):
         value = 5
         gs = GlobalSensitivity(value)
-        new_value = 6
-        gs.value = new_value
-        self.assertEqual(gs.value, new_value)
+        with self.assertRaises(AttributeError):
+            gs.value = 6
+
+        with self.assertRaises(AttributeError):
+            gs.lower = 0.0
+
+        self.assertEqual(gs.value, value)
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from diffpriv_laplace.global_sensitivity.mean import MeanGlobalSensitivity
 
 
@@ -37,3 +38,13 @@ class TestMeanGlobalSensitivity(unittest.TestCase):
         n = 100.0
         gs = MeanGlobalSensitivity(lower, upper, n)
         self.assertEqual(gs.upper, upper)
+
+    def test_dtype(self):
+        lower = 10.0
+        upper = 99.0
+        n = 100.0
+        gs = MeanGlobalSensitivity(lower, upper, n, dtype=np.float32)
+        self.assertIsInstance(gs.lower, np.float32)
+        self.assertIsInstance(gs.upper, np.float32)
+        self.assertIsInstance(gs.n, np.float32)
+        self.assertIsInstance(gs.value, np.float32)
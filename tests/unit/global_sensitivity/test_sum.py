@@ -28,3 +28,9 @@ class TestSumGlobalSensitivity(unittest.TestCase):
         upper = 99.0
         gs = SumGlobalSensitivity(lower, upper)
         self.assertEqual(gs.upper, upper)
+
+    def test_value_array(self):
+        lower = np.array([-120.0, 10.0])
+        upper = np.array([99.0, 99.0])
+        gs = SumGlobalSensitivity(lower, upper)
+        np.testing.assert_almost_equal(gs.value, [120.0, 99.0])
@@ -0,0 +1,26 @@
+import unittest
+from diffpriv_laplace.global_sensitivity.weighted_count import (
+    WeightedCountGlobalSensitivity,
+)
+
+
+class TestWeightedCountGlobalSensitivity(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_value(self):
+        gs = WeightedCountGlobalSensitivity()
+        self.assertEqual(gs.value, 1.0)
+
+    def test_value_max_weight(self):
+        max_weight = 12.0
+        gs = WeightedCountGlobalSensitivity(max_weight)
+        self.assertEqual(gs.value, max_weight)
+
+    def test_max_weight_getter(self):
+        max_weight = 12.0
+        gs = WeightedCountGlobalSensitivity(max_weight)
+        self.assertEqual(gs.max_weight, max_weight)
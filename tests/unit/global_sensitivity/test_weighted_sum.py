@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+from diffpriv_laplace.global_sensitivity.weighted_sum import (
+    WeightedSumGlobalSensitivity,
+)
+
+
+class TestWeightedSumGlobalSensitivity(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_value(self):
+        lower = -120.0
+        upper = 99.0
+        max_weight = 3.0
+        gs = WeightedSumGlobalSensitivity(lower, upper, max_weight)
+        self.assertEqual(gs.value, 360.0)
+
+    def test_value_default_max_weight(self):
+        lower = 10.0
+        upper = 99.0
+        gs = WeightedSumGlobalSensitivity(lower, upper)
+        self.assertEqual(gs.value, 99.0)
+
+    def test_getters(self):
+        lower = 10.0
+        upper = 99.0
+        max_weight = 3.0
+        gs = WeightedSumGlobalSensitivity(lower, upper, max_weight)
+        self.assertEqual(gs.lower, lower)
+        self.assertEqual(gs.upper, upper)
+        self.assertEqual(gs.max_weight, max_weight)
+
+    def test_value_array(self):
+        lower = np.array([-120.0, 10.0])
+        upper = np.array([99.0, 99.0])
+        gs = WeightedSumGlobalSensitivity(lower, upper, 2.0)
+        np.testing.assert_almost_equal(gs.value, [240.0, 198.0])
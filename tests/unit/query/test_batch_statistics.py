@@ -0,0 +1,191 @@
+import unittest
+import mock
+import numpy as np
+from diffpriv_laplace import (
+    DiffPrivParallelStatisticsQuery,
+    DiffPrivSequentialStatisticsQuery,
+    DiffPrivStatisticKind,
+)
+from diffpriv_laplace.laplace_mechanism import DiffPrivLaplaceMechanism
+from diffpriv_laplace.query.batch_statistics import DiffPrivBatchStatisticsQuery
+from diffpriv_laplace.storage import DiffPrivStorage
+from diffpriv_laplace.exceptions import (
+    DiffPrivInvalidQuery,
+    DiffPrivMissingParameter,
+    DiffPrivSizeMismatch,
+)
+
+
+class TestDiffPrivBatchStatisticsQuery(unittest.TestCase):
+    epsilon = 1000000
+    decimal_places = 2
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def set_seed(self):
+        np.random.seed(31337)
+
+    def assert_results(self, results, expected_results):
+        self.assertEqual(len(results), len(expected_results))
+        for result, expected_result in zip(results, expected_results):
+            if expected_result is None:
+                self.assertIsNone(result)
+                continue
+
+            self.assertEqual(set(result), set(expected_result))
+            for key, value in result.items():
+                self.assertAlmostEqual(value, expected_result[key], self.decimal_places)
+
+    def test_calculate_query_epsilon(self):
+        kinds = [DiffPrivStatisticKind.all, DiffPrivStatisticKind.count]
+        queries = [
+            ({"kinds": kinds, "epsilon": 9.0}, 1.0),
+            ({"kinds": kinds, "epsilon": 9.0, "composition": "parallel"}, 9.0),
+            ({"kinds": DiffPrivStatisticKind.all, "epsilon": 9.0}, 9.0),
+        ]
+        for query, expected_value in queries:
+            value = DiffPrivBatchStatisticsQuery.calculate_query_epsilon(query)
+            self.assertAlmostEqual(value, expected_value)
+
+    def test_query(self):
+        data = np.random.default_rng(31337).normal(0.0, 1.0, size=(200, 3))
+        queries = [
+            {
+                "kinds": [
+                    DiffPrivStatisticKind.all,
+                    DiffPrivStatisticKind.min,
+                    DiffPrivStatisticKind.mean | DiffPrivStatisticKind.variance,
+                ],
+                "epsilon": self.epsilon,
+            },
+            {
+                "kinds": [DiffPrivStatisticKind.median] * 3,
+                "epsilon": self.epsilon,
+                "composition": "parallel",
+            },
+            {
+                "kinds": [DiffPrivStatisticKind.count | DiffPrivStatisticKind.max]
+                * 200,
+                "epsilon": self.epsilon,
+                "axis": 1,
+            },
+            {
+                "kinds": DiffPrivStatisticKind.sum,
+                "epsilon": self.epsilon,
+                "axis": (0, 1),
+            },
+        ]
+        self.set_seed()
+        expected_results = [
+            DiffPrivSequentialStatisticsQuery.query(
+                data, queries[0]["kinds"], queries[0]["epsilon"]
+            ),
+            DiffPrivParallelStatisticsQuery.query(
+                data, queries[1]["kinds"], queries[1]["epsilon"]
+            ),
+            DiffPrivSequentialStatisticsQuery.query(
+                data, queries[2]["kinds"], queries[2]["epsilon"], axis=1
+            ),
+            DiffPrivSequentialStatisticsQuery.query(
+                data, queries[3]["kinds"], queries[3]["epsilon"], axis=(0, 1)
+            ),
+        ]
+        self.set_seed()
+        with mock.patch.object(
+            DiffPrivLaplaceMechanism,
+            "anonymize_batch_with_budget",
+            wraps=DiffPrivLaplaceMechanism.anonymize_batch_with_budget,
+        ) as anonymize_batch_with_budget:
+            with mock.patch.object(
+                DiffPrivStorage, "chunks", wraps=DiffPrivStorage.chunks
+            ) as chunks:
+                results = DiffPrivBatchStatisticsQuery.query(data, queries)
+
+        anonymize_batch_with_budget.assert_called_once()
+        self.assertEqual(chunks.call_count, 3)
+        self.assertEqual(len(results), len(queries))
+        for result, expected_result in zip(results, expected_results):
+            self.assert_results(result, expected_result)
+
+    def test_query_condition(self):
+        data = np.arange(0.0, 20.0).reshape((10, 2))
+        queries = [
+            {
+                "kinds": [DiffPrivStatisticKind.count] * 2,
+                "epsilon": self.epsilon,
+                "condition": "x >= 10",
+            },
+            {
+                "kinds": [DiffPrivStatisticKind.proportion] * 2,
+                "epsilon": self.epsilon,
+                "condition": lambda chunk: chunk < 4.0,
+            },
+        ]
+        self.set_seed()
+        results = DiffPrivBatchStatisticsQuery.query(data, queries)
+        expected_results = [
+            [{DiffPrivStatisticKind.count: 5}, {DiffPrivStatisticKind.count: 5}],
+            [
+                {DiffPrivStatisticKind.proportion: 0.2},
+                {DiffPrivStatisticKind.proportion: 0.2},
+            ],
+        ]
+        for result, expected_result in zip(results, expected_results):
+            self.assert_results(result, expected_result)
+
+    def test_query_independent(self):
+        data = np.arange(0.0, 100.0)
+        queries = [{"kinds": DiffPrivStatisticKind.sum, "epsilon": 1.0}] * 2
+        results = DiffPrivBatchStatisticsQuery.query(data, queries, rng=31337)
+        self.assertNotEqual(
+            results[0][0][DiffPrivStatisticKind.sum],
+            results[1][0][DiffPrivStatisticKind.sum],
+        )
+        np.testing.assert_equal(
+            DiffPrivBatchStatisticsQuery.query(data, queries, rng=31337), results
+        )
+
+    def test_query_generator(self):
+        data = np.arange(0.0, 100.0)
+        queries = [{"kinds": DiffPrivStatisticKind.sum, "epsilon": 1.0}]
+        rng = np.random.default_rng(31337)
+        results = [
+            DiffPrivBatchStatisticsQuery.query(data, queries, rng=rng) for _ in range(2)
+        ]
+        self.assertNotEqual(
+            results[0][0][0][DiffPrivStatisticKind.sum],
+            results[1][0][0][DiffPrivStatisticKind.sum],
+        )
+        np.testing.assert_equal(
+            DiffPrivBatchStatisticsQuery.query(data, queries, rng=31337),
+            DiffPrivBatchStatisticsQuery.query(data, queries, rng=31337),
+        )
+
+    def test_missing_parameter_error(self):
+        data = np.zeros((10, 2))
+        for query in (
+            {"kinds": DiffPrivStatisticKind.count},
+            {"epsilon": self.epsilon},
+        ):
+            with self.assertRaises(DiffPrivMissingParameter):
+                DiffPrivBatchStatisticsQuery.query(data, [query])
+
+    def test_invalid_query_error(self):
+        data = np.zeros((10, 2))
+        query = {
+            "kinds": [DiffPrivStatisticKind.count] * 2,
+            "epsilon": self.epsilon,
+            "composition": "parallel sequential",
+        }
+        with self.assertRaises(DiffPrivInvalidQuery):
+            DiffPrivBatchStatisticsQuery.query(data, [query])
+
+    def test_size_mismatch_error(self):
+        data = np.zeros((10, 2))
+        query = {"kinds": [DiffPrivStatisticKind.count] * 3, "epsilon": self.epsilon}
+        with self.assertRaises(DiffPrivSizeMismatch):
+            DiffPrivBatchStatisticsQuery.query(data, [query])
@@ -0,0 +1,173 @@
+import os
+import tempfile
+import unittest
+import mock
+import numpy as np
+from diffpriv_laplace import DiffPrivSequentialStatisticsQuery, DiffPrivStatisticKind
+from diffpriv_laplace.aggregate import DiffPrivAggregate
+from diffpriv_laplace.laplace_mechanism import DiffPrivLaplaceMechanism
+from diffpriv_laplace.query.plan import DiffPrivQueryPlan
+from diffpriv_laplace.storage import DiffPrivStorage
+from diffpriv_laplace.exceptions import DiffPrivSizeMismatch
+
+
+class TestDiffPrivQueryPlan(unittest.TestCase):
+    epsilon = 1000000
+    decimal_places = 2
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def set_seed(self):
+        np.random.seed(31337)
+
+    def calculate_stats(self, data):
+        stats = {
+            DiffPrivStatisticKind.count: np.count_nonzero(data),
+            DiffPrivStatisticKind.min: np.min(data),
+            DiffPrivStatisticKind.max: np.max(data),
+            DiffPrivStatisticKind.median: np.median(data),
+            DiffPrivStatisticKind.proportion: np.count_nonzero(data) / np.size(data),
+            DiffPrivStatisticKind.sum: np.sum(data),
+            DiffPrivStatisticKind.mean: np.mean(data),
+            DiffPrivStatisticKind.variance: np.var(data),
+        }
+        return stats
+
+    def assert_results(self, results, data_slices, kinds):
+        self.assertEqual(len(results), len(kinds))
+        for result, data_slice, kind in zip(results, data_slices, kinds):
+            if not kind:
+                self.assertIsNone(result)
+                continue
+
+            expected_result = self.calculate_stats(data_slice)
+            self.assertEqual(
+                set(result), {key for key in expected_result if key & kind}
+            )
+            for key, value in result.items():
+                self.assertAlmostEqual(value, expected_result[key], self.decimal_places)
+
+    def test_aggregates(self):
+        data = np.zeros((100, 3))
+        expectations = [
+            (DiffPrivStatisticKind.count, ("count",), 1),
+            (
+                DiffPrivStatisticKind.mean | DiffPrivStatisticKind.proportion,
+                ("count", "min", "max", "sum"),
+                1,
+            ),
+            (DiffPrivStatisticKind.variance, ("min", "max", "sum", "m2"), 1),
+            (
+                DiffPrivStatisticKind.min | DiffPrivStatisticKind.median,
+                ("min", "median"),
+                2,
+            ),
+            (DiffPrivStatisticKind.median, ("median",), 1),
+        ]
+        for kind, aggregates, passes in expectations:
+            plan = DiffPrivQueryPlan(data, [kind, None, kind], self.epsilon)
+            self.assertEqual(plan.aggregates, aggregates)
+            self.assertEqual(plan.passes, passes)
+            self.assertEqual(plan.bytes, passes * 2 * 100 * data.itemsize)
+            for step in plan.steps:
+                np.testing.assert_equal(step["slices"], [0, 2])
+
+    def test_execute(self):
+        data = np.random.default_rng(31337).normal(0.0, 1.0, size=(4, 50, 3))
+        kinds = [
+            DiffPrivStatisticKind.all,
+            None,
+            DiffPrivStatisticKind.mean | DiffPrivStatisticKind.variance,
+            DiffPrivStatisticKind.count | DiffPrivStatisticKind.max,
+            DiffPrivStatisticKind.median,
+            DiffPrivStatisticKind.proportion,
+        ] * 2
+        data_slices = np.moveaxis(data, 1, 2).reshape((12, 50))
+        self.set_seed()
+        with mock.patch.object(
+            DiffPrivLaplaceMechanism,
+            "anonymize_batch_with_budget",
+            wraps=DiffPrivLaplaceMechanism.anonymize_batch_with_budget,
+        ) as anonymize_batch_with_budget:
+            with mock.patch.object(
+                DiffPrivStorage, "chunks", wraps=DiffPrivStorage.chunks
+            ) as chunks:
+                results = DiffPrivQueryPlan(data, kinds, self.epsilon, axis=1).execute()
+
+        anonymize_batch_with_budget.assert_called_once()
+        chunks.assert_called_once()
+        self.assert_results(results, data_slices, kinds)
+
+    def test_execute_reductions(self):
+        data = np.random.default_rng(31337).normal(0.0, 1.0, size=(50, 3))
+        kinds = [
+            DiffPrivStatisticKind.count | DiffPrivStatisticKind.min,
+            DiffPrivStatisticKind.max | DiffPrivStatisticKind.proportion,
+            None,
+        ]
+        self.set_seed()
+        with mock.patch.object(DiffPrivAggregate, "from_chunks") as from_chunks:
+            with mock.patch.object(DiffPrivStorage, "chunk_bytes", 64):
+                results = DiffPrivQueryPlan(data, kinds, self.epsilon).execute()
+
+        from_chunks.assert_not_called()
+        self.assert_results(results, np.transpose(data), kinds)
+
+    def test_execute_mapped(self):
+        data = np.random.default_rng(31337).normal(0.0, 1.0, size=(50, 3))
+        kinds = [
+            DiffPrivStatisticKind.all,
+            DiffPrivStatisticKind.median,
+            DiffPrivStatisticKind.sum,
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.npy")
+            np.save(path, data)
+            plan = DiffPrivQueryPlan(path, kinds, self.epsilon)
+            self.assertEqual(plan.steps[0]["bytes"], data.nbytes)
+            self.assertGreater(plan.steps[1]["passes"], 2)
+            self.set_seed()
+            with mock.patch.object(DiffPrivStorage, "chunk_bytes", 64):
+                results = plan.execute()
+
+        self.assert_results(results, np.transpose(data), kinds)
+
+    def test_execute_float32(self):
+        data = np.random.default_rng(31337).normal(0.0, 1.0, size=(50, 3))
+        kinds = [
+            DiffPrivStatisticKind.count | DiffPrivStatisticKind.median,
+            DiffPrivStatisticKind.mean,
+            DiffPrivStatisticKind.proportion | DiffPrivStatisticKind.max,
+        ]
+        self.set_seed()
+        with mock.patch.object(
+            DiffPrivLaplaceMechanism,
+            "anonymize_batch_with_budget",
+            wraps=DiffPrivLaplaceMechanism.anonymize_batch_with_budget,
+        ) as anonymize_batch_with_budget:
+            results = DiffPrivQueryPlan(
+                data, kinds, self.epsilon, dtype=np.float32
+            ).execute()
+
+        _, kwargs = anonymize_batch_with_budget.call_args
+        self.assertEqual(kwargs["lower"].dtype, np.float32)
+        self.assertEqual(kwargs["upper"].dtype, np.float32)
+        for result in results:
+            for value in result.values():
+                self.assertEqual(np.asarray(value).dtype, np.float32)
+
+    def test_size_mismatch_error(self):
+        data = np.zeros((10, 3))
+        with self.assertRaises(DiffPrivSizeMismatch):
+            DiffPrivQueryPlan(data, [DiffPrivStatisticKind.all] * 2, self.epsilon)
+
+    def test_sequential_plan(self):
+        data = np.zeros((10, 2))
+        kinds = [DiffPrivStatisticKind.all, DiffPrivStatisticKind.count]
+        plan = DiffPrivSequentialStatisticsQuery.plan(data, kinds, self.epsilon)
+        self.assertEqual(plan.kinds, kinds)
+        self.assertAlmostEqual(plan.epsilon, self.epsilon / 9.0)
@@ -214,3 +214,15 @@ class TestDiffPrivSequentialStatisticsQuery(unittest.TestCase):
                 value = result[key]
                 expected_value = expected_result[key]
                 self.assertAlmostEqual(value, expected_value, self.decimal_places)
+
+    def test_query_rng(self):
+        data = np.arange(0.0, 20.0).reshape((10, 2))
+        kinds = [DiffPrivStatisticKind.all] * 2
+        self.set_seed()
+        state = np.random.get_state()
+        results = [
+            DiffPrivSequentialStatisticsQuery.query(data, kinds, 1.0, rng=31337)
+            for _ in range(2)
+        ]
+        np.testing.assert_equal(results[0], results[1])
+        np.testing.assert_equal(np.random.get_state(), state)
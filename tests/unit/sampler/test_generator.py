@@ -0,0 +1,119 @@
+import unittest
+import numpy as np
+from diffpriv_laplace.sampler.generator import DiffPrivGenerator
+from diffpriv_laplace.exceptions import DiffPrivInvalidOutput
+
+
+class TestDiffPrivGenerator(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_create_default(self):
+        generator = DiffPrivGenerator.create()
+        self.assertIsInstance(generator, np.random.Generator)
+        self.assertIsInstance(generator.bit_generator, np.random.PCG64)
+
+    def test_create_seed(self):
+        first = DiffPrivGenerator.create(31337)
+        second = DiffPrivGenerator.create(31337)
+        np.testing.assert_equal(first.laplace(size=3), second.laplace(size=3))
+
+    def test_create_bit_generator_type(self):
+        generator = DiffPrivGenerator.create(31337, bit_generator=np.random.SFC64)
+        self.assertIsInstance(generator.bit_generator, np.random.SFC64)
+
+    def test_create_bit_generator(self):
+        bit_generator = np.random.SFC64(31337)
+        generator = DiffPrivGenerator.create(bit_generator)
+        self.assertIs(generator.bit_generator, bit_generator)
+
+    def test_create_generator(self):
+        generator = np.random.default_rng(31337)
+        self.assertIs(DiffPrivGenerator.create(generator), generator)
+
+    def test_seed_sequence(self):
+        seed_seq = np.random.SeedSequence(31337)
+        self.assertIs(DiffPrivGenerator.seed_sequence(seed_seq), seed_seq)
+        generator = np.random.Generator(np.random.PCG64(seed_seq))
+        self.assertIs(DiffPrivGenerator.seed_sequence(generator), seed_seq)
+        self.assertEqual(DiffPrivGenerator.seed_sequence(31337).entropy, 31337)
+
+    def test_spawn(self):
+        generators = DiffPrivGenerator.spawn(31337, 3)
+        self.assertEqual(len(generators), 3)
+        samples = [generator.laplace(size=3) for generator in generators]
+        self.assertFalse(np.array_equal(samples[0], samples[1]))
+        self.assertFalse(np.array_equal(samples[1], samples[2]))
+
+    def test_spawn_reproducible(self):
+        first = DiffPrivGenerator.spawn(31337, 2)
+        second = DiffPrivGenerator.spawn(31337, 2)
+        for index in range(2):
+            np.testing.assert_equal(
+                first[index].laplace(size=3), second[index].laplace(size=3)
+            )
+
+    def test_spawn_preserves_bit_generator(self):
+        generator = DiffPrivGenerator.create(31337, bit_generator=np.random.SFC64)
+        generators = DiffPrivGenerator.spawn(generator, 2)
+        for child in generators:
+            self.assertIsInstance(child.bit_generator, np.random.SFC64)
+
+    def test_laplace_default_dtype(self):
+        expected_values = np.random.default_rng(31337).laplace(87.0, 2.0, size=3)
+        generator = DiffPrivGenerator.create(31337)
+        values = DiffPrivGenerator.laplace(generator, loc=87.0, scale=2.0, size=3)
+        np.testing.assert_almost_equal(values, expected_values)
+
+    def test_laplace_float32(self):
+        generator = DiffPrivGenerator.create(31337)
+        values = DiffPrivGenerator.laplace(
+            generator, loc=87.0, scale=2.0, size=(2, 3), dtype=np.float32
+        )
+        self.assertEqual(values.dtype, np.float32)
+        self.assertEqual(values.shape, (2, 3))
+
+    def test_laplace_float32_single(self):
+        generator = DiffPrivGenerator.create(31337)
+        value = DiffPrivGenerator.laplace(generator, loc=87.0, dtype=np.float32)
+        self.assertIsInstance(value, np.float32)
+
+    def test_laplace_float32_multiple_legacy(self):
+        values = DiffPrivGenerator.laplace(
+            np.random, loc=[87.0, 435.0], scale=1.0, dtype=np.float32
+        )
+        self.assertEqual(values.dtype, np.float32)
+        self.assertEqual(values.shape, (2,))
+
+    def test_laplace_float32_distribution(self):
+        scale = 2.0
+        generator = DiffPrivGenerator.create(31337)
+        values = DiffPrivGenerator.laplace(
+            generator, scale=scale, size=200000, dtype=np.float32
+        )
+        np.testing.assert_almost_equal(np.mean(values), 0.0, decimal=1)
+        np.testing.assert_almost_equal(np.var(values), 2.0 * scale**2, decimal=0)
+
+    def test_discrete_laplace(self):
+        generator = DiffPrivGenerator.create(31337)
+        values = DiffPrivGenerator.discrete_laplace(
+            generator, loc=[87, 435], scale=1.0, dtype=np.int32
+        )
+        self.assertEqual(values.dtype, np.int32)
+        self.assertEqual(values.shape, (2,))
+
+    def test_discrete_laplace_single(self):
+        generator = DiffPrivGenerator.create(31337)
+        value = DiffPrivGenerator.discrete_laplace(generator, loc=87.4, scale=1e-9)
+        self.assertEqual(value, 87)
+
+    def test_discrete_laplace_out_of_range_error(self):
+        generator = DiffPrivGenerator.create(31337)
+        for loc, dtype in [(127, np.int8), (0, np.uint8), (2**31 - 1, np.int32)]:
+            with self.assertRaises(DiffPrivInvalidOutput):
+                DiffPrivGenerator.discrete_laplace(
+                    generator, loc=[loc] * 100, scale=10.0, dtype=dtype
+                )
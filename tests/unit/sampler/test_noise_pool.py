@@ -0,0 +1,110 @@
+import gc
+import threading
+import unittest
+import weakref
+import mock
+import numpy as np
+from diffpriv_laplace.sampler.noise_pool import DiffPrivNoisePool
+from diffpriv_laplace import DiffPrivLaplaceMechanism
+
+
+class TestDiffPrivNoisePool(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_capacity_getter(self):
+        with DiffPrivNoisePool(rng=31337, capacity=8) as pool:
+            self.assertEqual(pool.capacity, 8)
+
+    def test_initially_full(self):
+        pool = DiffPrivNoisePool(rng=31337, capacity=8, background=False)
+        self.assertEqual(pool.available, 8)
+
+    def test_draw_matches_generator(self):
+        expected_values = np.random.default_rng(31337).laplace(size=8)
+        pool = DiffPrivNoisePool(rng=31337, capacity=8, background=False)
+        values = np.concatenate([pool.draw(3), pool.draw(5)])
+        np.testing.assert_almost_equal(values, expected_values)
+        self.assertEqual(pool.available, 0)
+
+    def test_draw_wraps_around(self):
+        expected_values = np.random.default_rng(31337).laplace(size=14)
+        pool = DiffPrivNoisePool(rng=31337, capacity=8, background=False)
+        first = pool.draw(6)
+        pool.refill()
+        second = pool.draw(8)
+        np.testing.assert_almost_equal(first, expected_values[:6])
+        np.testing.assert_almost_equal(second, expected_values[6:])
+
+    def test_draw_refills_without_background(self):
+        pool = DiffPrivNoisePool(rng=31337, capacity=8, background=False)
+        pool.draw(8)
+        values = pool.draw(4)
+        self.assertEqual(len(values), 4)
+        self.assertEqual(pool.available, 4)
+
+    def test_draw_larger_than_capacity(self):
+        pool = DiffPrivNoisePool(rng=31337, capacity=8, background=False)
+        values = pool.draw(20)
+        self.assertEqual(len(values), 20)
+        self.assertEqual(pool.available, 8)
+
+    def test_laplace_single(self):
+        expected_value = 87.0 + 2.0 * np.random.default_rng(31337).laplace()
+        pool = DiffPrivNoisePool(rng=31337, capacity=8, background=False)
+        value = pool.laplace(87.0, 2.0)
+        self.assertTrue(np.isscalar(value))
+        np.testing.assert_almost_equal(value, expected_value)
+
+    def test_laplace_single_buffered(self):
+        expected_values = 87.0 + 2.0 * np.random.default_rng(31337).laplace(size=9)
+        pool = DiffPrivNoisePool(rng=31337, capacity=8, background=False)
+        with mock.patch.object(DiffPrivNoisePool, "draw", wraps=pool.draw) as draw:
+            values = [pool.laplace(87.0, 2.0) for _ in range(8)]
+            draw.assert_not_called()
+            self.assertEqual(pool.available, 0)
+            values.append(pool.laplace(87.0, 2.0))
+            draw.assert_called_once_with(1)
+
+        np.testing.assert_almost_equal(values, expected_values)
+
+    def test_laplace_single_many(self):
+        expected_values = 87.0 + np.random.default_rng(31337).laplace(size=(2, 3))
+        pool = DiffPrivNoisePool(rng=31337, capacity=8, background=False)
+        values = pool.laplace(87.0, 1.0, size=(2, 3))
+        np.testing.assert_almost_equal(values, expected_values)
+
+    def test_laplace_multiple(self):
+        expected_values = np.array([87.0, 435.0])
+        expected_values += np.random.default_rng(31337).laplace(size=2)
+        pool = DiffPrivNoisePool(rng=31337, capacity=8, background=False)
+        values = pool.laplace([87.0, 435.0], 1.0)
+        np.testing.assert_almost_equal(values, expected_values)
+
+    def test_background_refill(self):
+        with DiffPrivNoisePool(rng=31337, capacity=64, threshold=0.5) as pool:
+            for _ in range(1000):
+                value = pool.laplace(0.0, 1.0)
+                self.assertTrue(np.isfinite(value))
+
+    def test_mechanism_rng(self):
+        epsilon = 1.0
+        with DiffPrivNoisePool(rng=31337, capacity=64) as pool:
+            anonymizer = DiffPrivLaplaceMechanism(epsilon, rng=pool)
+            self.assertIs(anonymizer.rng, pool)
+            value = anonymizer.anonymize_count(87.0)
+            self.assertTrue(np.isfinite(value))
+
+    def test_background_thread_collected(self):
+        threads = set(threading.enumerate())
+        pool = DiffPrivNoisePool(rng=31337, capacity=8)
+        (thread,) = set(threading.enumerate()) - threads
+        reference = weakref.ref(pool)
+        del pool
+        gc.collect()
+        self.assertIsNone(reference())
+        thread.join(timeout=5.0)
+        self.assertFalse(thread.is_alive())
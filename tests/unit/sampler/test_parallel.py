@@ -0,0 +1,79 @@
+import unittest
+import numpy as np
+from diffpriv_laplace.sampler.parallel import DiffPrivParallelSampler
+from diffpriv_laplace import DiffPrivLaplaceMechanism
+
+
+class TestDiffPrivParallelSampler(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_workers_getter(self):
+        with DiffPrivParallelSampler(seed=31337, workers=3) as sampler:
+            self.assertEqual(sampler.workers, 3)
+
+    def test_block_size_getter(self):
+        with DiffPrivParallelSampler(seed=31337, block_size=16) as sampler:
+            self.assertEqual(sampler.block_size, 16)
+
+    def test_standard_laplace_blocks(self):
+        children = np.random.SeedSequence(31337).spawn(3)
+        expected_values = np.concatenate(
+            [
+                np.random.Generator(np.random.PCG64(children[0])).laplace(size=4),
+                np.random.Generator(np.random.PCG64(children[1])).laplace(size=4),
+                np.random.Generator(np.random.PCG64(children[2])).laplace(size=2),
+            ]
+        )
+        with DiffPrivParallelSampler(seed=31337, block_size=4) as sampler:
+            values = sampler.standard_laplace(10)
+
+        np.testing.assert_almost_equal(values, expected_values)
+
+    def test_standard_laplace_reproducible_across_workers(self):
+        results = []
+        for workers in [1, 2, 5]:
+            with DiffPrivParallelSampler(
+                seed=31337, workers=workers, block_size=7
+            ) as sampler:
+                results.append(sampler.standard_laplace(100))
+
+        np.testing.assert_equal(results[0], results[1])
+        np.testing.assert_equal(results[0], results[2])
+
+    def test_standard_laplace_successive_calls(self):
+        with DiffPrivParallelSampler(seed=31337, block_size=4) as sampler:
+            first = sampler.standard_laplace(8)
+            second = sampler.standard_laplace(8)
+
+        self.assertFalse(np.array_equal(first, second))
+
+    def test_laplace_single(self):
+        with DiffPrivParallelSampler(seed=31337) as sampler:
+            value = sampler.laplace(87.0, 1.0)
+
+        self.assertTrue(np.isscalar(value))
+
+    def test_laplace_single_many(self):
+        with DiffPrivParallelSampler(seed=31337, workers=2, block_size=4) as sampler:
+            values = sampler.laplace(87.0, 2.0, size=(3, 5))
+
+        self.assertEqual(values.shape, (3, 5))
+
+    def test_laplace_multiple(self):
+        with DiffPrivParallelSampler(seed=31337) as sampler:
+            values = sampler.laplace([87.0, 435.0], 1.0)
+
+        self.assertEqual(values.shape, (2,))
+
+    def test_mechanism_rng(self):
+        epsilon = 1.0
+        with DiffPrivParallelSampler(seed=31337, workers=2, block_size=4) as sampler:
+            anonymizer = DiffPrivLaplaceMechanism(epsilon, rng=sampler)
+            self.assertIs(anonymizer.rng, sampler)
+            anonymized = anonymizer.anonymize_count(87.0, size=10)
+
+        self.assertEqual(anonymized.shape, (10,))
@@ -0,0 +1,70 @@
+import unittest
+import mock
+import numpy as np
+from diffpriv_laplace.sampler.secure import DiffPrivSecureSampler
+from diffpriv_laplace import DiffPrivLaplaceMechanism
+
+
+class TestDiffPrivSecureSampler(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def create_bytes(self, values):
+        return np.array(values, dtype=np.uint64).tobytes()
+
+    def test_block_size_getter(self):
+        sampler = DiffPrivSecureSampler(block_size=16)
+        self.assertEqual(sampler.block_size, 16)
+
+    def test_standard_laplace_conversion(self):
+        half = np.uint64(1) << np.uint64(63)
+        raw = self.create_bytes([half, half | np.uint64(1), 0])
+        expected_values = np.array([np.log(2.0), -np.log(2.0), 0.0])
+        sampler = DiffPrivSecureSampler()
+        with mock.patch("os.urandom", return_value=raw) as urandom:
+            values = sampler.standard_laplace(3)
+            urandom.assert_called_once_with(24)
+
+        np.testing.assert_almost_equal(values, expected_values)
+
+    def test_standard_laplace_blocks(self):
+        sampler = DiffPrivSecureSampler(block_size=4)
+        with mock.patch("os.urandom", side_effect=lambda n: bytes(n)) as urandom:
+            values = sampler.standard_laplace(10)
+            self.assertEqual(urandom.call_count, 3)
+
+        self.assertEqual(len(values), 10)
+
+    def test_laplace_single(self):
+        sampler = DiffPrivSecureSampler()
+        value = sampler.laplace(87.0, 1.0)
+        self.assertTrue(np.isscalar(value))
+
+    def test_laplace_single_many(self):
+        sampler = DiffPrivSecureSampler()
+        values = sampler.laplace(87.0, 1.0, size=(2, 3))
+        self.assertEqual(values.shape, (2, 3))
+
+    def test_laplace_multiple(self):
+        sampler = DiffPrivSecureSampler()
+        values = sampler.laplace([87.0, 435.0], [1.0, 2.0])
+        self.assertEqual(values.shape, (2,))
+
+    def test_laplace_distribution(self):
+        scale = 2.0
+        sampler = DiffPrivSecureSampler(block_size=1000)
+        values = sampler.laplace(scale=scale, size=200000)
+        np.testing.assert_almost_equal(np.mean(values), 0.0, decimal=1)
+        np.testing.assert_almost_equal(np.var(values), 2.0 * scale**2, decimal=0)
+        np.testing.assert_almost_equal(np.mean(values < 0.0), 0.5, decimal=2)
+
+    def test_mechanism_rng(self):
+        epsilon = 1.0
+        sampler = DiffPrivSecureSampler()
+        anonymizer = DiffPrivLaplaceMechanism(epsilon, rng=sampler)
+        self.assertIs(anonymizer.rng, sampler)
+        anonymized = anonymizer.anonymize_count([87.0, 435.0])
+        self.assertEqual(anonymized.shape, (2,))
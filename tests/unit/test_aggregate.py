@@ -0,0 +1,82 @@
+import unittest
+import numpy as np
+from diffpriv_laplace.aggregate import DiffPrivAggregate
+
+
+class TestDiffPrivAggregate(unittest.TestCase):
+    decimal_places = 7
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def assert_aggregate(self, aggregate, data):
+        self.assertEqual(aggregate.n, np.size(data))
+        self.assertEqual(aggregate.count, np.count_nonzero(data))
+        self.assertEqual(aggregate.min, np.min(data))
+        self.assertEqual(aggregate.max, np.max(data))
+        self.assertAlmostEqual(aggregate.sum, np.sum(data), self.decimal_places)
+        self.assertAlmostEqual(aggregate.mean, np.mean(data), self.decimal_places)
+        self.assertAlmostEqual(aggregate.variance, np.var(data), self.decimal_places)
+
+    def test_empty(self):
+        aggregate = DiffPrivAggregate()
+        self.assertEqual(aggregate.n, 0)
+        self.assertEqual(aggregate.count, 0)
+        self.assertIsNone(aggregate.min)
+        self.assertIsNone(aggregate.max)
+        self.assertEqual(aggregate.sum, 0.0)
+        self.assertEqual(aggregate.variance, 0.0)
+
+    def test_from_data(self):
+        data = np.array(list(range(0, 20)) + [100.0])
+        aggregate = DiffPrivAggregate.from_data(data)
+        self.assert_aggregate(aggregate, data)
+
+    def test_from_data_chunked(self):
+        data = np.random.default_rng(31337).normal(1000.0, 3.0, size=(7, 13))
+        aggregate = DiffPrivAggregate.from_data(data, chunk_size=10)
+        self.assert_aggregate(aggregate, data)
+
+    def test_update_empty_chunk(self):
+        data = [1.0, 0.0, 3.0]
+        aggregate = DiffPrivAggregate.from_data(data)
+        aggregate.update([])
+        self.assert_aggregate(aggregate, data)
+
+    def test_merge(self):
+        data = np.array(list(range(0, 20)) + [100.0])
+        aggregate = DiffPrivAggregate.from_data(data[:5])
+        aggregate.merge(DiffPrivAggregate.from_data(data[5:]))
+        aggregate.merge(DiffPrivAggregate())
+        self.assert_aggregate(aggregate, data)
+
+    def test_merge_into_empty(self):
+        data = [4.0, -2.0, 0.0]
+        aggregate = DiffPrivAggregate().merge(DiffPrivAggregate.from_data(data))
+        self.assert_aggregate(aggregate, data)
+
+    def test_float32(self):
+        data = np.arange(0, 100, dtype=np.float32)
+        aggregate = DiffPrivAggregate.from_data(data, chunk_size=16, dtype="float32")
+        self.assertEqual(aggregate.dtype, np.float32)
+        self.assertIsInstance(aggregate.sum, np.float32)
+        self.assertIsInstance(aggregate.variance, np.float32)
+        self.assertAlmostEqual(aggregate.variance, np.var(data), 3)
+
+    def test_from_chunks(self):
+        data = np.random.default_rng(31337).uniform(-5.0, 5.0, size=1000)
+        chunks = (data[start : start + 300] for start in range(0, data.size, 300))
+        aggregate = DiffPrivAggregate.from_chunks(chunks, chunk_size=128)
+        self.assert_aggregate(aggregate, data)
+
+    def test_from_chunks_single_slice(self):
+        data = np.random.default_rng(31337).uniform(-5.0, 5.0, size=(100, 1))
+        for dtype in (None, "float32"):
+            chunks = (data[start : start + 30] for start in range(0, len(data), 30))
+            aggregate = DiffPrivAggregate.from_chunks(chunks, axis=0, dtype=dtype)
+            self.assertEqual(np.shape(aggregate.sum), (1,))
+            self.assertEqual(np.shape(aggregate.variance), (1,))
+            np.testing.assert_almost_equal(aggregate.mean, np.mean(data, axis=0), 5)
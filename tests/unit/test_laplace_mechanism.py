@@ -1,7 +1,12 @@
+import sys
 import unittest
 import numpy as np
+from diffpriv_laplace.anonymizer.batch import DiffPrivBatchAnonymizer
 from diffpriv_laplace.anonymizer.count import DiffPrivCountAnonymizer
 from diffpriv_laplace.anonymizer.counting import DiffPrivCountingAnonymizer
+from diffpriv_laplace.anonymizer.discrete_counting import (
+    DiffPrivDiscreteCountingAnonymizer,
+)
 from diffpriv_laplace.anonymizer.min import DiffPrivMinAnonymizer
 from diffpriv_laplace.anonymizer.max import DiffPrivMaxAnonymizer
 from diffpriv_laplace.anonymizer.median import DiffPrivMedianAnonymizer
@@ -9,7 +14,11 @@ from diffpriv_laplace.anonymizer.proportion import DiffPrivProportionAnonymizer
 from diffpriv_laplace.anonymizer.sum import DiffPrivSumAnonymizer
 from diffpriv_laplace.anonymizer.mean import DiffPrivMeanAnonymizer
 from diffpriv_laplace.anonymizer.variance import DiffPrivVarianceAnonymizer
+from diffpriv_laplace.anonymizer.weighted_count import DiffPrivWeightedCountAnonymizer
+from diffpriv_laplace.anonymizer.weighted_sum import DiffPrivWeightedSumAnonymizer
 from diffpriv_laplace import DiffPrivLaplaceMechanism
+from diffpriv_laplace.exceptions import DiffPrivMissingParameter
+from diffpriv_laplace.laplace_mechanism import DiffPrivAnonymizerType
 
 
 class TestDiffPrivLaplaceMechanism(unittest.TestCase):
@@ -342,6 +351,53 @@ class TestDiffPrivLaplaceMechanism(unittest.TestCase):
         anonymizer = DiffPrivLaplaceMechanism(epsilon)
         self.assertEqual(anonymizer.epsilon, epsilon)
 
+    def test_rng_getter_default(self):
+        epsilon = 0.1
+        anonymizer = DiffPrivLaplaceMechanism(epsilon)
+        self.assertIsNone(anonymizer.rng)
+
+    def test_rng_getter(self):
+        epsilon = 0.1
+        rng = np.random.default_rng(31337)
+        anonymizer = DiffPrivLaplaceMechanism(epsilon, rng=rng)
+        self.assertIs(anonymizer.rng, rng)
+
+    def test_create_count_anonymizer_with_rng(self):
+        epsilon = 0.1
+        rng = np.random.default_rng(31337)
+        anonymizer = DiffPrivLaplaceMechanism.create_count_anonymizer(epsilon, rng=rng)
+        self.assertIs(anonymizer.rng, rng)
+
+    def test_anonymize_count_with_budget_rng(self):
+        expected_values = np.random.default_rng(31337).laplace(87.0, 1.0, size=3)
+        epsilon = 1.0
+        anonymized = DiffPrivLaplaceMechanism.anonymize_count_with_budget(
+            87.0, epsilon, size=3, rng=31337
+        )
+        np.testing.assert_almost_equal(anonymized, expected_values)
+
+    def test_anonymize_count_rng(self):
+        epsilon = 1.0
+        first = DiffPrivLaplaceMechanism(epsilon, rng=31337)
+        second = DiffPrivLaplaceMechanism(epsilon, rng=31337)
+        np.testing.assert_equal(
+            first.anonymize_count(87.0, size=3), second.anonymize_count(87.0, size=3)
+        )
+
+    def test_spawn(self):
+        epsilon = 1.0
+        anonymizer = DiffPrivLaplaceMechanism(epsilon, rng=31337)
+        children = anonymizer.spawn(2)
+        self.assertEqual(len(children), 2)
+        for child in children:
+            self.assertIsInstance(child, DiffPrivLaplaceMechanism)
+            self.assertEqual(child.epsilon, epsilon)
+            self.assertIsInstance(child.rng, np.random.Generator)
+
+        first = children[0].anonymize_count(87.0, size=3)
+        second = children[1].anonymize_count(87.0, size=3)
+        self.assertFalse(np.array_equal(first, second))
+
     def test_anonymize_count_single(self):
         expected_value = 87.58645513850368
         epsilon = 1.0
@@ -560,3 +616,250 @@ class TestDiffPrivLaplaceMechanism(unittest.TestCase):
         self.set_seed()
         anonymized = anonymizer.anonymize_variance([87.0, 435.0], lower, upper, n)
         np.testing.assert_almost_equal(anonymized, expected_values)
+
+    def test_anonymize_count_with_budget_out(self):
+        expected_values = np.array([87.5864551, 437.701297])
+        epsilon = 1.0
+        values = np.array([87.0, 435.0])
+        self.set_seed()
+        anonymized = DiffPrivLaplaceMechanism.anonymize_count_with_budget(
+            values, epsilon, out=values
+        )
+        self.assertIs(anonymized, values)
+        np.testing.assert_almost_equal(values, expected_values)
+
+    def test_anonymize_sum_out(self):
+        expected_values = np.array([87.5864551, 89.701297, 86.4519884])
+        lower = 0.0
+        upper = 1.0
+        epsilon = 1.0
+        out = np.zeros(3)
+        anonymizer = DiffPrivLaplaceMechanism(epsilon)
+        self.set_seed()
+        anonymized = anonymizer.anonymize_sum(87.0, lower, upper, out=out)
+        self.assertIs(anonymized, out)
+        np.testing.assert_almost_equal(out, expected_values)
+
+    def test_dtype_getter(self):
+        epsilon = 0.1
+        anonymizer = DiffPrivLaplaceMechanism(epsilon, dtype="float32")
+        self.assertEqual(anonymizer.dtype, np.float32)
+        self.assertIsNone(DiffPrivLaplaceMechanism(epsilon).dtype)
+
+    def test_anonymize_mean_with_budget_float32(self):
+        epsilon = 1.0
+        lower = 10.0
+        upper = 99.0
+        n = 100.0
+        anonymized = DiffPrivLaplaceMechanism.anonymize_mean_with_budget(
+            [87.0, 435.0], lower, upper, n, epsilon, dtype=np.float32
+        )
+        self.assertEqual(anonymized.dtype, np.float32)
+
+    def test_anonymize_count_float32(self):
+        epsilon = 1.0
+        anonymizer = DiffPrivLaplaceMechanism(epsilon, rng=31337, dtype=np.float32)
+        anonymized = anonymizer.anonymize_count(87.0, size=3)
+        self.assertEqual(anonymized.dtype, np.float32)
+        self.assertEqual(anonymizer.spawn(1)[0].dtype, np.float32)
+
+    def test_create_discrete_counting_anonymizer(self):
+        epsilon = 0.1
+        anonymizer = DiffPrivLaplaceMechanism.create_discrete_counting_anonymizer(
+            epsilon
+        )
+        self.assertIsInstance(anonymizer, DiffPrivDiscreteCountingAnonymizer)
+        self.assertEqual(anonymizer.epsilon, epsilon)
+        self.assertEqual(anonymizer.dtype, np.int64)
+
+    def test_anonymize_discrete_count_with_budget(self):
+        epsilon = 1.0
+        anonymized = DiffPrivLaplaceMechanism.anonymize_discrete_count_with_budget(
+            [87, 435], epsilon, dtype=np.int32
+        )
+        self.assertEqual(anonymized.dtype, np.int32)
+
+    def test_anonymize_discrete_count(self):
+        epsilon = 1.0
+        first = DiffPrivLaplaceMechanism(epsilon, rng=31337)
+        second = DiffPrivLaplaceMechanism(epsilon, rng=31337)
+        np.testing.assert_equal(
+            first.anonymize_discrete_count(87, size=3),
+            second.anonymize_discrete_count(87, size=3),
+        )
+
+    def test_get_anonymizer_cached(self):
+        epsilon = 1.0
+        lower = 10.0
+        upper = 99.0
+        n = 100.0
+        cache = DiffPrivLaplaceMechanism.anonymizer_cache
+        cache.clear()
+        first = DiffPrivLaplaceMechanism.get_anonymizer(
+            DiffPrivAnonymizerType.mean, epsilon, lower, upper, n
+        )
+        second = DiffPrivLaplaceMechanism.get_anonymizer(
+            DiffPrivAnonymizerType.mean, epsilon, lower, upper, n
+        )
+        third = DiffPrivLaplaceMechanism.get_anonymizer(
+            DiffPrivAnonymizerType.mean, epsilon, lower, upper, n, dtype=np.float32
+        )
+        self.assertIsInstance(first, DiffPrivMeanAnonymizer)
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+
+    def test_get_anonymizer_seed_not_cached(self):
+        epsilon = 1.0
+        cache = DiffPrivLaplaceMechanism.anonymizer_cache
+        cache.clear()
+        first = DiffPrivLaplaceMechanism.get_anonymizer(
+            DiffPrivAnonymizerType.count, epsilon, rng=31337
+        )
+        second = DiffPrivLaplaceMechanism.get_anonymizer(
+            DiffPrivAnonymizerType.count, epsilon, rng=31337
+        )
+        self.assertIsNot(first, second)
+        self.assertEqual(len(cache), 0)
+
+    def test_anonymize_with_budget_cached(self):
+        epsilon = 1.0
+        cache = DiffPrivLaplaceMechanism.anonymizer_cache
+        cache.clear()
+        anonymizer = DiffPrivLaplaceMechanism(epsilon)
+        for _ in range(3):
+            anonymizer.anonymize_sum(87.0, 10.0, 99.0)
+
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 1)
+
+    def test_get_anonymizer_rng_not_cached(self):
+        epsilon = 1.0
+        cache = DiffPrivLaplaceMechanism.anonymizer_cache
+        cache.clear()
+        rng = np.random.default_rng(31337)
+        references = sys.getrefcount(rng)
+        anonymizer = DiffPrivLaplaceMechanism(epsilon, rng=rng)
+        anonymizer.anonymize_sum(87.0, 10.0, 99.0)
+        self.assertEqual(len(cache), 0)
+        del anonymizer
+        self.assertEqual(sys.getrefcount(rng), references)
+
+    def test_get_anonymizer_cache_disabled(self):
+        epsilon = 1.0
+        cache = DiffPrivLaplaceMechanism.anonymizer_cache
+        cache.clear()
+        for _ in range(2):
+            DiffPrivLaplaceMechanism.anonymize_sum_with_budget(
+                87.0, 10.0, 99.0, epsilon, cache=False
+            )
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.misses, 0)
+
+    def test_create_batch_anonymizer(self):
+        epsilon = 0.1
+        kinds = [DiffPrivAnonymizerType.count, DiffPrivAnonymizerType.proportion]
+        anonymizer = DiffPrivLaplaceMechanism.create_batch_anonymizer(
+            epsilon, kinds, n=10.0
+        )
+        self.assertIsInstance(anonymizer, DiffPrivBatchAnonymizer)
+        np.testing.assert_almost_equal(anonymizer.scale, [10.0, 1.0])
+
+    def test_anonymize_batch_with_budget(self):
+        kinds = [
+            DiffPrivAnonymizerType.count,
+            DiffPrivAnonymizerType.sum,
+            DiffPrivAnonymizerType.variance,
+        ]
+        values = np.array([87.0, 435.0, 3.0])
+        epsilon = np.array([1.0, 0.5, 2.0])
+        lower = np.array([0.0, 0.0, 0.0])
+        upper = np.array([0.0, 10.0, 4.0])
+        n = np.array([1.0, 1.0, 8.0])
+        self.set_seed()
+        anonymized = DiffPrivLaplaceMechanism.anonymize_batch_with_budget(
+            values, kinds, epsilon, lower=lower, upper=upper, n=n
+        )
+        self.set_seed()
+        expected_values = np.random.laplace(values, [1.0, 20.0, 1.0])
+        np.testing.assert_almost_equal(anonymized, expected_values)
+
+    def test_anonymize_batch_with_budget_missing_parameter(self):
+        kinds = [DiffPrivAnonymizerType.sum]
+        with self.assertRaises(DiffPrivMissingParameter):
+            DiffPrivLaplaceMechanism.anonymize_batch_with_budget([1.0], kinds, 1.0)
+
+    def test_anonymize_batch(self):
+        kinds = ["count", "mean"]
+        values = np.array([87.0, 3.0])
+        anonymizer = DiffPrivLaplaceMechanism(0.5, rng=1)
+        anonymized = anonymizer.anonymize_batch(
+            values, kinds, lower=0.0, upper=4.0, n=2.0, out=values
+        )
+        expected_values = np.random.default_rng(1).laplace([87.0, 3.0], [2.0, 4.0])
+        self.assertIs(anonymized, values)
+        np.testing.assert_almost_equal(anonymized, expected_values)
+
+    def test_create_weighted_count_anonymizer(self):
+        epsilon = 1.0
+        max_weight = 3.0
+        anonymizer = DiffPrivLaplaceMechanism.create_weighted_count_anonymizer(
+            epsilon, max_weight
+        )
+        self.assertIsInstance(anonymizer, DiffPrivWeightedCountAnonymizer)
+        self.assertEqual(anonymizer.epsilon, epsilon)
+        self.assertEqual(anonymizer.max_weight, max_weight)
+
+    def test_create_weighted_sum_anonymizer(self):
+        epsilon = 1.0
+        lower = 10.0
+        upper = 99.0
+        max_weight = 3.0
+        anonymizer = DiffPrivLaplaceMechanism.create_weighted_sum_anonymizer(
+            epsilon, lower, upper, max_weight
+        )
+        self.assertIsInstance(anonymizer, DiffPrivWeightedSumAnonymizer)
+        self.assertEqual(anonymizer.epsilon, epsilon)
+        self.assertEqual(anonymizer.lower, lower)
+        self.assertEqual(anonymizer.upper, upper)
+        self.assertEqual(anonymizer.max_weight, max_weight)
+
+    def test_anonymize_weighted_count_with_budget(self):
+        expected_values = np.array([88.7593654, 443.103891])
+        epsilon = 1.0
+        self.set_seed()
+        anonymized = DiffPrivLaplaceMechanism.anonymize_weighted_count_with_budget(
+            [87.0, 435.0], epsilon, max_weight=3.0
+        )
+        np.testing.assert_almost_equal(anonymized, expected_values)
+
+    def test_anonymize_weighted_sum_with_budget(self):
+        expected_values = np.array([203.1181174, 969.8568126])
+        lower = 10.0
+        upper = 99.0
+        epsilon = 1.0
+        self.set_seed()
+        anonymized = DiffPrivLaplaceMechanism.anonymize_weighted_sum_with_budget(
+            [87.0, 435.0], lower, upper, epsilon, max_weight=2.0
+        )
+        np.testing.assert_almost_equal(anonymized, expected_values)
+
+    def test_anonymize_weighted_count(self):
+        expected_values = np.array([87.5864551, 437.701297])
+        epsilon = 1.0
+        anonymizer = DiffPrivLaplaceMechanism(epsilon)
+        self.set_seed()
+        anonymized = anonymizer.anonymize_weighted_count([87.0, 435.0])
+        np.testing.assert_almost_equal(anonymized, expected_values)
+
+    def test_anonymize_weighted_sum(self):
+        expected_values = np.array([145.0590587, 702.4284063])
+        lower = 10.0
+        upper = 99.0
+        epsilon = 1.0
+        anonymizer = DiffPrivLaplaceMechanism(epsilon)
+        self.set_seed()
+        anonymized = anonymizer.anonymize_weighted_sum([87.0, 435.0], lower, upper)
+        np.testing.assert_almost_equal(anonymized, expected_values)
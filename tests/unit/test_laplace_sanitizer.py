@@ -1,6 +1,10 @@
+import os
+import tempfile
 import unittest
+import mock
 import numpy as np
 from diffpriv_laplace import DiffPrivLaplaceSanitizer
+from diffpriv_laplace.storage import DiffPrivStorage
 from diffpriv_laplace.exceptions import (
     DiffPrivInvalidDecomposition,
     DiffPrivInvalidDimensions,
@@ -118,7 +122,10 @@ class TestDiffPrivLaplaceSanitizer(unittest.TestCase):
 
         self.set_seed()
         with self.assertRaises(DiffPrivInvalidDimensions):
-            DiffPrivLaplaceSanitizer.count(data, selectors, self.epsilon)
+            DiffPrivLaplaceSanitizer.count(np.float64(0.1), selectors, self.epsilon)
+
+        with self.assertRaises(DiffPrivInvalidDimensions):
+            DiffPrivLaplaceSanitizer.count(data, selectors, self.epsilon, axis=3)
 
     def test_count_size_mismatch_error(self):
         data = np.array(
@@ -405,3 +412,71 @@ class TestDiffPrivLaplaceSanitizer(unittest.TestCase):
 
         for index in range(len(expected_result)):
             np.testing.assert_almost_equal(results[index], expected_result[index])
+
+    def test_count_decomposed_data_slice(self):
+        data = np.array([0.1, -0.1, 0.1, 0.1] * 10)
+        selectors = [lambda data: data >= 0, lambda data: data < 0]
+        counts = DiffPrivLaplaceSanitizer.count_decomposed_data_slice(data, selectors)
+        np.testing.assert_equal(counts, [30, 10])
+
+    def test_count_decomposed_data_slice_error(self):
+        data = np.array([0.1, -0.1, 0.1, 0.1] * 10)
+        selectors = [lambda data: data >= 0, lambda data: data < 0.5]
+        with self.assertRaises(DiffPrivInvalidDecomposition):
+            DiffPrivLaplaceSanitizer.count_decomposed_data_slice(data, selectors)
+
+    def test_count_mapped(self):
+        data = np.array(
+            [[0.1, -0.1, 0.1, 0.1] * 10, [-0.1, -0.1, 0.1, -0.1] * 10, [0.0] * 40]
+        )
+        selectors = [
+            [lambda data: data >= 0, lambda data: data < 0],
+            [lambda data: data >= 0, lambda data: data < 0],
+            [lambda data: data >= 0, lambda data: data < 0],
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.npy")
+            for axis, values in [(1, data), (0, np.transpose(data))]:
+                np.save(path, values)
+                self.set_seed()
+                with mock.patch.object(DiffPrivStorage, "chunk_bytes", 64):
+                    results = DiffPrivLaplaceSanitizer.count(
+                        path, selectors, self.epsilon, axis=axis
+                    )
+
+                np.testing.assert_almost_equal(results[0], [30.0, 10.0])
+                np.testing.assert_almost_equal(results[1], [10.0, 30.0])
+                np.testing.assert_almost_equal(results[2], [40.0, 0.0])
+
+    def test_count_n_dimensional(self):
+        data = np.sin(np.arange(0.0, 120.0)).reshape((2, 3, 4, 5))
+        selectors = [[lambda data: data >= 0, lambda data: data < 0]] * 6
+        expected_values = np.moveaxis(data, (0, 1), (0, 1)).reshape((6, -1))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.npy")
+            np.save(path, data)
+            for values in [data, path]:
+                self.set_seed()
+                with mock.patch.object(DiffPrivStorage, "chunk_bytes", 64):
+                    results = DiffPrivLaplaceSanitizer.count(
+                        values, selectors, self.epsilon, axis=(2, 3)
+                    )
+
+                self.assertEqual(len(results), len(selectors))
+                for result, expected_value in zip(results, expected_values):
+                    np.testing.assert_almost_equal(
+                        result,
+                        [np.sum(expected_value >= 0), np.sum(expected_value < 0)],
+                    )
+
+    def test_count_rng(self):
+        data = np.arange(0.0, 20.0).reshape((10, 2))
+        selectors = [[lambda data: data < 10, lambda data: data >= 10]] * 2
+        self.set_seed()
+        state = np.random.get_state()
+        results = [
+            DiffPrivLaplaceSanitizer.count(data, selectors, 1.0, rng=31337)
+            for _ in range(2)
+        ]
+        np.testing.assert_equal(results[0], results[1])
+        np.testing.assert_equal(np.random.get_state(), state)
@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+import mock
+import numpy as np
+from diffpriv_laplace.lazy import DiffPrivLazyStatistics
+from diffpriv_laplace.laplace_mechanism import DiffPrivLaplaceMechanism
+from diffpriv_laplace.storage import DiffPrivStorage
+
+
+class TestDiffPrivLazyStatistics(unittest.TestCase):
+    epsilon = 1000000
+    decimal_places = 2
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def set_seed(self):
+        np.random.seed(31337)
+
+    def record(self, graph, source, data):
+        statistics = [
+            (graph.count(source, self.epsilon), np.count_nonzero(data)),
+            (
+                graph.count(source, self.epsilon, condition="x > 0.5", axis=0),
+                np.sum(data > 0.5, axis=0),
+            ),
+            (graph.min(source, self.epsilon, axis=0), np.min(data, axis=0)),
+            (graph.max(source, self.epsilon, axis=1), np.max(data, axis=1)),
+            (graph.median(source, self.epsilon, axis=0), np.median(data, axis=0)),
+            (
+                graph.proportion(
+                    source, self.epsilon, condition=lambda chunk: chunk < 0.0
+                ),
+                np.mean(data < 0.0),
+            ),
+            (graph.sum(source, self.epsilon, axis=0), np.sum(data, axis=0)),
+            (graph.mean(source, self.epsilon), np.mean(data)),
+            (graph.variance(source, self.epsilon, axis=1), np.var(data, axis=1)),
+        ]
+        return statistics
+
+    def test_compute(self):
+        data = np.random.default_rng(31337).normal(0.0, 1.0, size=(300, 4))
+        graph = DiffPrivLazyStatistics()
+        statistics = self.record(graph, data, data)
+        self.assertTrue(all(statistic.value is None for statistic, _ in statistics))
+        self.assertEqual(graph.scans, 3)
+        self.set_seed()
+        with mock.patch.object(
+            DiffPrivLaplaceMechanism,
+            "anonymize_batch_with_budget",
+            wraps=DiffPrivLaplaceMechanism.anonymize_batch_with_budget,
+        ) as anonymize_batch_with_budget:
+            values = graph.compute()
+            graph.compute()
+
+        anonymize_batch_with_budget.assert_called_once()
+        self.assertEqual(len(values), len(statistics))
+        for value, (statistic, expected_value) in zip(values, statistics):
+            self.assertTrue(statistic.computed)
+            self.assertEqual(np.shape(value), np.shape(expected_value))
+            np.testing.assert_almost_equal(value, statistic.value)
+            np.testing.assert_almost_equal(value, expected_value, self.decimal_places)
+
+    def test_compute_mapped(self):
+        data = np.random.default_rng(31337).normal(0.0, 1.0, size=(300, 4))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.npy")
+            np.save(path, data)
+            graph = DiffPrivLazyStatistics()
+            statistics = self.record(graph, path, data)
+            self.set_seed()
+            with mock.patch.object(DiffPrivStorage, "chunk_bytes", 256):
+                for statistic, expected_value in statistics:
+                    np.testing.assert_almost_equal(
+                        statistic.compute(), expected_value, self.decimal_places
+                    )
+
+    def test_scan(self):
+        data = np.arange(0.0, 40.0).reshape((10, 4))
+        conditions = {"odd": lambda chunk: chunk % 2 == 1}
+        with mock.patch.object(
+            DiffPrivStorage, "chunks", wraps=DiffPrivStorage.chunks
+        ) as chunks:
+            aggregate, counts, n = DiffPrivLazyStatistics.scan(
+                data, axis=1, conditions=conditions
+            )
+
+        chunks.assert_called_once()
+        self.assertEqual(n, 4)
+        np.testing.assert_almost_equal(aggregate.sum, np.sum(data, axis=1))
+        np.testing.assert_equal(counts["odd"], [2] * 10)
+
+    def test_shared_statistics(self):
+        data = np.arange(0.0, 10.0)
+        graph = DiffPrivLazyStatistics()
+        statistic = graph.count(data, self.epsilon, condition="x >= 5")
+        self.assertIs(graph.count(data, self.epsilon, condition="x >= 5.0"), statistic)
+        self.assertIsNot(graph.count(data, self.epsilon), statistic)
+        self.assertIsNot(graph.count(data, 1.0, condition="x >= 5"), statistic)
+        self.assertEqual(len(graph.statistics), 3)
+        self.assertEqual(graph.scans, 1)
+
+    def test_compute_rng(self):
+        data = np.arange(0.0, 10.0)
+        values = []
+        for _ in range(2):
+            graph = DiffPrivLazyStatistics(rng=31337)
+            graph.sum(data, 1.0)
+            graph.mean(data, 1.0)
+            values.append(graph.compute())
+
+        np.testing.assert_equal(values[0], values[1])
+
+    def test_compute_rng_fresh_noise(self):
+        graph = DiffPrivLazyStatistics(rng=31337)
+        noise = []
+        for _ in range(2):
+            data = np.ones(10)
+            statistic = graph.count(data, 1.0, postprocess=False)
+            noise.append(statistic.compute() - 10.0)
+
+        self.assertNotEqual(noise[0], noise[1])
+
+    def test_independent_statistics(self):
+        data = np.arange(0.0, 10.0)
+        graph = DiffPrivLazyStatistics(rng=31337, shared=False)
+        statistics = [graph.sum(data, 1.0) for _ in range(2)]
+        self.assertIsNot(statistics[0], statistics[1])
+        self.assertEqual(len(graph.statistics), 2)
+        self.assertEqual(graph.scans, 1)
+        values = graph.compute()
+        self.assertNotEqual(values[0], values[1])
@@ -0,0 +1,97 @@
+import unittest
+import mock
+import numpy as np
+from diffpriv_laplace.predicate import DiffPrivPredicate
+from diffpriv_laplace.exceptions import DiffPrivInvalidPredicate
+
+
+class TestDiffPrivPredicate(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_compile(self):
+        x = np.arange(-5.0, 15.0).reshape(4, 5)
+        expressions = [
+            ("x >= 3", x >= 3),
+            ("x != 3", x != 3),
+            ("x between 2 and 7", (x >= 2) & (x <= 7)),
+            ("x in (1, 3, 5)", np.isin(x, [1, 3, 5])),
+            ("x not in (1, 3, 5)", ~np.isin(x, [1, 3, 5])),
+            ("not x < 0 and x < 10", (x >= 0) & (x < 10)),
+            ("x < -2 or x > 12 or x == 4", (x < -2) | (x > 12) | (x == 4)),
+            (
+                "x between 0 and 10 and not (x in (2, 3) or x > 8)",
+                (x >= 0) & (x <= 10) & ~(np.isin(x, [2, 3]) | (x > 8)),
+            ),
+        ]
+        for expression, expected_mask in expressions:
+            predicate = DiffPrivPredicate.compile(expression)
+            np.testing.assert_array_equal(predicate(x), expected_mask)
+            np.testing.assert_array_equal(
+                DiffPrivPredicate.compile(str(predicate))(x), expected_mask
+            )
+
+    def test_compile_names(self):
+        x = np.arange(0.0, 10.0)
+        for expression in ["infant > 3", "n1 between 2 and 4", "e1 >= -inf"]:
+            predicate = DiffPrivPredicate.compile(expression)
+            np.testing.assert_array_equal(
+                predicate(x), DiffPrivPredicate.compile(str(predicate))(x)
+            )
+
+        np.testing.assert_array_equal(DiffPrivPredicate.compile("infant > 3")(x), x > 3)
+
+    def test_compile_invalid(self):
+        for expression in [
+            "x >",
+            "x between 1",
+            "x in ()",
+            "(x > 1",
+            "x @ 2",
+            "x > 3abc",
+        ]:
+            with self.assertRaises(DiffPrivInvalidPredicate):
+                DiffPrivPredicate.compile(expression)
+
+    def test_operators(self):
+        x = np.arange(0.0, 10.0)
+        predicate = ~DiffPrivPredicate.compile("x < 2") & "x < 8" | "x == 9"
+        np.testing.assert_array_equal(predicate(x), ((x >= 2) & (x < 8)) | (x == 9))
+
+    def test_membership_large(self):
+        x = np.arange(0.0, 100.0)
+        members = list(range(0, 100, 3))
+        predicate = DiffPrivPredicate.compile(
+            "x > 50 and x in ({})".format(", ".join(map(str, members)))
+        )
+        np.testing.assert_array_equal(predicate(x), (x > 50) & np.isin(x, members))
+
+    def test_count(self):
+        x = np.random.default_rng(31337).integers(0, 10, size=(300, 7))
+        predicate = DiffPrivPredicate.compile("x between 2 and 5 or x == 9")
+        expected_mask = ((x >= 2) & (x <= 5)) | (x == 9)
+        with mock.patch.object(DiffPrivPredicate, "chunk_size", 64):
+            self.assertEqual(predicate.count(x), (np.sum(expected_mask), x.size))
+            for axis in [0, 1, -1, (0, 1)]:
+                value, n = predicate.count(x, axis=axis)
+                np.testing.assert_array_equal(value, np.sum(expected_mask, axis=axis))
+                self.assertEqual(n, np.size(x) // np.size(value))
+
+    def test_count_weights(self):
+        x = np.random.default_rng(31337).integers(0, 10, size=(300, 7))
+        weights = np.random.default_rng(31337).integers(1, 5, size=(300, 7))
+        predicate = DiffPrivPredicate.compile("x between 2 and 5 or x == 9")
+        expected_mask = ((x >= 2) & (x <= 5)) | (x == 9)
+        with mock.patch.object(DiffPrivPredicate, "chunk_size", 64):
+            for axis in [None, 0, 1, (0, 1)]:
+                value, n = predicate.count(x, axis=axis, weights=weights)
+                np.testing.assert_array_equal(
+                    value, np.sum(weights, axis=axis, where=expected_mask)
+                )
+
+    def test_abstract(self):
+        with self.assertRaises(TypeError):
+            DiffPrivPredicate()
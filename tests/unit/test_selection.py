@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+from diffpriv_laplace.selection import DiffPrivSelection
+from diffpriv_laplace.exceptions import DiffPrivInvalidDimensions
+
+
+class TestDiffPrivSelection(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def chunks(self, data, chunk_size):
+        return lambda: (
+            data[start : start + chunk_size]
+            for start in range(0, data.size, chunk_size)
+        )
+
+    def test_keys(self):
+        values = np.array([-np.inf, -2.5, -0.0, 0.0, 1e-300, 3.0, np.inf])
+        keys = DiffPrivSelection.keys(values)
+        self.assertTrue(np.all(np.diff(keys.astype(object)) > 0))
+        np.testing.assert_array_equal(DiffPrivSelection.values(keys), values)
+
+    def test_select(self):
+        data = np.random.default_rng(31337).normal(0.0, 1.0, size=10001)
+        report = {}
+        values = DiffPrivSelection.select(
+            self.chunks(data, 1000), [5000], buckets=32, memory=160, report=report
+        )
+        np.testing.assert_array_equal(values, [np.median(data)])
+        self.assertEqual(set(report), {"passes", "memory"})
+        self.assertGreater(report["passes"], 2)
+        self.assertLessEqual(report["memory"], 256)
+
+    def test_select_adjacent_ranks(self):
+        data = np.random.default_rng(31337).integers(0, 5, size=1000) * 1.5
+        values = DiffPrivSelection.select(
+            self.chunks(data, 64), [499, 500], buckets=4, memory=8
+        )
+        np.testing.assert_array_equal(values, np.sort(data)[[499, 500]])
+
+    def test_select_constant(self):
+        data = np.full(100, -3.0)
+        report = {}
+        values = DiffPrivSelection.select(self.chunks(data, 7), [49, 50], report=report)
+        np.testing.assert_array_equal(values, [-3.0, -3.0])
+        self.assertEqual(report["passes"], 1)
+
+    def test_select_empty(self):
+        data = np.array([])
+        with self.assertRaises(DiffPrivInvalidDimensions):
+            DiffPrivSelection.select(self.chunks(data, 7), [0])
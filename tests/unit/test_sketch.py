@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+from diffpriv_laplace.sketch import DiffPrivQuantileSketch
+
+
+class TestDiffPrivQuantileSketch(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def assert_rank_error(self, sketch, data, q):
+        values = sketch.quantile(q)
+        ranks = np.searchsorted(np.sort(np.ravel(data)), values) / np.size(data)
+        self.assertTrue(np.all(np.abs(ranks - q) <= sketch.error))
+
+    def test_calculate_k(self):
+        self.assertEqual(DiffPrivQuantileSketch.calculate_k(1.0), 8)
+        self.assertGreater(
+            DiffPrivQuantileSketch.calculate_k(0.001),
+            DiffPrivQuantileSketch.calculate_k(0.01),
+        )
+
+    def test_empty(self):
+        sketch = DiffPrivQuantileSketch()
+        self.assertEqual(sketch.n, 0)
+        self.assertEqual(sketch.size, 0)
+        self.assertIsNone(sketch.min)
+        self.assertIsNone(sketch.max)
+
+    def test_quantile_exact(self):
+        data = [5.0, 1.0, 3.0, 2.0, 4.0]
+        sketch = DiffPrivQuantileSketch.from_chunks([data])
+        self.assertEqual(sketch.quantile(0.5), 3.0)
+        np.testing.assert_equal(sketch.quantile([0.0, 1.0]), [1.0, 5.0])
+
+    def test_quantile(self):
+        data = np.random.default_rng(31337).normal(10.0, 3.0, size=200000)
+        chunks = (data[start : start + 7000] for start in range(0, data.size, 7000))
+        sketch = DiffPrivQuantileSketch.from_chunks(chunks, error=0.01, seed=1)
+        q = np.array([0.01, 0.1, 0.5, 0.9, 0.99])
+        self.assertEqual(sketch.n, data.size)
+        self.assertLess(sketch.size, 4 * sketch.k)
+        self.assertEqual(sketch.min, np.min(data))
+        self.assertEqual(sketch.max, np.max(data))
+        self.assert_rank_error(sketch, data, q)
+
+    def test_merge(self):
+        data = np.random.default_rng(31337).uniform(0.0, 1.0, size=(4, 50000))
+        sketch = DiffPrivQuantileSketch(error=0.005, seed=1)
+        for index, values in enumerate(data):
+            worker_sketch = DiffPrivQuantileSketch.from_chunks(
+                [values], error=0.005, seed=index
+            )
+            sketch.merge(worker_sketch)
+
+        sketch.merge(DiffPrivQuantileSketch())
+        self.assertEqual(sketch.n, data.size)
+        self.assert_rank_error(sketch, data, np.array([0.25, 0.5, 0.75]))
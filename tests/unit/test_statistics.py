@@ -1,8 +1,18 @@
+import os
+import tempfile
 import unittest
+import mock
 import numpy as np
 from itertools import combinations
 from functools import reduce
-from diffpriv_laplace import DiffPrivStatistics, DiffPrivStatisticKind
+from diffpriv_laplace import (
+    DiffPrivLaplaceMechanism,
+    DiffPrivStatistics,
+    DiffPrivStatisticKind,
+)
+from diffpriv_laplace.aggregate import DiffPrivAggregate
+from diffpriv_laplace.predicate import DiffPrivPredicate
+from diffpriv_laplace.storage import DiffPrivStorage
 from diffpriv_laplace.exceptions import (
     DiffPrivInvalidDimensions,
     DiffPrivSizeMismatch,
@@ -29,10 +39,10 @@ class TestDiffPrivStatisticsKind(unittest.TestCase):
                 self.assertEqual(values.size, r)
 
     def test_size_all(self):
-        self.assertEqual(DiffPrivStatisticKind.all.size, len(DiffPrivStatisticKind) - 1)
+        size = len(DiffPrivStatisticKind.__members__) - 1
+        self.assertEqual(DiffPrivStatisticKind.all.size, size)
         self.assertEqual(
-            (DiffPrivStatisticKind.all | DiffPrivStatisticKind.all).size,
-            len(DiffPrivStatisticKind) - 1,
+            (DiffPrivStatisticKind.all | DiffPrivStatisticKind.all).size, size
         )
 
 
@@ -87,6 +97,19 @@ class TestDiffPrivStatistics(unittest.TestCase):
         )
         np.testing.assert_almost_equal(value, expected_values, self.decimal_places)
 
+    def test_count_discrete(self):
+        data = np.array([[True, False, True, True] * 10] * 3)
+        expected_values = np.count_nonzero(data, axis=1)
+        value = DiffPrivStatistics.count(data, self.epsilon, axis=1, discrete=True)
+        self.assertEqual(value.dtype, np.int64)
+        np.testing.assert_equal(value, expected_values)
+
+    def test_count_discrete_postprocess(self):
+        data = np.array([False] * 10)
+        value = DiffPrivStatistics.count(data, 0.01, discrete=True)
+        self.assertGreaterEqual(value, 0)
+        self.assertLessEqual(value, np.size(data))
+
     def test_count_postprocess(self):
         pass
 
@@ -193,6 +216,16 @@ class TestDiffPrivStatistics(unittest.TestCase):
         value = DiffPrivStatistics.sum(data, self.epsilon, axis=1)
         np.testing.assert_almost_equal(value, expected_values, self.decimal_places)
 
+    def test_sum_multiple_bounds(self):
+        data = np.array([list(range(0, 20)), list(range(-50, -30)), [1000.0] * 20])
+        epsilon = 1.0
+        expected_scales = [19.0, 50.0, 1000.0]
+        self.set_seed()
+        value = DiffPrivStatistics.sum(data, epsilon, axis=1)
+        self.set_seed()
+        expected_values = np.random.laplace(np.sum(data, axis=1), expected_scales)
+        np.testing.assert_almost_equal(value, expected_values)
+
     def test_mean_single(self):
         data = np.array(list(range(0, 20)) + [100.0])
         expected_value = np.mean(data)
@@ -221,12 +254,47 @@ class TestDiffPrivStatistics(unittest.TestCase):
         value = DiffPrivStatistics.variance(data, self.epsilon, axis=1)
         np.testing.assert_almost_equal(value, expected_values, self.decimal_places)
 
+    def test_float32(self):
+        data = np.array([list(range(0, 20)) + [100.0]] * 3)
+        expected_values = np.mean(data, axis=1)
+        kinds = [
+            DiffPrivStatistics.count,
+            DiffPrivStatistics.min,
+            DiffPrivStatistics.max,
+            DiffPrivStatistics.median,
+            DiffPrivStatistics.proportion,
+            DiffPrivStatistics.sum,
+            DiffPrivStatistics.mean,
+            DiffPrivStatistics.variance,
+        ]
+        for kind in kinds:
+            value = kind(data, self.epsilon, dtype=np.float32)
+            self.assertEqual(np.asarray(value).dtype, np.float32)
+            values = kind(data, self.epsilon, axis=1, dtype=np.float32)
+            self.assertEqual(values.dtype, np.float32)
+
+        self.set_seed()
+        values = DiffPrivStatistics.mean(data, self.epsilon, axis=1, dtype=np.float32)
+        np.testing.assert_almost_equal(values, expected_values, self.decimal_places)
+
     def test_apply_kind_on_data_slice_invalid_dimension_error(self):
         data = np.array([[list(range(0, 20)) + [100.0]]])
         kinds = DiffPrivStatisticKind.all
         self.set_seed()
         with self.assertRaises(DiffPrivInvalidDimensions):
-            DiffPrivStatistics.apply_kind_on_data_slice(data, kinds, self.epsilon)
+            DiffPrivStatistics.apply_kind_on_data_slice(
+                np.float64(1.0), kinds, self.epsilon
+            )
+
+        with self.assertRaises(DiffPrivInvalidDimensions):
+            DiffPrivStatistics.apply_kind_on_data_slice(
+                data, kinds, self.epsilon, axis=3
+            )
+
+        with self.assertRaises(DiffPrivInvalidDimensions):
+            DiffPrivStatistics.apply_kind_on_data_slice(
+                data, kinds, self.epsilon, axis=()
+            )
 
     def test_apply_kind_on_data_slice_size_mismatch_error(self):
         data = np.array(list(range(0, 20)) + [100.0])
@@ -410,3 +478,550 @@ class TestDiffPrivStatistics(unittest.TestCase):
                 value = result[key]
                 expected_value = expected_result[key]
                 self.assertAlmostEqual(value, expected_value, self.decimal_places)
+
+    def test_calculate_size(self):
+        data = np.zeros((4, 5, 6))
+        self.assertEqual(DiffPrivStatistics.calculate_size(data), 120)
+        self.assertEqual(DiffPrivStatistics.calculate_size(data, axis=1), 5)
+        self.assertEqual(DiffPrivStatistics.calculate_size(data, axis=(0, 2)), 24)
+        self.assertEqual(DiffPrivStatistics.calculate_size([1, 2, 3], axis=(0,)), 3)
+
+    def test_calculate_aggregate_statistics(self):
+        data = np.array(list(range(0, 20)) + [100.0])
+        kinds = DiffPrivStatisticKind.all
+        expected_result = self.calculate_stats(data)
+        del expected_result[DiffPrivStatisticKind.median]
+        aggregate = DiffPrivAggregate.from_data(data)
+        self.set_seed()
+        result = DiffPrivStatistics.calculate_aggregate_statistics(
+            aggregate, kinds, self.epsilon
+        )
+        self.assertEqual(len(result), len(expected_result))
+        for key, expected_value in expected_result.items():
+            self.assertAlmostEqual(result[key], expected_value, self.decimal_places)
+
+    def test_calculate_data_slice_statistics_fused(self):
+        data = np.array([list(range(0, 20)) + [100.0]])
+        kinds = DiffPrivStatisticKind.all
+        expected_result = self.calculate_stats(data)
+        self.set_seed()
+        with mock.patch.object(
+            DiffPrivAggregate, "from_data", wraps=DiffPrivAggregate.from_data
+        ) as from_data:
+            result = DiffPrivStatistics.calculate_data_slice_statistics(
+                data, kinds, self.epsilon
+            )
+
+        from_data.assert_called_once()
+        self.assertEqual(len(result), len(expected_result))
+        for key, expected_value in expected_result.items():
+            self.assertAlmostEqual(result[key], expected_value, self.decimal_places)
+
+    def test_calculate_data_slice_statistics_single_kind(self):
+        data = np.array([list(range(0, 20)) + [100.0]])
+        kinds = DiffPrivStatisticKind.median | DiffPrivStatisticKind.sum
+        self.set_seed()
+        with mock.patch.object(DiffPrivAggregate, "from_data") as from_data:
+            result = DiffPrivStatistics.calculate_data_slice_statistics(
+                data, kinds, self.epsilon
+            )
+
+        from_data.assert_not_called()
+        self.assertEqual(len(result), 2)
+        self.assertAlmostEqual(
+            result[DiffPrivStatisticKind.sum], np.sum(data), self.decimal_places
+        )
+
+    def test_apply_kind_on_data_slice_grouped(self):
+        data = np.array([list(range(0, 20)) + [100.0]] * 4) * [
+            [1.0],
+            [2.0],
+            [3.0],
+            [4.0],
+        ]
+        kinds = [
+            DiffPrivStatisticKind.count | DiffPrivStatisticKind.sum,
+            None,
+            DiffPrivStatisticKind.sum,
+            DiffPrivStatisticKind.median,
+        ]
+        self.set_seed()
+        with mock.patch.object(
+            DiffPrivLaplaceMechanism,
+            "anonymize_sum_with_budget",
+            wraps=DiffPrivLaplaceMechanism.anonymize_sum_with_budget,
+        ) as anonymize_sum_with_budget:
+            results = DiffPrivStatistics.apply_kind_on_data_slice(
+                data, kinds, self.epsilon, axis=1
+            )
+
+        anonymize_sum_with_budget.assert_called_once()
+        self.assertEqual(len(results), len(kinds))
+        self.assertIsNone(results[1])
+        for index, kind in enumerate(kinds):
+            if not kind:
+                continue
+
+            expected_result = self.calculate_stats(data[index])
+            self.assertEqual(
+                set(results[index]), {key for key in expected_result if key & kind}
+            )
+            for key, value in results[index].items():
+                self.assertAlmostEqual(value, expected_result[key], self.decimal_places)
+
+    def test_apply_kind_on_data_slice_n_dimensional(self):
+        data = np.sqrt(np.arange(0.0, 120.0)).reshape((2, 3, 4, 5))
+        for axis in [1, (1, 3), (-1, 0, 2), (0, 1, 2, 3)]:
+            iter_axis = tuple(
+                index
+                for index in range(data.ndim)
+                if index not in np.atleast_1d(axis) % data.ndim
+            )
+            shape = tuple(data.shape[index] for index in iter_axis)
+            n = int(np.prod(shape))
+            kinds = [
+                [DiffPrivStatisticKind.all, None, DiffPrivStatisticKind.mean][index % 3]
+                for index in range(n)
+            ]
+            data_slices = np.moveaxis(data, iter_axis, range(len(iter_axis)))
+            self.set_seed()
+            results = DiffPrivStatistics.apply_kind_on_data_slice(
+                data, kinds, self.epsilon, axis=axis
+            )
+            self.assertEqual(len(results), n)
+            for index, kind in enumerate(kinds):
+                if not kind:
+                    self.assertIsNone(results[index])
+                    continue
+
+                data_slice = data_slices[np.unravel_index(index, shape)]
+                expected_result = self.calculate_stats(data_slice)
+                self.assertEqual(
+                    set(results[index]), {key for key in expected_result if key & kind}
+                )
+                for key, value in results[index].items():
+                    self.assertAlmostEqual(
+                        value, expected_result[key], self.decimal_places
+                    )
+
+    def test_calculate_stream_statistics(self):
+        data = np.array(list(range(0, 20)) + [100.0])
+        chunks = iter([data[:7], data[7:8], [], data[8:]])
+        kinds = DiffPrivStatisticKind.all & ~DiffPrivStatisticKind.median
+        expected_result = self.calculate_stats(data)
+        del expected_result[DiffPrivStatisticKind.median]
+        self.set_seed()
+        result = DiffPrivStatistics.calculate_stream_statistics(
+            chunks, kinds, self.epsilon, chunk_size=4
+        )
+        self.assertEqual(len(result), len(expected_result))
+        for key, expected_value in expected_result.items():
+            self.assertAlmostEqual(result[key], expected_value, self.decimal_places)
+
+    def test_calculate_stream_statistics_median(self):
+        data = np.random.default_rng(31337).normal(0.0, 1.0, size=100000)
+        chunks = (data[start : start + 3000] for start in range(0, data.size, 3000))
+        kinds = DiffPrivStatisticKind.median | DiffPrivStatisticKind.mean
+        timings = {}
+        self.set_seed()
+        result = DiffPrivStatistics.calculate_stream_statistics(
+            chunks, kinds, self.epsilon, error=0.01, timings=timings
+        )
+        self.assertEqual(set(timings), {"aggregate", "sketch", "noise"})
+        self.assertAlmostEqual(
+            result[DiffPrivStatisticKind.mean], np.mean(data), self.decimal_places
+        )
+        rank = np.mean(data < result[DiffPrivStatisticKind.median])
+        self.assertAlmostEqual(rank, 0.5, delta=0.01)
+
+    def test_quantile(self):
+        data = np.array(list(range(0, 1000)))
+        timings = {}
+        self.set_seed()
+        values = DiffPrivStatistics.quantile(
+            data, [0.1, 0.5, 0.9], self.epsilon, error=0.01, timings=timings
+        )
+        self.assertEqual(set(timings), {"sketch", "noise"})
+        np.testing.assert_allclose(values, [100.0, 500.0, 900.0], atol=10.0)
+
+    def test_quantile_mapped(self):
+        data = np.random.default_rng(31337).uniform(0.0, 1.0, size=(100, 100))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.npy")
+            np.save(path, data)
+            self.set_seed()
+            with mock.patch.object(DiffPrivStorage, "chunk_bytes", 4096):
+                value = DiffPrivStatistics.quantile(path, 0.5, self.epsilon)
+
+        self.assertAlmostEqual(np.mean(data < value), 0.5, delta=0.01)
+
+    def test_count_predicate(self):
+        data = np.arange(0.0, 1000.0)
+        expected_value = np.count_nonzero((data >= 100.0) & (data <= 199.0))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.npy")
+            np.save(path, data)
+            for value in [data, path]:
+                self.set_seed()
+                count = DiffPrivStatistics.count(
+                    value, self.epsilon, condition="x between 100 and 199"
+                )
+                self.assertAlmostEqual(count, expected_value, self.decimal_places)
+                self.set_seed()
+                proportion = DiffPrivStatistics.proportion(
+                    value, self.epsilon, condition="x between 100 and 199"
+                )
+                self.assertAlmostEqual(proportion, 0.1, self.decimal_places)
+
+    def test_weighted_count(self):
+        data = np.array([[0.0, 1.0, 2.0], [3.0, 0.0, 5.0]])
+        weights = np.array([[10, 20, 30], [40, 50, 60]])
+        expanded = np.repeat(data.ravel(), weights.ravel())
+        self.set_seed()
+        value = DiffPrivStatistics.weighted_count(data, weights, self.epsilon)
+        self.assertAlmostEqual(value, np.count_nonzero(expanded), self.decimal_places)
+        self.set_seed()
+        value = DiffPrivStatistics.weighted_count(
+            data, weights, self.epsilon, condition="x >= 2"
+        )
+        self.assertAlmostEqual(value, np.sum(expanded >= 2), self.decimal_places)
+        self.set_seed()
+        with mock.patch.object(DiffPrivPredicate, "chunk_size", 1), mock.patch.object(
+            DiffPrivPredicate, "__call__", side_effect=AssertionError
+        ):
+            values = DiffPrivStatistics.weighted_count(
+                data, weights, self.epsilon, condition="x >= 2", axis=1
+            )
+
+        np.testing.assert_almost_equal(values, [30.0, 100.0])
+        self.set_seed()
+        values = DiffPrivStatistics.weighted_count(data, weights, self.epsilon, axis=0)
+        np.testing.assert_almost_equal(values, [40.0, 20.0, 90.0])
+
+    def test_weighted_sum(self):
+        data = np.array([[0.0, 1.0, 2.0], [3.0, -1.0, 5.0]])
+        weights = np.array([[10, 20, 30], [40, 50, 60]])
+        expanded = np.repeat(data.ravel(), weights.ravel())
+        self.set_seed()
+        value = DiffPrivStatistics.weighted_sum(data, weights, self.epsilon)
+        self.assertAlmostEqual(value, np.sum(expanded), self.decimal_places)
+        self.set_seed()
+        values = DiffPrivStatistics.weighted_sum(data, weights, self.epsilon, axis=1)
+        np.testing.assert_almost_equal(
+            values, np.sum(data * weights, axis=1), self.decimal_places
+        )
+
+    def test_weighted_size_mismatch(self):
+        with self.assertRaises(DiffPrivSizeMismatch):
+            DiffPrivStatistics.weighted_sum([1.0, 2.0], [1], self.epsilon)
+
+    def test_declared_bounds(self):
+        data = np.array([list(range(0, 20)) + [100.0]] * 3) * [[1.0], [2.0], [3.0]]
+        statistics = [
+            (DiffPrivStatistics.sum, np.sum),
+            (DiffPrivStatistics.mean, np.mean),
+            (DiffPrivStatistics.variance, np.var),
+        ]
+        bounds = [
+            (None, 0.0, 30.0, 0.0, 30.0),
+            (
+                1,
+                [0.0, 5.0, 10.0],
+                [20.0, 40.0, 60.0],
+                [[0.0], [5.0], [10.0]],
+                [[20.0], [40.0], [60.0]],
+            ),
+            (0, 5.0, np.arange(21.0) + 10.0, 5.0, np.arange(21.0) + 10.0),
+        ]
+        with mock.patch.object(DiffPrivAggregate, "chunk_size", 8):
+            for statistic, expected_statistic in statistics:
+                for axis, lower, upper, data_lower, data_upper in bounds:
+                    expected_values = expected_statistic(
+                        np.clip(data, data_lower, data_upper), axis=axis
+                    )
+                    self.set_seed()
+                    values = statistic(
+                        data, self.epsilon, axis=axis, lower=lower, upper=upper
+                    )
+                    np.testing.assert_almost_equal(
+                        values, expected_values, self.decimal_places
+                    )
+
+    def test_declared_bounds_single(self):
+        data = np.array([-10.0, 1.0, 2.0, 3.0, 50.0])
+        self.set_seed()
+        value = DiffPrivStatistics.sum(data, self.epsilon, upper=10.0)
+        self.assertAlmostEqual(value, 6.0, self.decimal_places)
+
+    def test_median_mapped_exact(self):
+        data = np.random.default_rng(31337).normal(0.0, 1.0, size=(200, 50))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.npy")
+            np.save(path, data)
+            report = {}
+            with mock.patch.object(DiffPrivStorage, "chunk_bytes", 4096):
+                value = DiffPrivStatistics.calculate_median(
+                    DiffPrivStorage.load(path), buckets=16, memory=800, report=report
+                )
+                self.set_seed()
+                values = DiffPrivStatistics.median(
+                    path, self.epsilon, axis=0, buckets=16, memory=800
+                )
+
+        self.assertEqual(value, np.median(data))
+        self.assertGreater(report["passes"], 2)
+        self.assertLessEqual(report["memory"], 800)
+        self.set_seed()
+        expected_values = DiffPrivStatistics.median(data, self.epsilon, axis=0)
+        np.testing.assert_almost_equal(values, expected_values, self.decimal_places)
+
+    def test_median_mapped_exact_n_dimensional(self):
+        data = np.random.default_rng(31337).normal(0.0, 1.0, size=(20, 5, 10))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.npy")
+            np.save(path, data)
+            mapped = DiffPrivStorage.load(path)
+            with mock.patch.object(DiffPrivStorage, "chunk_bytes", 256):
+                for axis in [1, (0, 2), (0, 1, 2)]:
+                    value = DiffPrivStatistics.calculate_median(
+                        mapped, axis=axis, buckets=16, memory=64
+                    )
+                    np.testing.assert_equal(value, np.median(data, axis=axis))
+
+    def test_mapped(self):
+        data = np.array([list(range(0, 20)) + [100.0]] * 3) * [[1.0], [2.0], [3.0]]
+        kinds = [
+            DiffPrivStatistics.count,
+            DiffPrivStatistics.min,
+            DiffPrivStatistics.max,
+            DiffPrivStatistics.median,
+            DiffPrivStatistics.proportion,
+            DiffPrivStatistics.sum,
+            DiffPrivStatistics.mean,
+            DiffPrivStatistics.variance,
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.npy")
+            np.save(path, data)
+            mapped = DiffPrivStorage.load(path)
+            with mock.patch.object(DiffPrivStorage, "chunk_bytes", 64):
+                for kind in kinds:
+                    for axis in [None, 0, 1]:
+                        self.set_seed()
+                        expected_values = kind(data, self.epsilon, axis=axis)
+                        self.set_seed()
+                        values = kind(path, self.epsilon, axis=axis)
+                        np.testing.assert_almost_equal(
+                            values, expected_values, self.decimal_places
+                        )
+
+                self.set_seed()
+                values = DiffPrivStatistics.count(
+                    mapped, self.epsilon, condition=lambda chunk: chunk > 30.0, axis=0
+                )
+                np.testing.assert_almost_equal(values, np.sum(data > 30.0, axis=0))
+
+    def test_apply_kind_on_data_slice_mapped(self):
+        data = np.array([list(range(0, 20)) + [100.0]] * 3) * [[1.0], [2.0], [3.0]]
+        kinds = [DiffPrivStatisticKind.all, None, DiffPrivStatisticKind.sum]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.npy")
+            np.save(path, data)
+            for axis, slices in [(1, data), (0, np.transpose(data))]:
+                if axis == 0:
+                    np.save(path, np.transpose(data))
+
+                self.set_seed()
+                with mock.patch.object(DiffPrivStorage, "chunk_bytes", 64):
+                    results = DiffPrivStatistics.apply_kind_on_data_slice(
+                        path, kinds, self.epsilon, axis=axis
+                    )
+
+                self.assertIsNone(results[1])
+                self.assertEqual(list(results[2]), [DiffPrivStatisticKind.sum])
+                for index in [0, 2]:
+                    expected_result = self.calculate_stats(data[index])
+                    for key, value in results[index].items():
+                        self.assertAlmostEqual(
+                            value, expected_result[key], self.decimal_places
+                        )
+
+    def test_apply_kind_on_data_slice_mapped_single(self):
+        data = np.array(list(range(0, 20)) + [100.0])
+        expected_result = self.calculate_stats(data)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.bin")
+            data.tofile(path)
+            self.set_seed()
+            results = DiffPrivStatistics.apply_kind_on_data_slice(
+                path, DiffPrivStatisticKind.all, self.epsilon
+            )
+
+        self.assertEqual(len(results[0]), len(expected_result))
+        for key, value in results[0].items():
+            self.assertAlmostEqual(value, expected_result[key], self.decimal_places)
+
+    def test_apply_kind_on_data_slice_mapped_n_dimensional(self):
+        data = np.sqrt(np.arange(0.0, 120.0)).reshape((2, 3, 4, 5))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data.npy")
+            np.save(path, data)
+            for axis, iter_axis in [((1, 3), (0, 2)), ((0, 2), (1, 3))]:
+                shape = tuple(data.shape[index] for index in iter_axis)
+                kinds = [DiffPrivStatisticKind.all] * int(np.prod(shape))
+                data_slices = np.moveaxis(data, iter_axis, (0, 1))
+                self.set_seed()
+                with mock.patch.object(DiffPrivStorage, "chunk_bytes", 64):
+                    results = DiffPrivStatistics.apply_kind_on_data_slice(
+                        path, kinds, self.epsilon, axis=axis
+                    )
+
+                for index, result in enumerate(results):
+                    data_slice = data_slices[np.unravel_index(index, shape)]
+                    expected_result = self.calculate_stats(data_slice)
+                    self.assertEqual(len(result), len(expected_result))
+                    for key, value in result.items():
+                        self.assertAlmostEqual(
+                            value, expected_result[key], self.decimal_places
+                        )
+
+    def test_groupby(self):
+        values = np.random.default_rng(31337).normal(0.0, 1.0, size=1000)
+        keys = np.random.default_rng(31337).integers(0, 10, size=1000) * 3
+        self.set_seed()
+        groups, stats = DiffPrivStatistics.groupby(
+            values, keys, DiffPrivStatisticKind.all, self.epsilon
+        )
+        np.testing.assert_array_equal(groups, np.unique(keys))
+        for index, group in enumerate(groups):
+            expected_result = self.calculate_stats(values[keys == group])
+            self.assertEqual(len(stats), len(expected_result))
+            for key, value in stats.items():
+                self.assertAlmostEqual(
+                    value[index], expected_result[key], self.decimal_places
+                )
+
+    def test_groupby_bounds(self):
+        values = np.array([-5.0, 0.5, 1.0, 2.0, 0.0, 10.0])
+        keys = np.array(["b", "a", "b", "a", "a", "b"])
+        kind = DiffPrivStatisticKind.count | DiffPrivStatisticKind.sum
+        self.set_seed()
+        groups, stats = DiffPrivStatistics.groupby(
+            values, keys, kind, self.epsilon, bounds=(0.0, 2.0)
+        )
+        np.testing.assert_array_equal(groups, ["a", "b"])
+        self.assertEqual(
+            set(stats), {DiffPrivStatisticKind.count, DiffPrivStatisticKind.sum}
+        )
+        np.testing.assert_array_equal(stats[DiffPrivStatisticKind.count], [2.0, 2.0])
+        np.testing.assert_almost_equal(
+            stats[DiffPrivStatisticKind.sum], [2.5, 3.0], self.decimal_places
+        )
+
+    def test_groupby_narrow_keys(self):
+        keys = (np.arange(300) % 256 - 128).astype(np.int8)
+        self.set_seed()
+        groups, stats = DiffPrivStatistics.groupby(
+            np.ones(300), keys, DiffPrivStatisticKind.count, self.epsilon
+        )
+        np.testing.assert_array_equal(groups, np.arange(-128, 128))
+        np.testing.assert_array_equal(
+            stats[DiffPrivStatisticKind.count], np.bincount(keys.astype(int) + 128)
+        )
+
+    def test_groupby_float32(self):
+        keys = np.arange(30) % 3
+        kind = DiffPrivStatisticKind.count | DiffPrivStatisticKind.proportion
+        self.set_seed()
+        _, stats = DiffPrivStatistics.groupby(
+            np.ones(30), keys, kind, self.epsilon, dtype=np.float32
+        )
+        for value in stats.values():
+            self.assertEqual(value.dtype, np.float32)
+
+        np.testing.assert_array_equal(stats[DiffPrivStatisticKind.count], [10.0] * 3)
+
+    def test_groupby_size_mismatch(self):
+        with self.assertRaises(DiffPrivSizeMismatch):
+            DiffPrivStatistics.groupby(
+                [1.0, 2.0], [1], DiffPrivStatisticKind.count, self.epsilon
+            )
+
+    def test_factorize_keys(self):
+        for keys in [np.array([7, 5, 7, 9, 5]), np.array([7, 5, 7, 10**9, 5])]:
+            groups, codes = DiffPrivStatistics.factorize_keys(keys)
+            np.testing.assert_array_equal(groups, np.unique(keys))
+            np.testing.assert_array_equal(groups[codes], keys)
+
+    def test_factorize_keys_narrow(self):
+        for keys in [
+            (np.arange(300) % 256 - 128).astype(np.int8),
+            (np.arange(300) % 256).astype(np.uint8),
+            np.arange(2**64 - 300, 2**64 - 1, dtype=np.uint64),
+        ]:
+            groups, codes = DiffPrivStatistics.factorize_keys(keys)
+            self.assertEqual(groups.dtype, keys.dtype)
+            np.testing.assert_array_equal(groups, np.unique(keys))
+            np.testing.assert_array_equal(groups[codes], keys)
+
+    def test_rng(self):
+        data = np.arange(0.0, 100.0)
+        statistics = [
+            (DiffPrivStatistics.count, {"postprocess": False}),
+            (DiffPrivStatistics.min, {}),
+            (DiffPrivStatistics.max, {}),
+            (DiffPrivStatistics.median, {}),
+            (DiffPrivStatistics.proportion, {"postprocess": False}),
+            (DiffPrivStatistics.sum, {}),
+            (DiffPrivStatistics.mean, {}),
+            (DiffPrivStatistics.variance, {}),
+        ]
+        self.set_seed()
+        state = np.random.get_state()
+        for statistic, kwargs in statistics:
+            values = [statistic(data, 1.0, rng=31337, **kwargs) for _ in range(2)]
+            self.assertEqual(values[0], values[1])
+            rng = np.random.default_rng(31337)
+            values = [statistic(data, 1.0, rng=rng, **kwargs) for _ in range(2)]
+            self.assertNotEqual(values[0], values[1])
+
+        np.testing.assert_equal(np.random.get_state(), state)
+
+    def test_apply_kind_on_data_slice_rng(self):
+        data = np.arange(0.0, 20.0).reshape((10, 2))
+        kinds = [DiffPrivStatisticKind.all] * 2
+        self.set_seed()
+        state = np.random.get_state()
+        results = [
+            DiffPrivStatistics.apply_kind_on_data_slice(data, kinds, 1.0, rng=31337)
+            for _ in range(2)
+        ]
+        np.testing.assert_equal(results[0], results[1])
+        np.testing.assert_equal(np.random.get_state(), state)
+
+    def test_data_derived_bounds_not_cached(self):
+        data = np.arange(0.0, 100.0)
+        cache = DiffPrivLaplaceMechanism.anonymizer_cache
+        cache.clear()
+        for statistic in [
+            DiffPrivStatistics.proportion,
+            DiffPrivStatistics.sum,
+            DiffPrivStatistics.mean,
+            DiffPrivStatistics.variance,
+        ]:
+            statistic(data, self.epsilon)
+
+        DiffPrivStatistics.calculate_data_slice_statistics(
+            data,
+            DiffPrivStatisticKind.proportion
+            | DiffPrivStatisticKind.sum
+            | DiffPrivStatisticKind.mean
+            | DiffPrivStatisticKind.variance,
+            self.epsilon,
+        )
+        self.assertEqual(len(cache), 0)
+        for _ in range(2):
+            DiffPrivStatistics.sum(data, self.epsilon, lower=0.0, upper=100.0)
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.hits, 1)
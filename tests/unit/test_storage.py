@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from diffpriv_laplace.storage import DiffPrivStorage
+from diffpriv_laplace.exceptions import DiffPrivInvalidDimensions
+
+
+class TestDiffPrivStorage(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_npy(self):
+        data = np.arange(0, 12, dtype=np.float32).reshape((3, 4))
+        path = os.path.join(self.directory.name, "data.npy")
+        np.save(path, data)
+        mapped = DiffPrivStorage.load(path)
+        self.assertTrue(DiffPrivStorage.is_mapped(mapped))
+        np.testing.assert_equal(mapped, data)
+
+    def test_load_raw(self):
+        data = np.arange(0, 12, dtype=np.int32)
+        path = os.path.join(self.directory.name, "data.bin")
+        data.tofile(path)
+        mapped = DiffPrivStorage.load(path, dtype=np.int32, shape=(4, 3))
+        self.assertTrue(DiffPrivStorage.is_mapped(mapped))
+        np.testing.assert_equal(mapped, data.reshape((4, 3)))
+
+    def test_load_array(self):
+        data = np.arange(0, 12)
+        self.assertIs(DiffPrivStorage.load(data), data)
+        self.assertFalse(DiffPrivStorage.is_mapped(data))
+
+    def test_chunks(self):
+        data = np.arange(0, 1000, dtype=np.float64).reshape((250, 4))
+        path = os.path.join(self.directory.name, "data.npy")
+        np.save(path, data)
+        mapped = DiffPrivStorage.load(path)
+        chunks = list(DiffPrivStorage.chunks(mapped, chunk_bytes=320))
+        self.assertTrue(all(len(chunk) <= 10 for chunk in chunks))
+        self.assertFalse(any(DiffPrivStorage.is_mapped(chunk) for chunk in chunks))
+        np.testing.assert_equal(np.concatenate(chunks), data)
+
+    def test_data_slice_chunks(self):
+        data = np.arange(0, 60, dtype=np.float64).reshape((6, 10))
+        for iter_axis in [0, -1]:
+            parts = {0: [], 2: []}
+            for index, chunk in DiffPrivStorage.data_slice_chunks(
+                data, [0, 2], iter_axis, chunk_bytes=16
+            ):
+                parts[index].append(chunk)
+
+            for index, chunks in parts.items():
+                expected_value = np.take(data, index, axis=iter_axis)
+                np.testing.assert_equal(np.concatenate(chunks), expected_value)
+
+    def test_data_slice_chunks_n_dimensional(self):
+        data = np.arange(0, 120, dtype=np.float64).reshape((2, 3, 4, 5))
+        for iter_axis in [(0, 2), (1, 3), 3]:
+            axes = np.atleast_1d(iter_axis)
+            shape = tuple(data.shape[index] for index in axes)
+            data_slices = np.moveaxis(data, axes, range(axes.size))
+            parts = {1: [], 4: []}
+            for index, chunk in DiffPrivStorage.data_slice_chunks(
+                data, [1, 4], iter_axis, chunk_bytes=40
+            ):
+                parts[index].append(np.ravel(chunk))
+
+            for index, chunks in parts.items():
+                expected_value = np.ravel(data_slices[np.unravel_index(index, shape)])
+                np.testing.assert_equal(
+                    np.sort(np.concatenate(chunks)), np.sort(expected_value)
+                )
+
+    def test_data_slice_axes(self):
+        data = np.zeros((2, 3, 4))
+        self.assertEqual(DiffPrivStorage.data_slice_axes(data), ((1, 2), (0,)))
+        self.assertEqual(DiffPrivStorage.data_slice_axes(data, -1), ((0, 1), (2,)))
+        self.assertEqual(DiffPrivStorage.data_slice_axes(data, (2, 0)), ((1,), (0, 2)))
+        for data, axis in [(np.float64(1.0), None), (data, 3), (data, ())]:
+            with self.assertRaises(DiffPrivInvalidDimensions):
+                DiffPrivStorage.data_slice_axes(data, axis)